@@ -1,6 +1,71 @@
 from django.apps import apps
 from django.contrib import admin
 
+from apps.common.audit import AUDIT_FIELDS
+from apps.common.config import PAGINATION_COUNT_CONFIG
+from apps.common.pagination import COUNT_MODE_ESTIMATE, COUNT_MODE_EXACT, AppPaginator, get_cached_estimated_count
+
+# audit fks of the `BaseModel` | never joined on the changelist
+ADMIN_AUDIT_FIELDS = AUDIT_FIELDS
+
+# boolean flags of the `BaseModel` | used as the changelist filters
+ADMIN_FILTER_FIELDS = ["is_active", "is_deleted"]
+
+
+def get_admin_count(queryset):
+    """The count strategy for the admin. The planner estimate above the threshold, else exact."""
+
+    threshold = PAGINATION_COUNT_CONFIG["estimate_threshold"]
+    if threshold is None:
+        return queryset.count(), COUNT_MODE_EXACT
+
+    estimate = get_cached_estimated_count(queryset, timeout=PAGINATION_COUNT_CONFIG["cache_timeout"])
+    if estimate is not None and estimate >= threshold:
+        return estimate, COUNT_MODE_ESTIMATE
+
+    return queryset.count(), COUNT_MODE_EXACT
+
+
+class AppAdminPaginator(AppPaginator):
+    """Admin changelist paginator, uses the estimated count for the large tables."""
+
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        kwargs.setdefault("count_strategy", get_admin_count)
+        super().__init__(
+            object_list, per_page, orphans=orphans, allow_empty_first_page=allow_empty_first_page, **kwargs
+        )
+
+
+class AppModelAdmin(admin.ModelAdmin):
+    """
+    Base admin for the auto registered models. No full table count on the changelist
+    & estimated count for the large tables. See `get_model_admin` for the per model
+    config (raw id fks, select related & filters).
+    """
+
+    paginator = AppAdminPaginator
+    show_full_result_count = False
+
+
+def get_model_admin(model):
+    """
+    Generates the `AppModelAdmin` for the model. The fks are raw id inputs (no select
+    with the entire related table), the non audit fks are selected on the changelist.
+    """
+
+    field_names = [_.name for _ in model._meta.get_fields()]
+    foreign_keys = [_.name for _ in model._meta.fields if (_.many_to_one or _.one_to_one) and _.editable]
+
+    return type(
+        f"{model.__name__}Admin",
+        (AppModelAdmin,),
+        {
+            "raw_id_fields": foreign_keys,
+            "list_select_related": [_ for _ in foreign_keys if _ not in ADMIN_AUDIT_FIELDS] or False,
+            "list_filter": [_ for _ in ADMIN_FILTER_FIELDS if _ in field_names],
+        },
+    )
+
 
 def register_all_models():
     """Function used to register all the models used."""
@@ -8,7 +73,7 @@ def register_all_models():
     models = apps.get_models()
     for model in models:
         try:  # noqa
-            admin.site.register(model)
+            admin.site.register(model, get_model_admin(model))
         except admin.sites.AlreadyRegistered:
             pass
 
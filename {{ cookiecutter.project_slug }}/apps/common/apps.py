@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class CommonConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.common"
+
+    def ready(self):
+        from apps.common.authentication import register_token_signals
+        from apps.common.permissions import register_permission_signals
+
+        register_permission_signals()
+        register_token_signals()
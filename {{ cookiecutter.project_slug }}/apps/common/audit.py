@@ -0,0 +1,43 @@
+from django.core.exceptions import FieldDoesNotExist
+
+# audit fks of the `BaseModel`, set per action | see `get_audit_field_values`
+AUDIT_ACTION_FIELDS = {
+    "create": ["created_by", "updated_by"],
+    "update": ["updated_by"],
+    "delete": ["deleted_by"],
+}
+
+AUDIT_FIELDS = ["created_by", "updated_by", "deleted_by"]
+
+
+def get_audit_user(user):
+    """Returns the user for the audit fields. None, for the anonymous users."""
+
+    return user if user is not None and user.is_authenticated else None
+
+
+def get_audit_field_values(model, user, action) -> dict:
+    """
+    Returns the audit fields of the model for the action, set to the user. Empty, for
+    the anonymous users. The central hook for the serializers, the bulk writes and the
+    `BaseObjectManagerQuerySet.delete()`, so the values are set with the same write.
+
+        get_audit_field_values(Country, user, "create")
+        > {"created_by": user, "updated_by": user}
+    """
+
+    user = get_audit_user(user)
+    if user is None:
+        return {}
+
+    values = {}
+    for field_name in AUDIT_ACTION_FIELDS[action]:
+        try:
+            field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            continue
+
+        if field.concrete:
+            values[field_name] = user
+
+    return values
@@ -0,0 +1,144 @@
+import hashlib
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from apps.common.cache import TwoTierCache, bump_cache_version, get_cache_versions
+from apps.common.config import TOKEN_AUTH_CACHE_CONFIG
+
+# user fields never held in the cache | deferred on the snapshot, loaded on access
+TOKEN_AUTH_CACHE_EXCLUDED_FIELDS = ["password"]
+
+# near (per process) & shared cache of the tokens
+token_cache = TwoTierCache(
+    namespace="auth-token",
+    near_size=TOKEN_AUTH_CACHE_CONFIG["near_size"],
+    near_timeout=TOKEN_AUTH_CACHE_CONFIG["near_timeout"],
+)
+
+
+def get_token_cache_key(key):
+    """The cache key for the token. Hashed, the tokens are never stored as is in the keys."""
+
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def get_token_version_key(cache_key):
+    """The version of the token, bumped on the invalidation. See `authenticate_credentials_and_cache`."""
+
+    return f"auth-token:{cache_key}"
+
+
+def get_user_snapshot(user) -> dict:
+    """Returns the column values of the user, for the cache. See `TOKEN_AUTH_CACHE_EXCLUDED_FIELDS`."""
+
+    return {
+        _.attname: getattr(user, _.attname)
+        for _ in user._meta.concrete_fields
+        if _.name not in TOKEN_AUTH_CACHE_EXCLUDED_FIELDS
+    }
+
+
+def get_user_from_snapshot(snapshot, db):
+    """
+    Builds the user from the snapshot, like loaded with `only()`. So a `save()` on the
+    user updates just the loaded fields, the excluded ones are never overwritten.
+    """
+
+    return get_user_model().from_db(db, [*snapshot.keys()], [*snapshot.values()])
+
+
+def get_token_cache_stats() -> dict:
+    """Returns the hits & misses of the token cache, for this process."""
+
+    return token_cache.get_stats()
+
+
+class AppTokenAuthentication(TokenAuthentication):
+    """
+    Applications version of the `TokenAuthentication`. The `token -> user` is cached, in
+    the `TwoTierCache` (near & shared). So no `Token` & `User` query per call.
+
+    Invalidation:
+        > The token deletes & the user saves (password, deactivation...) clear the
+          shared cache & the near ones of all the workers, see `register_token_signals`.
+        > The near entries expire in `near_timeout` seconds, if a broadcast is lost.
+        > The token's version is read before the db load & again before the caching.
+          A load racing with an invalidation is not cached, see the `_and_cache`.
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = get_token_cache_key(key)
+
+        entry = token_cache.get(cache_key)
+        if entry is None:
+            return self.authenticate_credentials_and_cache(key, cache_key)
+
+        user = get_user_from_snapshot(entry["user"], db=entry["db"])
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+
+        return user, Token(key=key, user=user, created=entry["created"])
+
+    def authenticate_credentials_and_cache(self, key, cache_key):
+        """
+        The default lookup, the result is cached for the next calls. Not cached, if the
+        token is invalidated (user deactivated, logout...) while the user is loaded. The
+        user may have been loaded before the change was committed.
+        """
+
+        version_key = get_token_version_key(cache_key)
+        versions = get_cache_versions(version_key)
+
+        user, token = super().authenticate_credentials(key)
+
+        if get_cache_versions(version_key) == versions:
+            entry = {"user": get_user_snapshot(user), "db": user._state.db, "created": token.created}
+            token_cache.set(cache_key, entry, TOKEN_AUTH_CACHE_CONFIG["timeout"])
+
+        return user, token
+
+
+def invalidate_token_cache(*keys):
+    """Clears the given tokens from the cache, of all the workers. The loads in progress are not cached."""
+
+    cache_keys = [get_token_cache_key(_) for _ in keys]
+    for cache_key in cache_keys:
+        bump_cache_version(get_token_version_key(cache_key))
+
+    token_cache.delete(*cache_keys)
+
+
+def invalidate_token_cache_on_token_delete(sender, instance, **kwargs):
+    """Receiver for the `post_delete` of the `Token`, like on the logout."""
+
+    # taken now | the `key` is the pk, cleared by the `delete()`
+    key = instance.key
+    transaction.on_commit(lambda: invalidate_token_cache(key))
+
+
+def invalidate_token_cache_on_user_save(sender, instance, **kwargs):
+    """
+    Receiver for the `post_save` of the user. Cleared after the commit, so a concurrent
+    request does not read the user from before the change. One that has loaded it
+    already is not cached, by the version check of `authenticate_credentials_and_cache`.
+    """
+
+    def _invalidate():
+        keys = Token.objects.filter(user_id=instance.pk).values_list("key", flat=True)
+        if keys:
+            invalidate_token_cache(*keys)
+
+    transaction.on_commit(_invalidate)
+
+
+def register_token_signals():
+    """Connects the invalidation of the token cache, called on the app ready."""
+
+    post_delete.connect(invalidate_token_cache_on_token_delete, sender=Token)
+    post_save.connect(invalidate_token_cache_on_user_save, sender=get_user_model())
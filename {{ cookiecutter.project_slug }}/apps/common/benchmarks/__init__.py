@@ -0,0 +1,3 @@
+# flake8: noqa
+from .base import BENCHMARKS, register_benchmark, measure
+from . import hot_paths, identifiers, renderers, responses, serializers
@@ -0,0 +1,78 @@
+import statistics
+import time
+
+# registry of the benchmarks | name: callable(rows) -> results
+BENCHMARKS = {}
+
+
+def register_benchmark(name):
+    """
+    Decorator to register a benchmark with the given name. The benchmark is called
+    with the number of `rows` and returns the results as:
+        {"case": {"metric": value, ...}, ...}
+
+    Metrics ending with `_ms`/`_us` are timings (lower is better) and the ones ending
+    with `_per_second` are throughputs (higher is better).
+    """
+
+    def _decorator(func):
+        BENCHMARKS[name] = func
+        return func
+
+    return _decorator
+
+
+def measure(func, number=1, repeat=5):
+    """
+    Calls the `func` `number` times, `repeat` times over. Returns the best and the
+    mean timing of a single call in milliseconds.
+    """
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) * 1000 / number)
+
+    return {"best_ms": min(timings), "mean_ms": statistics.mean(timings)}
+
+
+def get_metric_direction(metric):
+    """Returns -1 for the timings (lower is better), 1 for the throughputs & None for the others."""
+
+    if metric.endswith(("_ms", "_us")):
+        return -1
+
+    if metric.endswith("_per_second"):
+        return 1
+
+    return None
+
+
+def compare_results(baseline, results, threshold):
+    """
+    Compares the `results` of a run against the `baseline` run, both as:
+        {"benchmark": {"case": {"metric": value, ...}, ...}, ...}
+
+    Returns a row per comparable metric as:
+        (benchmark, case, metric, baseline value, value, change %, passed)
+
+    The change is positive when the metric got better. A metric fails, when it got
+    worse by more than the `threshold` percent. Cases missing in the baseline are skipped.
+    """
+
+    report = []
+    for name, cases in results.items():
+        for case, metrics in cases.items():
+            for metric, value in metrics.items():
+                direction = get_metric_direction(metric)
+                previous = baseline.get(name, {}).get(case, {}).get(metric)
+
+                if direction is None or not isinstance(value, (int, float)) or not previous:
+                    continue
+
+                change = direction * (value - previous) * 100 / previous
+                report.append((name, case, metric, previous, value, change, change >= -threshold))
+
+    return report
@@ -0,0 +1,205 @@
+import time
+from contextlib import contextmanager
+
+from django.db import connection, transaction
+from rest_framework import permissions
+from rest_framework.test import APIRequestFactory
+
+from apps.access.models import User
+from apps.common.benchmarks.base import measure, register_benchmark
+from apps.common.managers import BaseObjectManagerQuerySet
+from apps.common.renderers import AppJSONRenderer
+from apps.common.serializers.base import (
+    AppReadOnlyModelSerializer,
+    AppWriteOnlyModelSerializer,
+    simple_serialize_instance,
+    simple_serialize_queryset,
+)
+from apps.common.views.base import AppViewMixin
+from apps.common.views.generic import AppModelListAPIViewSet
+
+BATCH_SIZE = 1000
+
+# calls per measure, for the benchmarks not depending on the table size
+ITERATIONS = 1000
+
+# fields of the `User` used across the benchmarks
+USER_FIELDS = ["id", "uuid", "email", "first_name", "last_name", "created", "is_active"]
+
+
+@contextmanager
+def seeded_users(rows):
+    """
+    Inserts `rows` users in a transaction, rolled back on exit. So the benchmarks can
+    be run on any database, nothing is left behind.
+    """
+
+    with transaction.atomic():
+        for offset in range(0, rows, BATCH_SIZE):
+            User.objects.bulk_create(
+                [
+                    User(
+                        email=f"benchmark-{index}@example.com",
+                        first_name=f"First {index % 100}",
+                        last_name=f"Last {index}",
+                        is_active=bool(index % 2),
+                    )
+                    for index in range(offset, min(offset + BATCH_SIZE, rows))
+                ]
+            )
+
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {User._meta.db_table}")
+
+        yield User.objects.filter(email__startswith="benchmark-")
+        transaction.set_rollback(True)
+
+
+def _to_us(metrics):
+    return {"best_us": metrics["best_ms"] * 1000, "mean_us": metrics["mean_ms"] * 1000}
+
+
+class _UserReadSerializer(AppReadOnlyModelSerializer):
+    class Meta(AppReadOnlyModelSerializer.Meta):
+        model = User
+        fields = USER_FIELDS
+
+
+class _UserWriteSerializer(AppWriteOnlyModelSerializer):
+    class Meta(AppWriteOnlyModelSerializer.Meta):
+        model = User
+        fields = ["email", "phone_number", "title", "first_name", "last_name", "is_active", "groups"]
+
+
+class _UserListAPIViewSet(AppModelListAPIViewSet):
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+    queryset = User.objects.all()
+    serializer_class = _UserReadSerializer
+    search_fields = ["email", "first_name", "last_name"]
+    ordering_fields = ["id", "email", "created"]
+
+
+@register_benchmark("send_response")
+def benchmark_send_response(rows):
+    """Per response cost (in micro seconds) of the `send_response`, built & rendered with a page of rows."""
+
+    page = [{"id": index, "identity": f"Row {index}", "is_active": True} for index in range(24)]
+    renderer = AppJSONRenderer()
+
+    def _build_and_render():
+        response = AppViewMixin.send_response(data=page)
+        return renderer.render(response.data, renderer_context={"response": response})
+
+    return {
+        "build": _to_us(measure(lambda: AppViewMixin.send_response(data=page), number=ITERATIONS)),
+        "build & render": _to_us(measure(_build_and_render, number=ITERATIONS)),
+    }
+
+
+@register_benchmark("list_view")
+def benchmark_list_view(rows):
+    """The `AppModelListAPIViewSet` list (dispatch & render) of `rows` users, with pagination, search & ordering."""
+
+    factory, view = APIRequestFactory(), _UserListAPIViewSet.as_view({"get": "list"})
+    last_page = max(rows // _UserListAPIViewSet.pagination_class.page_size, 1)
+
+    cases = {
+        "first page": {},
+        "last page": {"page": last_page},
+        "page size 100": {"page-size": 100},
+        "search": {"search": "First 42"},
+        "ordering": {"ordering": "-email"},
+        "search & ordering": {"search": "Last 9", "ordering": "-created"},
+    }
+
+    with seeded_users(rows):
+        return {case: measure(lambda: view(factory.get("/", params)).render()) for case, params in cases.items()}
+
+
+@register_benchmark("simple_serialize_queryset")
+def benchmark_simple_serialize_queryset(rows):
+    """The `simple_serialize_queryset` of `rows` users, with & without the `id` conversion."""
+
+    with seeded_users(rows) as queryset:
+        metrics = {
+            "with id": measure(lambda: simple_serialize_queryset(["id", "email"], queryset.all())),
+            "without id": measure(lambda: list(simple_serialize_queryset(["uuid", "email"], queryset.all()))),
+        }
+
+    for _ in metrics.values():
+        _["rows_per_second"] = rows / (_["best_ms"] / 1000)
+
+    return metrics
+
+
+@register_benchmark("simple_serialize_instance")
+def benchmark_simple_serialize_instance(rows):
+    """Per instance cost (in micro seconds) of the `simple_serialize_instance`, plain & dotted keys."""
+
+    user = User(id=1, email="benchmark@example.com", first_name="First", last_name="Last")
+
+    return {
+        "plain keys": _to_us(measure(lambda: simple_serialize_instance(user, USER_FIELDS), number=ITERATIONS)),
+        "dotted keys": _to_us(
+            measure(
+                lambda: simple_serialize_instance(user, ["id", "email", "__class__.__name__", "_meta.model_name"]),
+                number=ITERATIONS,
+            )
+        ),
+    }
+
+
+@register_benchmark("error_messages_construction")
+def benchmark_error_messages_construction(rows):
+    """Construction cost (in micro seconds, with the fields built) of the `CustomErrorMessagesMixin` serializers."""
+
+    return {
+        "read serializer": _to_us(measure(lambda: _UserReadSerializer().fields, number=ITERATIONS)),
+        "write serializer": _to_us(measure(lambda: _UserWriteSerializer(data={}).fields, number=ITERATIONS)),
+    }
+
+
+@register_benchmark("get_meta_for_update")
+def benchmark_get_meta_for_update(rows):
+    """
+    The `get_meta_for_update` of the write serializer, with the instance fetched
+    per call like the view's `get_object`. Run with `rows` users in the table.
+    """
+
+    with seeded_users(rows) as queryset:
+        pk = queryset.order_by("id").values_list("id", flat=True)[rows // 2]
+        return {
+            "user": measure(
+                lambda: _UserWriteSerializer(instance=User.objects.get(pk=pk)).get_meta_for_update(), number=100
+            )
+        }
+
+
+@register_benchmark("queryset_delete")
+def benchmark_queryset_delete(rows):
+    """The soft `BaseObjectManagerQuerySet.delete()` of all & the active half of `rows` users."""
+
+    results = {}
+
+    with seeded_users(rows):
+        # the `User` has the `UserManager` | the base queryset is used as on the `BaseModel`
+        queryset = BaseObjectManagerQuerySet(model=User).filter(email__startswith="benchmark-")
+
+        for case, case_queryset in [("all", queryset), ("active", queryset.filter(is_active=True))]:
+            timings = []
+            for _ in range(3):
+                with transaction.atomic():  # savepoint | every repeat deletes the same rows
+                    start = time.perf_counter()
+                    count = case_queryset.all().delete()
+                    timings.append((time.perf_counter() - start) * 1000)
+                    transaction.set_rollback(True)
+
+            results[case] = {
+                "best_ms": min(timings),
+                "rows": count,
+                "rows_per_second": count / (min(timings) / 1000),
+            }
+
+    return results
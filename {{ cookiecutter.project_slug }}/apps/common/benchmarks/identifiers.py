@@ -0,0 +1,70 @@
+import time
+import uuid
+
+from django.db import connection, models
+
+from apps.common.benchmarks.base import register_benchmark
+from apps.common.helpers import uuid7
+
+BATCH_SIZE = 1000
+
+
+def _get_index_size(table, index):
+    """Returns the size of the index in bytes. None, if not supported by the database."""
+
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute("SELECT pg_relation_size(%s::regclass)", [index])
+            return cursor.fetchone()[0]
+
+        if connection.vendor == "sqlite":
+            try:
+                cursor.execute("SELECT SUM(pgsize) FROM dbstat WHERE name = %s", [index])
+                return cursor.fetchone()[0]
+            except Exception:  # noqa | dbstat is not compiled in
+                return None
+
+    return None
+
+
+def _benchmark_generator(generator, rows, name):
+    """Inserts `rows` uuids from the `generator` to a scratch table with a unique index."""
+
+    table, index = f"benchmark_uuid_{name}", f"benchmark_uuid_{name}_idx"
+    uuid_field, column_type = models.UUIDField(), models.UUIDField().db_type(connection)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        cursor.execute(f"CREATE TABLE {table} (uuid {column_type} NOT NULL)")
+        cursor.execute(f"CREATE UNIQUE INDEX {index} ON {table} (uuid)")
+
+        try:
+            start = time.perf_counter()
+            for offset in range(0, rows, BATCH_SIZE):
+                values = [
+                    (uuid_field.get_db_prep_value(generator(), connection),)
+                    for _ in range(min(BATCH_SIZE, rows - offset))
+                ]
+                cursor.executemany(f"INSERT INTO {table} (uuid) VALUES (%s)", values)
+            insert_ms = (time.perf_counter() - start) * 1000
+
+            if connection.vendor == "postgresql":
+                cursor.execute(f"ANALYZE {table}")
+
+            return {
+                "insert_ms": insert_ms,
+                "insert_rows_per_second": rows / (insert_ms / 1000),
+                "index_size_bytes": _get_index_size(table, index),
+            }
+        finally:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+
+
+@register_benchmark("uuid_generators")
+def benchmark_uuid_generators(rows):
+    """Insert throughput and unique index size for the `uuid4` and the time ordered `uuid7`."""
+
+    return {
+        "uuid4": _benchmark_generator(uuid.uuid4, rows=rows, name="v4"),
+        "uuid7": _benchmark_generator(uuid7, rows=rows, name="v7"),
+    }
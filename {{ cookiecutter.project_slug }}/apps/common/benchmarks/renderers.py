@@ -0,0 +1,103 @@
+import datetime
+import decimal
+import io
+import uuid
+
+from django.utils.translation import gettext_lazy as _
+from phonenumber_field.phonenumber import PhoneNumber
+
+from apps.common.benchmarks.base import measure, register_benchmark
+from apps.common.parsers import AppJSONParser
+from apps.common.renderers import AppJSONRenderer, orjson
+
+
+def _get_payload(rows):
+    """Returns a list endpoint like payload with all the types handled by the `AppJSONEncoder`."""
+
+    phone_number = PhoneNumber.from_string("+14155552671")
+    now = datetime.datetime(2024, 1, 1, 10, 30, 15, 123456)
+
+    return {
+        "data": {
+            "count": rows,
+            "results": [
+                {
+                    "id": index,
+                    "uuid": uuid.uuid4(),
+                    "identity": f'Row {index} | ünïcödé \u2028 \u2029 "quoted" \n',
+                    "created": now + datetime.timedelta(seconds=index),
+                    "date": now.date(),
+                    "time": now.time(),
+                    "amount": decimal.Decimal("1234.50"),
+                    "ratio": index / 7,
+                    "phone_number": phone_number,
+                    "label": _("Active"),
+                    "is_active": bool(index % 2),
+                    "tags": ["a", "b", None],
+                    "meta": {1: "int key", "nested": {"empty": []}},
+                }
+                for index in range(rows)
+            ],
+        },
+        "status": "success",
+        "status_code": 200,
+        "action_code": "DO_NOTHING",
+    }
+
+
+# values written differently by the backends | the renderer & the parser fall back to the stdlib
+EDGE_CASE_VALUES = [1e16, -1.5e300, 1e-7, 1e-5, 0.0001, 123456789012345678901234567890, float("nan"), float("inf")]
+
+
+def _render_and_parse(renderer, parser, value):
+    """Returns the rendered & parsed back value, or the error raised by the backend."""
+
+    try:
+        rendered = renderer.render({"value": value})
+    except ValueError as exc:
+        return exc.__class__
+
+    return rendered, parser.parse(io.BytesIO(rendered))
+
+
+def _get_edge_cases_compatibility():
+    """Returns if the orjson backend renders & parses the `EDGE_CASE_VALUES` same as the stdlib."""
+
+    outputs = {}
+    for use_orjson in [False, True]:
+        renderer, parser = AppJSONRenderer(), AppJSONParser()
+        renderer.use_orjson = parser.use_orjson = use_orjson
+        outputs[use_orjson] = [_render_and_parse(renderer, parser, _) for _ in EDGE_CASE_VALUES]
+
+    return outputs[True] == outputs[False]
+
+
+@register_benchmark("json_backends")
+def benchmark_json_backends(rows):
+    """Render & parse timings of the orjson and the stdlib backends, with their byte compatibility."""
+
+    payload = _get_payload(rows)
+    results, rendered = {}, {}
+
+    for backend, use_orjson in [("stdlib", False), ("orjson", True)]:
+        if use_orjson and not orjson:
+            continue
+
+        renderer, parser = AppJSONRenderer(), AppJSONParser()
+        renderer.use_orjson = parser.use_orjson = use_orjson
+
+        rendered[backend] = renderer.render(payload)
+        results[backend] = {
+            "render_ms": measure(lambda: renderer.render(payload))["best_ms"],
+            "parse_ms": measure(lambda: parser.parse(io.BytesIO(rendered[backend])))["best_ms"],
+            "size_bytes": len(rendered[backend]),
+        }
+
+    if "orjson" in rendered:
+        results["orjson"]["byte_compatible"] = rendered["orjson"] == rendered["stdlib"]
+        results["orjson"]["parsed_equal"] = AppJSONParser().parse(
+            io.BytesIO(rendered["orjson"])
+        ) == AppJSONParser().parse(io.BytesIO(rendered["stdlib"]))
+        results["orjson"]["edge_cases_compatible"] = _get_edge_cases_compatibility()
+
+    return results
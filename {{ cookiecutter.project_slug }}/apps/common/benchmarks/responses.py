@@ -0,0 +1,44 @@
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from apps.common.benchmarks.base import measure, register_benchmark
+from apps.common.views.base import AppAPIView
+
+PAYLOAD = {"id": 1, "identity": "Benchmark", "is_active": True, "tags": ["a", "b"]}
+
+
+class _EnvelopeAPIView(AppAPIView):
+    """Mimics the `list`/`retrieve` of the `AppViewMixin`, with a plain payload."""
+
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        return self.get_app_response_schema(Response(data=PAYLOAD, status=status.HTTP_200_OK))
+
+
+class _LegacyEnvelopeAPIView(_EnvelopeAPIView):
+    """The previous implementation, a second response is built through the `send_response`."""
+
+    def get_app_response_schema(self, response, **kwargs):
+        return self.send_response(data=response.data, status_code=response.status_code, **kwargs)
+
+
+@register_benchmark("response_envelope")
+def benchmark_response_envelope(rows):
+    """
+    Per request cost (dispatch & render, in micro seconds) of the envelope applied in
+    the `finalize_response` vs the previous second response. Both render the same bytes.
+    """
+
+    request, results = APIRequestFactory().get("/"), {}
+
+    for case, view in [("legacy", _LegacyEnvelopeAPIView), ("single_pass", _EnvelopeAPIView)]:
+        view = view.as_view()
+        assert view(request).render().content == _EnvelopeAPIView.as_view()(request).render().content
+
+        metrics = measure(lambda: view(request).render(), number=rows)
+        results[case] = {"best_us": metrics["best_ms"] * 1000, "mean_us": metrics["mean_ms"] * 1000}
+
+    return results
@@ -0,0 +1,132 @@
+from django.db import transaction
+from rest_framework import serializers
+from rest_framework.serializers import ModelSerializer
+
+from apps.access.models import User
+from apps.common.benchmarks.base import measure, register_benchmark
+from apps.common.config import CUSTOM_ERRORS_MESSAGES
+from apps.common.serializers.base import AppReadOnlyModelSerializer, AppSerializer, AppWriteOnlyModelSerializer
+
+WIDE_SERIALIZER_FIELDS = 100
+
+
+class _LegacyErrorMessagesMixin:
+    """The previous `CustomErrorMessagesMixin`, computes the messages on every instantiation."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for field_name, field in getattr(self, "fields", {}).items():
+            if field.__class__.__name__ == "ManyRelatedField":
+                field.error_messages.update(CUSTOM_ERRORS_MESSAGES["ManyRelatedField"])
+                field.child_relation.error_messages.update(CUSTOM_ERRORS_MESSAGES["PrimaryKeyRelatedField"])
+            elif field.__class__.__name__ == "PrimaryKeyRelatedField":
+                field.error_messages.update(CUSTOM_ERRORS_MESSAGES["PrimaryKeyRelatedField"])
+            else:
+                display = field_name.replace("_", " ")
+                field.error_messages.update(
+                    {"blank": f"Please enter your {display}", "null": f"Please enter your {display}"}
+                )
+
+
+class _LegacyWriteOnlyModelSerializer(AppWriteOnlyModelSerializer):
+    """The previous `AppWriteOnlyModelSerializer`, mutates the `Meta.extra_kwargs` on every instantiation."""
+
+    def __init__(self, *args, **kwargs):
+        for field in self.Meta.fields:
+            self.Meta.extra_kwargs.setdefault(field, {})
+            self.Meta.extra_kwargs[field]["required"] = True
+
+        super().__init__(*args, **kwargs)
+
+    def get_extra_kwargs(self):
+        return ModelSerializer.get_extra_kwargs(self)
+
+
+def _get_wide_serializer(base):
+    """Returns a serializer with `WIDE_SERIALIZER_FIELDS` mixed fields, like a wide model's."""
+
+    attrs = {}
+    for index in range(WIDE_SERIALIZER_FIELDS):
+        if index % 10 == 0:
+            attrs[f"field_{index}"] = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), many=True)
+        elif index % 5 == 0:
+            attrs[f"field_{index}"] = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
+        elif index % 3 == 0:
+            attrs[f"field_{index}"] = serializers.IntegerField()
+        else:
+            attrs[f"field_{index}"] = serializers.CharField()
+
+    return type(f"Wide{base.__name__}", (base,), attrs)
+
+
+@register_benchmark("serializer_construction")
+def benchmark_serializer_construction(rows):
+    """
+    Construction cost of a wide serializer, for the previous and the per class cached
+    error messages. The previous mixin built the fields on every instantiation:
+        instantiate     - no field used, like the `many=True` copies & the schema
+        wide            - with the fields built | the field building dominates, same on both
+        nested many     - with the nested child's fields built
+    """
+
+    legacy = _get_wide_serializer(type("LegacySerializer", (_LegacyErrorMessagesMixin, serializers.Serializer), {}))
+    cached = _get_wide_serializer(AppSerializer)
+    results = {}
+
+    for case, serializer_class in [("legacy", legacy), ("cached", cached)]:
+        nested_class = type(f"Nested{case}", (serializer_class.__base__,), {"items": serializer_class(many=True)})
+
+        results[f"{case} | instantiate"] = measure(lambda: serializer_class(), number=rows)
+        results[f"{case} | wide"] = measure(lambda: serializer_class().fields, number=rows)
+        results[f"{case} | nested many"] = measure(lambda: nested_class().fields["items"].child.fields, number=rows)
+
+    return results
+
+
+@register_benchmark("write_serializer_construction")
+def benchmark_write_serializer_construction(rows):
+    """
+    The extra kwargs of a write serializer, previous vs compiled once per class:
+        extra kwargs    - the `get_extra_kwargs` alone, per call (in micro seconds)
+        construction    - with the fields built | the field building dominates, a few percent
+    """
+
+    fields = ["email", "phone_number", "password", "title", "first_name", "last_name", "is_active"]
+    results = {}
+
+    for case, base in [("legacy", _LegacyWriteOnlyModelSerializer), ("compiled", AppWriteOnlyModelSerializer)]:
+        meta = type("Meta", (base.Meta,), {"model": User, "fields": fields, "extra_kwargs": {}})
+        serializer_class = type(f"UserWrite{case}", (base,), {"Meta": meta})
+        serializer = serializer_class(data={})
+
+        extra_kwargs = measure(serializer.get_extra_kwargs, number=rows)
+        results[f"{case} | extra kwargs"] = {
+            "best_us": extra_kwargs["best_ms"] * 1000,
+            "mean_us": extra_kwargs["mean_ms"] * 1000,
+        }
+        results[f"{case} | construction"] = measure(lambda: serializer_class(data={}).fields, number=rows)
+
+    return results
+
+
+@register_benchmark("read_serializer_projection")
+def benchmark_read_serializer_projection(rows):
+    """List serialization of `rows` users, model instances vs the `.values()` projection."""
+
+    fields = ["id", "uuid", "email", "first_name", "last_name", "created", "is_active"]
+    results = {}
+
+    with transaction.atomic():
+        User.objects.bulk_create([User(email=f"benchmark-{index}@example.com") for index in range(rows)])
+        queryset = User.objects.filter(email__startswith="benchmark-").order_by("id")
+
+        for case, values_projection in [("instances", False), ("projection", True)]:
+            meta = type("Meta", (AppReadOnlyModelSerializer.Meta,), {"model": User, "fields": fields})
+            meta.values_projection = values_projection
+            serializer_class = type(f"UserRead{case}", (AppReadOnlyModelSerializer,), {"Meta": meta})
+
+            results[case] = measure(lambda: serializer_class(queryset.all(), many=True).data)
+
+        transaction.set_rollback(True)
+
+    return results
@@ -0,0 +1,380 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Callable, Generic, TypeVar
+
+from django.core.cache import cache, caches
+from django.db.models.signals import post_delete, post_save
+
+from apps.common.config import TWO_TIER_CACHE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# models whose changes invalidate the dependent caches | see `register_cache_model`
+_CACHE_MODELS = set()
+
+# invalidation broadcasts per cache alias | see `get_invalidation_broadcast`
+_INVALIDATION_BROADCASTS = {}
+
+# marker for the cache misses | None is a valid cached value
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Process local & thread safe LRU cache, the entries expire after the `timeout`.
+    Used in front of the django cache for the hot keys, no network round trip.
+
+    Note:
+        The entries are not shared across the processes. Invalidations done in
+        other processes are seen only after the `timeout`, keep it short.
+    """
+
+    def __init__(self, maxsize=1024, timeout=60):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return default
+
+            expires, value = entry
+            if expires < time.monotonic():
+                del self.entries[key]
+                return default
+
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + (timeout or self.timeout), value)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class LocalInvalidationBroadcast:
+    """
+    In process stand-in of the `RedisInvalidationBroadcast`, for the locmem cache (tests,
+    local development). The subscribers of this process are called right away.
+    """
+
+    def __init__(self):
+        self.subscribers = []
+
+    def publish(self, keys, sender=None):
+        self.notify(keys, sender=sender)
+
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
+
+    def notify(self, keys, sender=None):
+        """Calls the subscribers, other than the `sender` (already invalidated)."""
+
+        for callback in self.subscribers:
+            if sender is None or getattr(callback, "__self__", None) is not sender:
+                callback(keys)
+
+
+class RedisInvalidationBroadcast(LocalInvalidationBroadcast):
+    """
+    Broadcasts the invalidated keys to all the workers over a redis pub/sub channel.
+    Each process listens on a daemon thread, started on the first subscribe (after the
+    fork of the workers). On a lost connection, the subscribers get None (clear all).
+    """
+
+    def __init__(self, alias, channel):
+        super().__init__()
+        self.alias = alias
+        self.channel = channel
+        self.sender = f"{os.getpid()}:{id(self)}"
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def get_connection(self):
+        from django_redis import get_redis_connection
+
+        return get_redis_connection(self.alias)
+
+    def publish(self, keys, sender=None):
+        super().publish(keys, sender=sender)  # the subscribers of this process
+
+        try:
+            self.get_connection().publish(self.channel, json.dumps({"sender": self.sender, "keys": keys}))
+        except Exception:  # noqa | the near caches expire anyway
+            logger.warning("Cache invalidation broadcast failed on %s.", self.channel, exc_info=True)
+
+    def subscribe(self, callback):
+        super().subscribe(callback)
+
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.listen, daemon=True)
+                self.thread.start()
+
+    def listen(self):
+        while True:
+            try:
+                pubsub = self.get_connection().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+
+                for message in pubsub.listen():
+                    payload = json.loads(message["data"])
+                    if payload["sender"] != self.sender:
+                        self.notify(payload["keys"])
+            except Exception:  # noqa | messages might be lost, clear the near caches & reconnect
+                logger.warning("Cache invalidation listener disconnected from %s.", self.channel, exc_info=True)
+                self.notify(None)
+                time.sleep(1)
+
+
+def get_invalidation_broadcast(alias="default"):
+    """
+    Returns the invalidation broadcast for the cache alias, one per alias. Over redis
+    pub/sub for the `django_redis` backend, in process for the others (locmem).
+    """
+
+    if alias not in _INVALIDATION_BROADCASTS:
+        if caches[alias].__class__.__module__.startswith("django_redis"):
+            _INVALIDATION_BROADCASTS[alias] = RedisInvalidationBroadcast(
+                alias=alias, channel=TWO_TIER_CACHE_CONFIG["channel"]
+            )
+        else:
+            _INVALIDATION_BROADCASTS[alias] = LocalInvalidationBroadcast()
+
+    return _INVALIDATION_BROADCASTS[alias]
+
+
+class TwoTierCache(Generic[T]):
+    """
+    A near cache (`LRUCache`, per process) in front of the shared django cache (redis).
+    The hot keys are served from the memory, without a network round trip.
+
+    The sets & deletes are broadcast to the other workers, which drop their near
+    entries. The `near_timeout` bounds the staleness, if a broadcast is lost.
+
+    Usage:
+        countries = TwoTierCache(namespace="countries")
+        countries.get_or_set("all", lambda: list(Country.objects.values()), timeout=60 * 60)
+    """
+
+    def __init__(self, namespace, alias="default", near_size=None, near_timeout=None, lock_timeout=None):
+        self.namespace = namespace
+        self.alias = alias
+        self.near = LRUCache(
+            maxsize=near_size or TWO_TIER_CACHE_CONFIG["near_size"],
+            timeout=near_timeout or TWO_TIER_CACHE_CONFIG["near_timeout"],
+        )
+        self.lock_timeout = lock_timeout or TWO_TIER_CACHE_CONFIG["lock_timeout"]
+        self.stats = Counter()
+        self.is_subscribed = False
+
+    @property
+    def far(self):
+        return caches[self.alias]
+
+    def get_broadcast(self):
+        """Returns the invalidation broadcast, subscribed on the first use (after the fork)."""
+
+        broadcast = get_invalidation_broadcast(self.alias)
+        if not self.is_subscribed:
+            self.is_subscribed = True
+            broadcast.subscribe(self.on_invalidation)
+
+        return broadcast
+
+    def make_key(self, key):
+        return f"{self.namespace}:{key}"
+
+    def on_invalidation(self, keys):
+        """Called with the invalidated keys from the other workers. None, to clear all."""
+
+        if keys is None:
+            self.near.clear()
+            return
+
+        for key in keys:
+            self.near.delete(key)
+
+    def get(self, key, default=None) -> T | None:
+        key = self.make_key(key)
+        self.get_broadcast()
+
+        value = self.near.get(key, _MISSING)
+        if value is not _MISSING:
+            self.stats["near_hits"] += 1
+            return value
+
+        value = self.far.get(key, _MISSING)
+        if value is not _MISSING:
+            self.stats["far_hits"] += 1
+            self.near.set(key, value)
+            return value
+
+        self.stats["misses"] += 1
+        return default
+
+    def set(self, key, value: T, timeout=None):
+        key = self.make_key(key)
+
+        self.far.set(key, value, timeout)
+        self.near.set(key, value, timeout=min(timeout or self.near.timeout, self.near.timeout))
+        self.get_broadcast().publish([key], sender=self)
+
+    def delete(self, *keys):
+        keys = [self.make_key(_) for _ in keys]
+
+        self.far.delete_many(keys)
+        for key in keys:
+            self.near.delete(key)
+        self.get_broadcast().publish(keys, sender=self)
+
+    def get_or_set(self, key, builder: Callable[[], T], timeout=None, none_timeout=None) -> T:
+        """
+        Returns the value of the key, built & set by the `builder` on a miss. Only one
+        worker builds a key at a time (lock in the shared cache), the others wait for
+        it up to the `lock_timeout`. Avoids the stampede on the expiry of a hot key.
+        A None from the `builder` is set for the `none_timeout`, if given.
+        """
+
+        def _set(value):
+            self.set(key, value, none_timeout if value is None and none_timeout else timeout)
+
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        lock_key = f"{self.make_key(key)}:lock"
+        acquired = self.far.add(lock_key, True, timeout=self.lock_timeout)
+
+        # None, the shared cache is down (ignored exceptions) | nothing to wait for
+        if acquired or acquired is None:
+            try:
+                value = builder()
+                _set(value)
+            finally:
+                self.far.delete(lock_key)
+            return value
+
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(TWO_TIER_CACHE_CONFIG["lock_poll_interval"])
+
+            value = self.far.get(self.make_key(key), _MISSING)
+            if value is not _MISSING:
+                self.near.set(self.make_key(key), value)
+                return value
+
+        # the builder in the other worker failed or is too slow
+        value = builder()
+        _set(value)
+        return value
+
+    def get_stats(self) -> dict:
+        """Returns the near hits, far hits & misses of this process."""
+
+        hits = self.stats["near_hits"] + self.stats["far_hits"]
+        total = hits + self.stats["misses"]
+
+        return {
+            "near_hits": self.stats["near_hits"],
+            "far_hits": self.stats["far_hits"],
+            "misses": self.stats["misses"],
+            "hit_ratio": hits / total if total else None,
+            "near_size": len(self.near),
+        }
+
+
+def get_version_key(key):
+    return f"cache-version:{key}"
+
+
+def get_cache_versions(*keys) -> list:
+    """
+    Returns the current versions for the given keys in one go. The dependent cache
+    entries store these versions and are stale, once any of them is bumped.
+    """
+
+    version_keys = [get_version_key(_) for _ in keys]
+    versions = cache.get_many(version_keys)
+
+    for version_key in version_keys:
+        if version_key not in versions:
+            # missing or evicted | start from the time, never from an older version
+            cache.add(version_key, time.time_ns(), timeout=None)
+            versions[version_key] = cache.get(version_key)
+
+    return [versions[_] for _ in version_keys]
+
+
+def bump_cache_version(key):
+    """Bumps the version for the given key. This invalidates all the dependent entries."""
+
+    try:
+        cache.incr(get_version_key(key))
+    except ValueError:
+        cache.set(get_version_key(key), time.time_ns(), timeout=None)
+
+
+def get_model_cache_key(model):
+    return f"model:{model._meta.label_lower}"
+
+
+def register_cache_model(model):
+    """
+    Registers the model, so that its saves & deletes invalidate the dependent caches.
+    The signals are connected only for the registered models, any receiver for all
+    models would disable the fast deletes across the app.
+    """
+
+    if is_cache_model(model):
+        return
+
+    _CACHE_MODELS.add(model._meta.label_lower)
+    post_save.connect(invalidate_model_cache_on_change, sender=model)
+    post_delete.connect(invalidate_model_cache_on_change, sender=model)
+
+
+def is_cache_model(model):
+    return model._meta.label_lower in _CACHE_MODELS
+
+
+def get_model_cache_versions(models) -> list:
+    """Returns the current cache versions for the given models."""
+
+    return get_cache_versions(*[get_model_cache_key(_) for _ in models])
+
+
+def invalidate_model_cache(model):
+    """Invalidates the caches that depend on the given model."""
+
+    if is_cache_model(model):
+        bump_cache_version(get_model_cache_key(model))
+
+
+def invalidate_model_cache_on_change(sender, **kwargs):
+    """Receiver for the `post_save` & `post_delete` of the registered models."""
+
+    invalidate_model_cache(sender)
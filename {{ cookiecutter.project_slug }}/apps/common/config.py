@@ -3,6 +3,57 @@ PAGINATION_CONFIG = {
     "change_query_param": "page-size",
 }
 
+# count strategy for `AppPagination` | auto, exact, estimate or cached
+PAGINATION_COUNT_CONFIG = {
+    "mode": "auto",
+    "estimate_threshold": 100000,  # the auto mode switches to the estimate above this | None to disable
+    "cache_timeout": 60,  # seconds, for the cached mode & the estimates
+}
+
+# defaults for the `APP_INSTRUMENTATION` setting | see `InstrumentationMiddleware`
+# the `Server-Timing` exposes the query counts & the db time to the clients, opt in (on `DEBUG`)
+INSTRUMENTATION_CONFIG = {
+    "enabled": True,
+    "sample_rate": 0.01,  # fraction of the requests instrumented | 0 to 1
+    "server_timing": False,  # sends the `Server-Timing` header
+    "log": True,  # logs a structured line per instrumented request, above the thresholds
+    "log_threshold_ms": 500,  # logs only the requests slower than this... | 0, disabled
+    "log_query_threshold": 50,  # ...or with at least this many queries | 0, disabled (both 0, all)
+    "duplicate_query_threshold": 2,  # same sql this many times is reported as N+1
+}
+
+# plans of the `QueryPlanner` per (serializer class, model) | process local, see `get_query_plan`
+QUERY_PLAN_CACHE_CONFIG = {
+    "size": 1000,  # plans | the least recently used are dropped
+    "timeout": 60 * 60,  # seconds
+}
+
+# cache of the effective permissions per user | see `get_user_permissions`
+PERMISSION_CACHE_CONFIG = {
+    "timeout": 60 * 60,  # seconds | versioned, the changes are seen immediately
+}
+
+# near (per process) cache in front of the shared cache | see `TwoTierCache`
+TWO_TIER_CACHE_CONFIG = {
+    "near_size": 10000,  # entries per namespace
+    "near_timeout": 30,  # seconds | bounds the staleness, if a broadcast is lost
+    "lock_timeout": 10,  # seconds, a key is built by one worker at a time
+    "lock_poll_interval": 0.05,  # seconds, the other workers wait for the build
+    "channel": "app-cache-invalidation",  # redis pub/sub channel
+}
+
+# rows of the `BaseModel.row_cache_timeout` models | see `get_from_row_cache`
+ROW_CACHE_CONFIG = {
+    "miss_timeout": 5,  # seconds, for the missing rows | the inserts without signals (`bulk_create`) are not seen
+}
+
+# cache of the `token -> user` for the `AppTokenAuthentication`
+TOKEN_AUTH_CACHE_CONFIG = {
+    "near_size": 10000,  # entries in the near (per process) cache
+    "near_timeout": 30,  # seconds | bounds the staleness, if a broadcast is lost
+    "timeout": 5 * 60,  # seconds, in the django cache | invalidated by the signals
+}
+
 API_RESPONSE_ACTION_CODES = {"display_error_1": "DISPLAY_ERROR_MESSAGES"}
 
 # just an internal variable to store common data | To make it DRY
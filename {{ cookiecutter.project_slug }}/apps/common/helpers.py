@@ -1,7 +1,16 @@
 import json
+import os
 import random
 import secrets
 import string
+import threading
+import time
+import uuid
+from datetime import datetime
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.module_loading import import_string
 
 
 def get_display_name_for_slug(slug: str):
@@ -51,3 +60,79 @@ def get_file_field_url(instance, field="image"):
         return getattr(instance, field).file.url
 
     return None
+
+
+_uuid7_lock = threading.Lock()
+_uuid7_state = {"timestamp_ms": 0, "counter": 0}
+
+
+def _reset_uuid7_lock():
+    """The forked workers (gunicorn, celery) should not inherit a held lock."""
+
+    global _uuid7_lock  # pylint: disable=global-statement
+    _uuid7_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_uuid7_lock)
+
+
+def uuid7():
+    """
+    Returns a time ordered UUID version 7 (RFC 9562). Layout:
+        48 bits     - unix timestamp in milliseconds
+        12 bits     - counter, for the ordering within the same millisecond in the process
+        62 bits     - random, from `os.urandom`
+
+    The random bits are from the OS, not from a seeded generator. So this is safe across
+    processes and forked workers. Within a process the values are strictly increasing.
+    """
+
+    with _uuid7_lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+
+        if timestamp_ms > _uuid7_state["timestamp_ms"]:
+            # random start, leaves room for the increments
+            counter = secrets.randbits(11)
+        else:
+            # same millisecond or the clock went back | keep increasing
+            timestamp_ms = _uuid7_state["timestamp_ms"]
+            counter = _uuid7_state["counter"] + 1
+            if counter > 0xFFF:
+                timestamp_ms, counter = timestamp_ms + 1, 0
+
+        _uuid7_state.update(timestamp_ms=timestamp_ms, counter=counter)
+
+    random_bits = int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    return uuid.UUID(int=(timestamp_ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | random_bits)
+
+
+def get_uuid7_datetime(value: uuid.UUID) -> datetime | None:
+    """Returns the creation datetime of the UUID version 7. None for the other versions."""
+
+    if value.version != 7:
+        return None
+
+    return datetime.fromtimestamp((value.int >> 80) / 1000)
+
+
+def uuid7_from_datetime(value: datetime) -> uuid.UUID:
+    """
+    Returns the lowest UUID version 7 for the given datetime. Used for filtering on the
+    creation time through the uuid. Eg: Model.objects.filter(uuid__gte=uuid7_from_datetime(dt))
+    """
+
+    return uuid.UUID(int=(int(value.timestamp() * 1000) << 80) | (0x7 << 76) | (0b10 << 62))
+
+
+@lru_cache
+def _get_uuid_generator(path):
+    return import_string(path)
+
+
+def get_default_uuid():
+    """
+    Default for the `BaseModel.uuid`. Uses the generator from `APP_UUID_GENERATOR`
+    setting, which is a dotted path. Eg: "uuid.uuid4" or "apps.common.helpers.uuid7"
+    """
+
+    return _get_uuid_generator(getattr(settings, "APP_UUID_GENERATOR", "uuid.uuid4"))()
@@ -0,0 +1,211 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Manager
+from django.db.models.query import ModelIterable
+from django.db.models.signals import post_delete, post_save
+
+# the identity map of the current request | None, outside the `identity_map_scope`
+_identity_map = ContextVar("identity_map", default=None)
+
+# lookups served from the identity map | the pk & the `BaseModel.uuid`
+IDENTITY_MAP_LOOKUPS = ["pk", "uuid"]
+
+# models whose saves & deletes are tracked | see `register_identity_map_model`
+_IDENTITY_MAP_MODELS = set()
+
+
+class IdentityMap:
+    """
+    Holds the instances loaded in a request, keyed by (db, model, lookup, value). So the
+    same row is loaded once per request, by the permissions, the view & the serializer.
+    """
+
+    def __init__(self):
+        self.instances = {}
+
+    def get(self, key):
+        instance = self.instances.get(key)
+
+        # deleted by the `instance.delete()` | django sets the pk to None
+        if instance is not None and instance.pk is None:
+            return None
+
+        return instance
+
+    def add(self, instance, db):
+        """Adds the instance by all the `IDENTITY_MAP_LOOKUPS`."""
+
+        register_identity_map_model(instance.__class__)
+        for key in get_instance_keys(instance, db):
+            self.instances[key] = instance
+
+    def discard(self, model, instance=None):
+        """Discards the instance, or all the instances of the model, if not given."""
+
+        label = model._meta.label_lower
+        self.instances = {
+            key: _
+            for key, _ in self.instances.items()
+            if key[1] != label or (instance is not None and _.pk != instance.pk)
+        }
+
+
+def get_identity_map():
+    """Returns the `IdentityMap` of the current request, None outside of a request."""
+
+    return _identity_map.get()
+
+
+@contextmanager
+def identity_map_scope():
+    """A new identity map for the block, used by the `IdentityMapMiddleware` per request."""
+
+    token = _identity_map.set(IdentityMap())
+    try:
+        yield _identity_map.get()
+    finally:
+        _identity_map.reset(token)
+
+
+def get_instance_keys(instance, db):
+    label = instance._meta.label_lower
+    keys = [(db, label, "pk", instance.pk)]
+
+    if hasattr(instance, "uuid"):
+        keys.append((db, label, "uuid", instance.uuid))
+
+    return keys
+
+
+def get_identity_map_key(queryset, args, kwargs):
+    """
+    Returns the identity map key for the `get` lookup on the queryset. None, if
+    the lookup can not be served from the map (filters, joins, deferred fields,
+    row locks...). Used by the row cache as well.
+    """
+
+    if args or len(kwargs) != 1:
+        return None
+
+    if isinstance(queryset, Manager):
+        queryset = queryset.get_queryset()
+
+    query = queryset.query
+    if (
+        query.where
+        or query.select_for_update  # the row lock has to be taken by the query
+        or query.combinator
+        or query.distinct
+        or query.select_related
+        or query.annotations
+        or query.extra
+        or query.deferred_loading != (frozenset(), True)
+        or queryset._prefetch_related_lookups
+        or queryset._iterable_class is not ModelIterable
+    ):
+        return None
+
+    model = queryset.model
+    lookup, value = next(iter(kwargs.items()))
+    lookup = lookup.removesuffix("__exact")
+    lookup = "pk" if lookup == model._meta.pk.name else lookup
+
+    if lookup not in IDENTITY_MAP_LOOKUPS:
+        return None
+
+    try:
+        field = model._meta.pk if lookup == "pk" else model._meta.get_field(lookup)
+        value = field.to_python(value)
+    except (FieldDoesNotExist, ValidationError, TypeError):
+        return None
+
+    return queryset.db, model._meta.label_lower, lookup, value
+
+
+def get_from_identity_map(queryset, args, kwargs):
+    """
+    Returns the (key, instance) for the `get` lookup. The key is None if the identity map
+    is not active or the lookup is not supported, the instance is None on a miss.
+    """
+
+    identity_map = get_identity_map()
+    if identity_map is None:
+        return None, None
+
+    key = get_identity_map_key(queryset, args, kwargs)
+    return key, identity_map.get(key) if key else None
+
+
+def add_to_identity_map(instance, db):
+    identity_map = get_identity_map()
+    if identity_map is not None and instance is not None:
+        identity_map.add(instance, db)
+
+
+def discard_from_identity_map(model, instance=None):
+    identity_map = get_identity_map()
+    if identity_map is not None:
+        identity_map.discard(model, instance=instance)
+
+
+def register_identity_map_model(model):
+    """
+    Tracks the saves & deletes of the model, to discard the stale instances. Connected
+    only for the models in the map, like the `register_cache_model`.
+    """
+
+    if model._meta.label_lower in _IDENTITY_MAP_MODELS:
+        return
+
+    _IDENTITY_MAP_MODELS.add(model._meta.label_lower)
+    post_save.connect(discard_from_identity_map_on_change, sender=model)
+    post_delete.connect(discard_from_identity_map_on_change, sender=model)
+
+
+def discard_from_identity_map_on_change(sender, instance, **kwargs):
+    """Receiver for the `post_save` & `post_delete` of the tracked models."""
+
+    discard_from_identity_map(sender, instance=instance)
+
+
+def batch_load_foreign_keys(instances, field_names):
+    """
+    Loads the given foreign keys of the instances in a single `IN` query per field. The
+    already cached relations (select_related) & the instances in the identity map are
+    not queried again. Used by the list serializers, avoids a query per row.
+    """
+
+    if not instances:
+        return
+
+    model, identity_map = instances[0].__class__, get_identity_map()
+
+    for field_name in field_names:
+        field = model._meta.get_field(field_name)
+        related_model, db = field.related_model, instances[0]._state.db
+
+        # keyed by the pk | the `to_field` relations are left to django
+        if not field.target_field.primary_key:
+            continue
+
+        pending = [_ for _ in instances if not field.is_cached(_) and getattr(_, field.attname) is not None]
+        if not pending:
+            continue
+
+        loaded = {}
+        for value in {getattr(_, field.attname) for _ in pending}:
+            instance = identity_map.get((db, related_model._meta.label_lower, "pk", value)) if identity_map else None
+            if instance is not None:
+                loaded[value] = instance
+
+        missing = {getattr(_, field.attname) for _ in pending} - loaded.keys()
+        if missing:
+            for instance in related_model._base_manager.using(db).filter(pk__in=missing):
+                loaded[instance.pk] = instance
+                add_to_identity_map(instance, db)
+
+        for instance in pending:
+            if getattr(instance, field.attname) in loaded:
+                field.set_cached_value(instance, loaded[getattr(instance, field.attname)])
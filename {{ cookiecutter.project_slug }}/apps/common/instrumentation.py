@@ -0,0 +1,161 @@
+import json
+import logging
+import random
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+
+from apps.common.config import INSTRUMENTATION_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# the metrics of the current request | None, if not instrumented
+_request_metrics = ContextVar("request_metrics", default=None)
+
+
+def get_instrumentation_config() -> dict:
+    """Returns the `INSTRUMENTATION_CONFIG` updated with the `APP_INSTRUMENTATION` setting."""
+
+    return {**INSTRUMENTATION_CONFIG, **getattr(settings, "APP_INSTRUMENTATION", {})}
+
+
+class RequestMetrics:
+    """
+    Holds the metrics of a request. The queries are recorded by the `execute_wrapper`
+    of the connections (works without `DEBUG`), the other timings by `record_timing`.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.query_count = 0
+        self.db_ms = 0.0
+        self.query_signatures = Counter()
+        self.timings = Counter()
+        self._active_timings = set()
+
+    def __call__(self, execute, sql, params, many, context):
+        """The `execute_wrapper` for the connections."""
+
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_ms += (time.perf_counter() - start) * 1000
+            self.query_count += 1
+            self.query_signatures[sql] += 1  # the sql has placeholders | same for the N+1
+
+    @property
+    def total_ms(self):
+        return (time.perf_counter() - self.start) * 1000
+
+    def get_duplicate_queries(self, threshold) -> list:
+        return [{"sql": sql, "count": count} for sql, count in self.query_signatures.items() if count >= threshold]
+
+    def get_server_timing(self, threshold) -> str:
+        """Returns the `Server-Timing` header value."""
+
+        duplicates = len(self.get_duplicate_queries(threshold))
+        metrics = [
+            f'db;dur={self.db_ms:.2f};desc="{self.query_count} queries, {duplicates} duplicated"',
+            *[f"{name};dur={value:.2f}" for name, value in self.timings.items()],
+            f"total;dur={self.total_ms:.2f}",
+        ]
+        return ", ".join(metrics)
+
+
+def get_request_metrics():
+    """Returns the `RequestMetrics` of the current request, None if not instrumented."""
+
+    return _request_metrics.get()
+
+
+@contextmanager
+def record_timing(name):
+    """
+    Records the time of the block on the request metrics as `name` (like serialize,
+    render). The nested blocks with the same name are counted once.
+    """
+
+    metrics = get_request_metrics()
+    if metrics is None or name in metrics._active_timings:
+        yield
+        return
+
+    metrics._active_timings.add(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.timings[name] += (time.perf_counter() - start) * 1000
+        metrics._active_timings.discard(name)
+
+
+class InstrumentationMiddleware:
+    """
+    Records the query count, the db time, the duplicated queries (N+1), the serializer
+    and the render time of the requests. Sent as the `Server-Timing` header and logged
+    as a structured line. Configured by the `APP_INSTRUMENTATION` setting, see the
+    `INSTRUMENTATION_CONFIG` for the options.
+
+    Note:
+        By default, 1% of the requests are sampled & only the slow ones are logged. The
+        `Server-Timing` is opt in, it exposes the query counts & the db time to the
+        clients. Enabled on `DEBUG` by the settings, else set `server_timing`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        config = get_instrumentation_config()
+        if not config["enabled"] or random.random() >= config["sample_rate"]:
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = _request_metrics.set(metrics)
+
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all(initialized_only=False):
+                    stack.enter_context(connection.execute_wrapper(metrics))
+                response = self.get_response(request)
+        finally:
+            _request_metrics.reset(token)
+
+        if config["server_timing"]:
+            response["Server-Timing"] = metrics.get_server_timing(config["duplicate_query_threshold"])
+
+        if config["log"] and self.should_log(metrics, config):
+            self.log(request, response, metrics, config)
+
+        return response
+
+    def should_log(self, metrics, config):
+        """Logs the requests above any of the set thresholds. All, if no threshold is set."""
+
+        thresholds = [
+            (metrics.total_ms, config["log_threshold_ms"]),
+            (metrics.query_count, config["log_query_threshold"]),
+        ]
+        thresholds = [(value, threshold) for value, threshold in thresholds if threshold]
+
+        return not thresholds or any(value >= threshold for value, threshold in thresholds)
+
+    def log(self, request, response, metrics, config):
+        """Logs the metrics as a json line, also passed as the `instrumentation` extra."""
+
+        data = {
+            "method": request.method,
+            "path": request.path,
+            "status_code": response.status_code,
+            "total_ms": round(metrics.total_ms, 2),
+            "db_ms": round(metrics.db_ms, 2),
+            "query_count": metrics.query_count,
+            "duplicate_queries": metrics.get_duplicate_queries(config["duplicate_query_threshold"]),
+            **{f"{name}_ms": round(value, 2) for name, value in metrics.timings.items()},
+        }
+        logger.info(json.dumps(data), extra={"instrumentation": data})
@@ -0,0 +1,87 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.common.benchmarks import BENCHMARKS
+from apps.common.benchmarks.base import compare_results
+
+
+class Command(BaseCommand):
+    """
+    Runs the benchmarks in `apps.common.benchmarks` against the configured database.
+    Set `DATABASE_ENGINE=django.db.backends.sqlite3` to run without a PostgreSQL.
+
+    Usage:
+        python manage.py run_benchmarks
+        python manage.py run_benchmarks uuid_generators --rows 100000
+        python manage.py run_benchmarks --rows 100000 --output baseline.json
+        python manage.py run_benchmarks --rows 100000 --compare baseline.json --threshold 10
+
+    With `--compare`, the command fails (exit code 1) if any metric regressed by
+    more than the `--threshold` percent, against the given baseline run.
+    """
+
+    help = "Runs the apps.common benchmarks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("benchmarks", nargs="*", help=f"Benchmarks to run: {', '.join(BENCHMARKS)}")
+        parser.add_argument("--rows", type=int, default=10000, help="Number of rows for the benchmarks.")
+        parser.add_argument("--output", help="Path to write the results as JSON.")
+        parser.add_argument("--compare", help="Path of a JSON results (`--output`) to compare against.")
+        parser.add_argument("--threshold", type=float, default=10.0, help="Allowed regression in percent.")
+
+    def handle(self, *args, **options):
+        names = options["benchmarks"] or [*BENCHMARKS.keys()]
+
+        unknown = [_ for _ in names if _ not in BENCHMARKS]
+        if unknown:
+            raise CommandError(f"Unknown benchmarks: {', '.join(unknown)}")
+
+        baseline = None
+        if options["compare"]:
+            with open(options["compare"]) as file:
+                baseline = json.load(file)
+
+            if baseline["rows"] != options["rows"]:
+                self.stdout.write(
+                    self.style.WARNING(f"The baseline was run with {baseline['rows']} rows, not {options['rows']}.")
+                )
+
+        results = {}
+        for name in names:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{name} (rows: {options['rows']})"))
+            results[name] = BENCHMARKS[name](rows=options["rows"])
+            for case, metrics in results[name].items():
+                metrics = ", ".join(
+                    f"{k}: {v:.2f}" if isinstance(v, float) else f"{k}: {v}" for k, v in metrics.items()
+                )
+                self.stdout.write(f"  {case:<40} {metrics}")
+
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                json.dump({"vendor": connection.vendor, "rows": options["rows"], "results": results}, file, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+        if baseline is not None:
+            self.report(compare_results(baseline["results"], results, threshold=options["threshold"]), options)
+
+    def report(self, report, options):
+        """Writes the comparison against the baseline, raises if any metric regressed."""
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"Compared to {options['compare']} (±{options['threshold']}%)"))
+
+        for name, case, metric, previous, value, change, passed in report:
+            style = self.style.SUCCESS if passed else self.style.ERROR
+            self.stdout.write(
+                style(
+                    f"  {'PASS' if passed else 'FAIL'} {f'{name} | {case}':<60} {metric:<16} "
+                    f"{previous:.2f} -> {value:.2f} ({change:+.1f}%)"
+                )
+            )
+
+        failed = [_ for _ in report if not _[-1]]
+        if failed:
+            raise CommandError(
+                f"{len(failed)} of {len(report)} metrics regressed by more than {options['threshold']}%"
+            )
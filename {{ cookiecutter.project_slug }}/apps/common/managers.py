@@ -1,11 +1,58 @@
 from django.contrib.auth.models import BaseUserManager
-from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist, ValidationError
-from django.db.models import QuerySet
+from django.core.exceptions import ImproperlyConfigured, MultipleObjectsReturned, ObjectDoesNotExist, ValidationError
+from django.db.models import DateTimeField, QuerySet
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from apps.common.audit import get_audit_field_values
+from apps.common.cache import invalidate_model_cache
+from apps.common.identity_map import add_to_identity_map, discard_from_identity_map, get_from_identity_map
+from apps.common.row_cache import get_from_row_cache, invalidate_row_cache, is_row_cache_model
 
-class UserManager(BaseUserManager):
+
+class UserQuerySet(QuerySet):
+    """The queryset of the `UserManager`. The users are served from the identity map, see `get_or_none`."""
+
+    def get_or_none(self, *args, **kwargs):
+        """
+        Get the object based on the given **kwargs. If not present returns None.
+        Note: Expects a single instance.
+        """
+
+        # loaded already in the request | by pk & uuid
+        key, instance = get_from_identity_map(self, args, kwargs)
+        if instance is not None:
+            return instance
+
+        try:
+            instance = self.get(*args, **kwargs)
+        # if does not exist or if idiotic values like id=None is passed
+        except (
+            ObjectDoesNotExist,
+            AttributeError,
+            ValueError,
+            MultipleObjectsReturned,
+            ValidationError,  # invalid UUID
+        ):
+            return None
+
+        if key:
+            add_to_identity_map(instance, db=self.db)
+
+        return instance
+
+    def update(self, **kwargs):
+        """Overridden to discard the stale users from the identity map, like the `BaseObjectManagerQuerySet`."""
+
+        count = super().update(**kwargs)
+
+        # no signals for the queryset updates
+        discard_from_identity_map(self.model)
+        invalidate_model_cache(self.model)
+        return count
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
     """
     Custom user model manager where email is the unique identifiers
     for authentication instead of usernames.
@@ -42,24 +89,6 @@ class UserManager(BaseUserManager):
             raise ValueError(_("Superuser must have is_superuser=True."))
         return self.create_user(email, password, **extra_fields)
 
-    def get_or_none(self, *args, **kwargs):
-        """
-        Get the object based on the given **kwargs. If not present returns None.
-        Note: Expects a single instance.
-        """
-
-        try:
-            return self.get(*args, **kwargs)
-        # if does not exist or if idiotic values like id=None is passed
-        except (
-            ObjectDoesNotExist,
-            AttributeError,
-            ValueError,
-            MultipleObjectsReturned,
-            ValidationError,  # invalid UUID
-        ):
-            return None
-
 
 class BaseObjectManagerQuerySet(QuerySet):
     """
@@ -78,6 +107,7 @@ class BaseObjectManagerQuerySet(QuerySet):
 
     Available methods -
         get_or_none
+        cached,
         active,
         inactive,
         alive,
@@ -86,31 +116,103 @@ class BaseObjectManagerQuerySet(QuerySet):
         hard_delete
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._row_cache_timeout = None
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._row_cache_timeout = self._row_cache_timeout
+        return clone
+
+    def cached(self, timeout=None):
+        """
+        Serves the `get_or_none` by pk/uuid from the row cache, for the models with the
+        `BaseModel.row_cache_timeout`. Meant for the hot reference rows.
+            Model.objects.cached().get_or_none(uuid=...)
+
+        The other lookups, filters & `only`/`select_related` are not cached, they are
+        queried as usual. The rows are invalidated on the saves, deletes & updates.
+        """
+
+        if not is_row_cache_model(self.model):
+            raise ImproperlyConfigured(f"Set the `row_cache_timeout` on {self.model.__name__} to use `cached()`.")
+
+        clone = self._chain()
+        clone._row_cache_timeout = timeout or self.model.row_cache_timeout
+        return clone
+
     def get_or_none(self, *args, **kwargs):
         """
         Get the object based on the given **kwargs. If not present returns None.
         Note: Expects a single instance.
         """
 
-        try:
-            return self.get(*args, **kwargs)
-        # if does not exist or if idiotic values like id=None is passed
-        except (
-            ObjectDoesNotExist,
-            AttributeError,
-            ValueError,
-            MultipleObjectsReturned,
-            ValidationError,  # invalid UUID
-        ):
-            return None
+        # loaded already in the request | by pk & uuid
+        key, instance = get_from_identity_map(self, args, kwargs)
+        if instance is not None:
+            return instance
+
+        is_cached = False
+        if self._row_cache_timeout:
+            is_cached, instance = get_from_row_cache(self, args, kwargs, timeout=self._row_cache_timeout)
+
+        if not is_cached:
+            try:
+                instance = self.get(*args, **kwargs)
+            # if does not exist or if idiotic values like id=None is passed
+            except (
+                ObjectDoesNotExist,
+                AttributeError,
+                ValueError,
+                MultipleObjectsReturned,
+                ValidationError,  # invalid UUID
+            ):
+                return None
+
+        if key:
+            add_to_identity_map(instance, db=self.db)
+
+        return instance
+
+    def update(self, touch=False, **kwargs):
+        """
+        Overridden to discard the stale instances from the identity map, the row cache
+        & the caches depending on the model (see `invalidate_model_cache`).
+        With `touch`, also sets the `auto_now` fields (`modified`) like the `save()` does.
+        So the changed rows are seen by the conditional GETs & the delta sync.
+            Model.objects.filter(...).update(status=..., touch=True)
+        """
+
+        if touch:
+            now = timezone.now()
+            for field in self.model._meta.concrete_fields:
+                if isinstance(field, DateTimeField) and field.auto_now and field.name not in kwargs:
+                    kwargs[field.name] = now
+
+        count = super().update(**kwargs)
+
+        # no signals for the queryset updates
+        discard_from_identity_map(self.model)
+        invalidate_row_cache(self.model, using=self.db)
+        invalidate_model_cache(self.model)
+        return count
 
-    def delete(self):
+    def delete(self, user=None):
         """
         Soft-delete the queryset by updating `is_deleted` and `is_active`
-        fields to True and False respectively.
+        fields to True and False respectively. The `deleted_by` is set to
+        the `user`, if given, in the same update. The `modified` is set
+        as well, for the tombstones of the delta sync.
         """
 
-        return super().update(is_deleted=True, is_active=False, deleted_at=timezone.now())
+        return self.update(
+            touch=True,
+            is_deleted=True,
+            is_active=False,
+            deleted=timezone.now(),
+            **get_audit_field_values(self.model, user=user, action="delete"),
+        )
 
     def hard_delete(self):
         """
@@ -118,7 +220,10 @@ class BaseObjectManagerQuerySet(QuerySet):
         of the queryset.
         """
 
-        return super().delete()
+        result = super().delete()
+        discard_from_identity_map(self.model)
+        invalidate_row_cache(self.model, using=self.db)
+        return result
 
     def alive(self):
         """
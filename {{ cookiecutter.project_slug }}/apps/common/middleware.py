@@ -0,0 +1,16 @@
+from apps.common.identity_map import identity_map_scope
+
+
+class IdentityMapMiddleware:
+    """
+    Scopes the identity map (see `apps.common.identity_map`) to the request. The
+    instances loaded by `get_or_none` are shared within the request and are
+    cleared, once the response is returned.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with identity_map_scope():
+            return self.get_response(request)
@@ -1,12 +1,33 @@
-import uuid
 from contextlib import suppress
 
 from django.conf import settings
 from django.core.exceptions import FieldDoesNotExist
 from django.db import models
+from django.db.backends.utils import names_digest
+from django.db.models.signals import class_prepared
+from django.dispatch import receiver
 
+from apps.common.helpers import get_default_uuid
 from apps.common.managers import BaseObjectManagerQuerySet
 from apps.common.models import COMMON_BLANK_AND_NULLABLE_FIELD_CONFIG
+from apps.common.row_cache import register_row_cache_model
+
+# indexes of `BaseObjectManagerQuerySet.alive()`, `BaseObjectManagerQuerySet.active()` & the delta sync
+BASE_MODEL_INDEXES = {
+    "alive": {
+        "fields": ["created", "id"],
+        "condition": models.Q(is_deleted=False),
+    },
+    "active": {
+        "fields": ["created", "id"],
+        "condition": models.Q(is_active=True, is_deleted=False),
+    },
+    # the (modified, id) range of the delta sync | `AppDeltaSyncMixin`
+    "modified": {
+        "fields": ["modified", "id"],
+        "condition": None,
+    },
+}
 
 
 class BaseModel(models.Model):
@@ -20,10 +41,24 @@ class BaseModel(models.Model):
         FK          - created_by, modified_by, deleted_by
         Datetime    - created, modified, deleted
         Boolean     - is_active, is_deleted
+
+    ********************* Model Indexes *********************
+        Unique      - uuid
+        Partial     - alive (not is_deleted), active (is_active and not is_deleted)
+        Composite   - modified (modified, id), for the delta sync
+
+    The base indexes are added to every concrete subclass, see `base_indexes`.
+    To opt out, set `base_indexes` to a subset or []. To extend, define the
+    `Meta.indexes` on the subclass as usual.
+
+    The `uuid` generator is set by the `APP_UUID_GENERATOR` setting. With the time
+    ordered `uuid7`, the inserts are sequential on the index and ordering by `uuid`
+    is roughly the creation order. A model can override the `uuid` field to use
+    a different generator.
     """
 
-    # UUID
-    uuid = models.UUIDField(default=uuid.uuid4, editable=False)
+    # UUID | unique, this is the `lookup_field` for the views
+    uuid = models.UUIDField(default=get_default_uuid, editable=False, unique=True)
 
     # DateTime fields
     created = models.DateTimeField(auto_now_add=True)
@@ -57,9 +92,36 @@ class BaseModel(models.Model):
     # custom manager
     objects = BaseObjectManagerQuerySet.as_manager()
 
+    # indexes for the `alive()` & `active()` querysets & the delta sync | see BASE_MODEL_INDEXES
+    base_indexes = ["alive", "active", "modified"]
+
+    # seconds | enables the `objects.cached()` pk/uuid lookups, for the hot reference rows
+    row_cache_timeout = None
+
     class Meta:
         abstract = True
 
+    @classmethod
+    def get_base_indexes(cls):
+        """
+        Returns the indexes defined by `base_indexes` for the model. The names
+        are generated from the table name, to stay under the 30 chars limit.
+        """
+
+        indexes = []
+        for index_name in cls.base_indexes:
+            config = BASE_MODEL_INDEXES[index_name]
+            digest = names_digest(cls._meta.db_table, *config["fields"], index_name, length=8)
+            indexes.append(
+                models.Index(
+                    fields=config["fields"],
+                    condition=config["condition"],
+                    name=f"{cls._meta.db_table[:15]}_{digest}_{index_name[:3]}",
+                )
+            )
+
+        return indexes
+
     @classmethod
     def get_model_fields(cls):
         """
@@ -93,3 +155,30 @@ class BaseModel(models.Model):
             return cls._meta.get_field(field_name)
 
         return fallback
+
+
+@receiver(class_prepared)
+def add_base_model_indexes(sender, **kwargs):
+    """
+    Adds the `BaseModel.get_base_indexes` to every concrete subclass. This cannot be done
+    on the abstract `Meta.indexes`, because of the index name length limit.
+    """
+
+    if not issubclass(sender, BaseModel) or sender._meta.abstract or sender._meta.proxy:
+        return
+
+    index_names = [index.name for index in sender._meta.indexes]
+    for index in sender.get_base_indexes():
+        if index.name not in index_names:
+            sender._meta.indexes.append(index)
+
+    # the migration autodetector only considers the declared `Meta` options
+    sender._meta.original_attrs["indexes"] = sender._meta.indexes
+
+
+@receiver(class_prepared)
+def register_base_model_row_cache(sender, **kwargs):
+    """Registers the models with the `row_cache_timeout`, in every process on the class creation."""
+
+    if issubclass(sender, BaseModel) and not sender._meta.abstract and sender.row_cache_timeout:
+        register_row_cache_model(sender)
@@ -1,12 +1,517 @@
-from rest_framework.pagination import PageNumberPagination
+import hashlib
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist, ValidationError
+from django.core.paginator import EmptyPage, InvalidPage, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.db.models.lookups import Exact
+from django.db.models.sql.where import AND, WhereNode
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from apps.common.config import PAGINATION_COUNT_CONFIG
+
+COUNT_MODE_AUTO = "auto"
+COUNT_MODE_EXACT = "exact"
+COUNT_MODE_ESTIMATE = "estimate"
+COUNT_MODE_CACHED = "cached"
+
+# filters that does not stop the planner estimate from being used
+ESTIMABLE_FILTER_FIELDS = ["is_deleted", "is_active"]
+
+
+def is_estimable_query(query):
+    """
+    Returns if the planner estimate can be used for the query. That is, the query is
+    unfiltered or filtered only by `is_deleted`/`is_active` on the model's own table.
+    """
+
+    if query.distinct or query.combinator or query.group_by or query.is_sliced:
+        return False
+
+    def _is_estimable_node(node):
+        if node.negated or (node.connector != AND and len(node.children) > 1):
+            return False
+
+        for child in node.children:
+            if isinstance(child, WhereNode):
+                if not _is_estimable_node(child):
+                    return False
+                continue
+
+            lhs = getattr(child, "lhs", None)
+            if (
+                not isinstance(child, Exact)
+                or getattr(lhs, "alias", None) != query.base_table
+                or getattr(getattr(lhs, "target", None), "name", None) not in ESTIMABLE_FILTER_FIELDS
+            ):
+                return False
+
+        return True
+
+    return _is_estimable_node(query.where)
+
+
+def get_estimated_count(queryset):
+    """
+    Returns the PostgreSQL planner estimate of the rows for the queryset. Uses the
+    `reltuples` for the unfiltered queryset and `EXPLAIN` rows for the flag filtered
+    ones. Returns None, if the estimate cannot be used.
+    """
+
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql" or not is_estimable_query(queryset.query):
+        return None
+
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+            estimate = row[0] if row else None
+        else:
+            sql, params = queryset.order_by().values("pk").query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+            plan = json.loads(plan) if isinstance(plan, str) else plan
+            estimate = plan[0]["Plan"]["Plan Rows"]
+
+    # never analyzed tables are -1 or 0 | not reliable
+    if not estimate or estimate < 0:
+        return None
+
+    return int(estimate)
+
+
+def get_queryset_signature(queryset):
+    """Returns the filter signature (the generated sql & params) of the queryset. None, if empty."""
+
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return None
+
+    return hashlib.md5(f"{queryset.db}:{sql}:{params}".encode(), usedforsecurity=False).hexdigest()
+
+
+def get_cached_estimated_count(queryset, timeout):
+    """
+    Returns the `get_estimated_count`, cached per the filter signature for the given
+    `timeout`. So the planner is not queried on every request of the same list.
+    """
+
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql" or not is_estimable_query(queryset.query):
+        return None
+
+    signature = get_queryset_signature(queryset)
+    if signature is None:
+        return None
+
+    key = f"pagination-estimate:{queryset.model._meta.label_lower}:{signature}"
+    estimate = cache.get(key)
+    if estimate is None:
+        estimate = get_estimated_count(queryset) or 0  # 0, not reliable | cached as well
+        cache.set(key, estimate, timeout)
+
+    return estimate or None
+
+
+def get_cached_count(queryset, timeout):
+    """
+    Returns the exact count of the queryset, cached per the filter signature
+    (the generated sql & params) for the given `timeout`.
+    """
+
+    signature = get_queryset_signature(queryset)
+    if signature is None:
+        return 0
+
+    queryset = queryset.order_by()
+    key = f"pagination-count:{queryset.model._meta.label_lower}:{signature}"
+
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout)
+
+    return count
+
+
+class AppPaginator(Paginator):
+    """
+    Django paginator, where the `count` is got from the passed `count_strategy`.
+    The estimated counts does not restrict the page numbers.
+    """
+
+    def __init__(self, object_list, per_page, count_strategy=None, **kwargs):
+        self.count_strategy = count_strategy
+        self.count_mode = COUNT_MODE_EXACT
+        super().__init__(object_list, per_page, **kwargs)
+
+    @cached_property
+    def count(self):
+        """Overridden to use the count strategy, if passed."""
+
+        if not self.count_strategy:
+            return super().count
+
+        count, self.count_mode = self.count_strategy(self.object_list)
+        return count
+
+    @property
+    def is_count_estimated(self):
+        # resolving the `count` sets the `count_mode`
+        return self.count is not None and self.count_mode == COUNT_MODE_ESTIMATE
+
+    def validate_number(self, number):
+        """Overridden to allow the pages after the estimated count."""
+
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if not self.is_count_estimated or int(number) < 1:
+                raise
+
+            return int(number)
+
+    def page(self, number):
+        """Overridden to not cut the last page by the estimated count."""
+
+        if not self.is_count_estimated:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        return self._get_page(self.object_list[bottom:top], number, self)
 
 
 class AppPagination(PageNumberPagination):
     """
     Pagination class used across the app. Every list view uses
     pagination for better performance.
+
+    The `count` is got from the count strategy (see `get_count`), which can be:
+        auto        - the estimate above the `count_estimate_threshold`, else exact
+        exact       - the normal `COUNT(*)`
+        estimate    - the PostgreSQL planner estimate, when applicable
+        cached      - the exact count, cached per filter signature
+
+    The estimates are cached per filter signature for the `count_cache_timeout`. The
+    mode used is sent on the response as `count_mode`. The view can set the mode
+    with the `pagination_count_mode` attribute.
     """
 
     page_size = 24
     page_size_query_param = "page-size"
     max_page_size = 100
+
+    django_paginator_class = AppPaginator
+
+    count_mode = PAGINATION_COUNT_CONFIG["mode"]
+    count_estimate_threshold = PAGINATION_COUNT_CONFIG["estimate_threshold"]
+    count_cache_timeout = PAGINATION_COUNT_CONFIG["cache_timeout"]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Overridden to pass the count strategy to the paginator."""
+
+        self.view = view
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size, count_strategy=self.get_count)
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+
+        if paginator.num_pages > 1 and self.template is not None:
+            # the browsable api should display pagination controls
+            self.display_page_controls = True
+
+        self.request = request
+
+        # unevaluated | the read only list serializers can project it with `.values()`
+        return self.page.object_list
+
+    def get_count_mode(self):
+        """Returns the count mode for the view. Defaults to `count_mode`."""
+
+        return getattr(self.view, "pagination_count_mode", None) or self.count_mode
+
+    def get_count(self, queryset):
+        """
+        The count strategy hook. Returns the `(count, count_mode)` for the queryset.
+        Falls back to the exact count, when the estimate is not applicable.
+        """
+
+        count_mode = self.get_count_mode()
+
+        is_auto = count_mode == COUNT_MODE_AUTO and self.count_estimate_threshold is not None
+        if count_mode == COUNT_MODE_ESTIMATE or is_auto:
+            estimate = get_cached_estimated_count(queryset, timeout=self.count_cache_timeout)
+            if estimate is not None and (not is_auto or estimate >= self.count_estimate_threshold):
+                return estimate, COUNT_MODE_ESTIMATE
+
+        if count_mode == COUNT_MODE_CACHED:
+            return get_cached_count(queryset, timeout=self.count_cache_timeout), COUNT_MODE_CACHED
+
+        return queryset.count(), COUNT_MODE_EXACT
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("count", self.page.paginator.count),
+                    ("count_mode", self.page.paginator.count_mode),
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_mode"] = {
+            "type": "string",
+            "enum": [COUNT_MODE_EXACT, COUNT_MODE_ESTIMATE, COUNT_MODE_CACHED],
+        }
+        return response_schema
+
+
+class AppKeysetPagination(BasePagination):
+    """
+    Keyset (a.k.a seek) pagination on `(ordering_field, id)`. Used for the list views
+    with large tables, where the `OFFSET n` & `COUNT(*)` of `AppPagination` are slow.
+
+    The ordering is taken from the `OrderingFilter` on the view (only the first term
+    is considered) and the `id` is always used as the tie-breaker. The page position
+    is passed around as an opaque `cursor` query param. No count is done.
+
+    Usage on the view class
+        pagination_class = AppKeysetPagination
+
+    Note:
+        The ordering field must be a non-nullable column of the model. The nullable
+        columns & the related lookups (`__`) are not supported, they fallback to
+        the `ordering`. A `NULL` has no position in the `(field, id)` keyset.
+    """
+
+    page_size = 24
+    page_size_query_param = "page-size"
+    max_page_size = 100
+
+    cursor_query_param = "cursor"
+    ordering = "-created"  # used, when the view does not specify any
+    tie_breaker = "id"
+
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Returns the page of results for the passed `cursor`."""
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering_field, self.is_descending = self.get_ordering(request, queryset, view)
+        self.cursor = self.clean_cursor(self.decode_cursor(request), model=queryset.model)
+
+        is_reverse = bool(self.cursor and self.cursor["reverse"])
+        queryset = queryset.order_by(*self.get_order_by(is_reverse=is_reverse))
+        if self.cursor:
+            queryset = queryset.filter(self.get_keyset_filter(self.cursor, is_reverse=is_reverse))
+
+        # one extra row to know if there is a following page
+        results = list(queryset[: self.page_size + 1])
+        has_following = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if is_reverse:
+            results.reverse()
+            self.has_next, self.has_previous = bool(self.cursor), has_following
+        else:
+            self.has_next, self.has_previous = has_following, bool(self.cursor)
+
+        self.page = results
+        return results
+
+    def get_page_size(self, request):
+        """Returns the page size from the `page-size` query param, if valid."""
+
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Returns the `(ordering_field, is_descending)` for the keyset. Respects the
+        `OrderingFilter` on the view, if present.
+        """
+
+        ordering = None
+        for filter_class in getattr(view, "filter_backends", []):
+            if hasattr(filter_class, "get_ordering"):
+                ordering = filter_class().get_ordering(request, queryset, view)
+                break
+
+        if ordering and not isinstance(ordering, str):
+            ordering = ordering[0]
+
+        # related lookups, annotations & nullable columns cannot be used | fallback to the default
+        for _ordering in [ordering, self.ordering]:
+            if not _ordering:
+                continue
+
+            field_name = _ordering.lstrip("-")
+            field = self.get_model_field(queryset.model, field_name) if "__" not in field_name else None
+            if field and not field.null:
+                return field_name, _ordering.startswith("-")
+
+        return self.tie_breaker, False
+
+    @staticmethod
+    def get_model_field(model, field_name):
+        """Returns the concrete model field for the `field_name`, if any."""
+
+        try:
+            field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return None
+
+        return field if field.concrete and not field.many_to_many else None
+
+    def get_order_by(self, is_reverse=False):
+        """Returns the `order_by` args for the keyset, flipped for the previous page."""
+
+        is_descending = self.is_descending != is_reverse
+        prefix = "-" if is_descending else ""
+
+        if self.ordering_field == self.tie_breaker:
+            return [f"{prefix}{self.tie_breaker}"]
+
+        return [f"{prefix}{self.ordering_field}", f"{prefix}{self.tie_breaker}"]
+
+    def get_keyset_filter(self, cursor, is_reverse=False):
+        """
+        Returns the `WHERE (field, id) > (value, id)` equivalent for the cursor.
+        The comparison is flipped for the descending & the previous page.
+        """
+
+        is_descending = self.is_descending != is_reverse
+        lookup = "lt" if is_descending else "gt"
+
+        if self.ordering_field == self.tie_breaker:
+            return Q(**{f"{self.tie_breaker}__{lookup}": cursor["id"]})
+
+        return Q(**{f"{self.ordering_field}__{lookup}": cursor["value"]}) | Q(
+            **{self.ordering_field: cursor["value"], f"{self.tie_breaker}__{lookup}": cursor["id"]}
+        )
+
+    def get_position(self, instance):
+        """Returns the keyset position of the given instance."""
+
+        field = self.get_model_field(instance.__class__, self.ordering_field)
+        return {"value": getattr(instance, field.attname), "id": getattr(instance, self.tie_breaker)}
+
+    def decode_cursor(self, request):
+        """Returns the decoded cursor from the request, if passed."""
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            cursor = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            return {
+                "value": cursor["v"],
+                "id": cursor["i"],
+                "reverse": bool(cursor.get("r", False)),
+            }
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def clean_cursor(self, cursor, model):
+        """Converts the decoded cursor values to python, as per the keyset fields."""
+
+        if not cursor:
+            return cursor
+
+        try:
+            if cursor["value"] is not None:
+                cursor["value"] = self.get_model_field(model, self.ordering_field).to_python(cursor["value"])
+            cursor["id"] = self.get_model_field(model, self.tie_breaker).to_python(cursor["id"])
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return cursor
+
+    def encode_cursor(self, position, reverse=False):
+        """Returns the url with the opaque cursor for the given position."""
+
+        # values are converted back to python on `clean_cursor`
+        value = position["value"]
+        cursor = {"v": None if value is None else str(value), "i": str(position["id"])}
+        if reverse:
+            cursor["r"] = 1
+
+        encoded = urlsafe_b64encode(json.dumps(cursor, separators=(",", ":")).encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        if not self.page:
+            # reversed past the first item | start from the cursor again
+            return self.encode_cursor(self.cursor)
+
+        return self.encode_cursor(self.get_position(self.page[-1]))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+
+        if not self.page:
+            return self.encode_cursor(self.cursor, reverse=True)
+
+        return self.encode_cursor(self.get_position(self.page[0]), reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
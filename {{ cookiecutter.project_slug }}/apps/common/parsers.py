@@ -0,0 +1,43 @@
+import io
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:  # optional | falls back to the stdlib json
+    orjson = None
+
+# integers beyond 64 bit (20+ digits) are parsed as floats by orjson | the digits are
+# found on the body with the other bytes blanked, may match the floats & strings too
+ORJSON_INCOMPATIBLE_INT_DIGITS = b"0" * 20
+DIGITS_TRANSLATION_TABLE = bytes.maketrans(bytes(range(256)), b" " * 48 + b"0" * 10 + b" " * 198)
+
+
+class AppJSONParser(JSONParser):
+    """
+    Applications version of the `JSONParser`. Uses orjson when installed, falls back to
+    the stdlib for the non utf-8 requests, the invalid ones (same error messages) and
+    the ones with the integers beyond 64 bit (orjson parses them as lossy floats).
+    """
+
+    use_orjson = True
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Overridden to parse using orjson, when possible."""
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        if not (orjson and self.use_orjson) or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type=media_type, parser_context=parser_context)
+
+        body = stream.read()
+        if ORJSON_INCOMPATIBLE_INT_DIGITS not in body.translate(DIGITS_TRANSLATION_TABLE):
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                pass
+
+        # invalid or huge ints | the stdlib raises the `ParseError` with its message
+        return super().parse(io.BytesIO(body), media_type=media_type, parser_context=parser_context)
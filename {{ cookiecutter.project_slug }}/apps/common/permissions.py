@@ -0,0 +1,104 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from apps.common.cache import bump_cache_version, get_cache_versions
+from apps.common.config import PERMISSION_CACHE_CONFIG
+
+# version of all the permission sets | bumped on the group permission changes
+PERMISSIONS_CACHE_KEY = "permissions"
+
+
+def get_user_permissions_cache_key(user_pk):
+    return f"{PERMISSIONS_CACHE_KEY}:user:{user_pk}"
+
+
+def load_user_permissions(user) -> frozenset:
+    """Loads the effective permissions (`app_label.codename`) of the user, own & by groups."""
+
+    return frozenset(user.get_all_permissions())
+
+
+def get_user_permissions(user) -> frozenset:
+    """
+    Returns the effective permissions of the user as a frozenset. Loaded once & cached
+    per user, versioned by the user and the global permissions version. So any change
+    on the user's groups/permissions or on a group's permissions is seen immediately.
+    Also memoized on the user instance, for the rest of the request.
+    """
+
+    if not user or not user.is_authenticated:
+        return frozenset()
+
+    permissions = getattr(user, "_app_permissions", None)
+    if permissions is not None:
+        return permissions
+
+    key = get_user_permissions_cache_key(user.pk)
+    versions = get_cache_versions(PERMISSIONS_CACHE_KEY, key)
+    entry = cache.get(key)
+
+    if entry and entry["versions"] == versions:
+        permissions = entry["data"]
+    else:
+        permissions = load_user_permissions(user)
+        cache.set(key, {"versions": versions, "data": permissions}, PERMISSION_CACHE_CONFIG["timeout"])
+
+    user._app_permissions = permissions
+    return permissions
+
+
+def invalidate_user_permissions(*user_pks):
+    """Invalidates the cached permissions of the given users, of all the users if none given."""
+
+    if not user_pks:
+        bump_cache_version(PERMISSIONS_CACHE_KEY)
+
+    for user_pk in user_pks:
+        bump_cache_version(get_user_permissions_cache_key(user_pk))
+
+
+def invalidate_user_permissions_on_m2m_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Receiver for the `m2m_changed` of the user's groups & permissions. Forward, the
+    `instance` is the user. Reverse, the `pk_set` holds the users (None on a clear).
+    """
+
+    if action not in ["post_add", "post_remove", "post_clear"]:
+        return
+
+    if not reverse:
+        invalidate_user_permissions(instance.pk)
+    elif pk_set:
+        invalidate_user_permissions(*pk_set)
+    else:
+        invalidate_user_permissions()
+
+
+def invalidate_all_permissions_on_change(sender, **kwargs):
+    """Receiver for the changes affecting any number of users, like a group's permissions."""
+
+    if kwargs.get("action", "post_").startswith("post_"):
+        invalidate_user_permissions()
+
+
+def invalidate_user_permissions_on_save(sender, instance, **kwargs):
+    """Receiver for the `post_save` of the user, the `is_active` & `is_superuser` changes."""
+
+    invalidate_user_permissions(instance.pk)
+
+
+def register_permission_signals():
+    """
+    Connects the invalidation of the cached permissions, called on the app ready. The
+    signals are connected per sender, the fast deletes of the other models are kept.
+    """
+
+    user_model = get_user_model()
+
+    post_save.connect(invalidate_user_permissions_on_save, sender=user_model)
+    m2m_changed.connect(invalidate_user_permissions_on_m2m_change, sender=user_model.groups.through)
+    m2m_changed.connect(invalidate_user_permissions_on_m2m_change, sender=user_model.user_permissions.through)
+    m2m_changed.connect(invalidate_all_permissions_on_change, sender=Group.permissions.through)
+    post_delete.connect(invalidate_all_permissions_on_change, sender=Group)
@@ -0,0 +1,168 @@
+import datetime
+import decimal
+from collections.abc import Iterator, Mapping
+
+from django.conf import settings
+from django.utils import timezone
+from phonenumber_field.phonenumber import PhoneNumber
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from apps.common.instrumentation import record_timing
+
+try:
+    import orjson
+except ImportError:  # optional | falls back to the stdlib json
+    orjson = None
+
+STREAMING_CHUNK_SIZE = 64 * 1024
+
+# floats written the same by orjson & the stdlib | outside, orjson writes `1e16`, `0.00001` & `null` (NaN)
+# for the `1e+16`, `1e-05` & `NaN` of the stdlib
+ORJSON_COMPATIBLE_FLOAT_RANGE = (1e-4, 1e16)
+
+# scalars without any floats inside | skipped by `has_orjson_incompatible_float`
+ORJSON_SKIPPED_TYPES = frozenset([str, int, bool, type(None)])
+
+
+def has_orjson_incompatible_float(data):
+    """Returns if the data has a float (or decimal) at any depth, which orjson writes differently."""
+
+    low, high = ORJSON_COMPATIBLE_FLOAT_RANGE
+    stack = [data]
+
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+
+        # exact types first | the `isinstance` (`Mapping` mostly) is slow for the scalars
+        if value_type in ORJSON_SKIPPED_TYPES:
+            continue
+        elif value_type is dict:
+            stack.extend(value.values())
+        elif value_type is list:
+            stack.extend(value)
+        elif isinstance(value, (float, decimal.Decimal)):  # the decimals are floats on the encoder
+            value = abs(float(value))
+            if value and not low <= value < high:  # NaN fails the comparison as well
+                return True
+        elif isinstance(value, Mapping):  # `OrderedDict`/`ReturnDict` of the serializers too
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):  # `ReturnList` too
+            stack.extend(value)
+
+    return False
+
+
+class AppJSONEncoder(JSONEncoder):
+    """
+    DRF's `JSONEncoder` with the app's date & time formats and the phone numbers.
+    Also used as the `default` of the orjson backend, keeps both the outputs same.
+    """
+
+    def default(self, obj):
+        """Handles the types not supported by the json backends."""
+
+        if isinstance(obj, datetime.datetime):
+            if timezone.is_aware(obj):
+                obj = timezone.localtime(obj)
+            return obj.strftime(settings.APP_DATETIME_FORMAT)
+
+        if isinstance(obj, datetime.date):
+            return obj.strftime(settings.APP_DATE_FORMAT)
+
+        if isinstance(obj, datetime.time):
+            return obj.strftime(settings.APP_TIME_FORMAT)
+
+        if isinstance(obj, PhoneNumber):
+            return str(obj)
+
+        return super().default(obj)
+
+
+class AppJSONRenderer(JSONRenderer):
+    """
+    Applications version of the `JSONRenderer`. Uses orjson when installed, the output
+    is byte compatible with the stdlib version. Falls back to the stdlib for the
+    things orjson does not support (indented output, ascii, huge ints...) or writes
+    differently (the exponent form floats, NaN & infinity).
+    """
+
+    encoder_class = AppJSONEncoder
+    use_orjson = True
+
+    orjson_options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Overridden to render using orjson, when possible. Timed for the instrumentation."""
+
+        with record_timing("render"):
+            return self._render(data, accepted_media_type=accepted_media_type, renderer_context=renderer_context)
+
+    def _render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            data is None
+            or not (orjson and self.use_orjson)
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type=accepted_media_type, renderer_context=renderer_context)
+
+        # exponent form floats, NaN & infinity | the stdlib raises for NaN on the strict mode
+        if has_orjson_incompatible_float(data):
+            return super().render(data, accepted_media_type=accepted_media_type, renderer_context=renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=self.orjson_options)
+        except (orjson.JSONEncodeError, TypeError):
+            return super().render(data, accepted_media_type=accepted_media_type, renderer_context=renderer_context)
+
+        # same as the `JSONRenderer` | escaped for the javascript
+        if b"\xe2\x80" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+        return ret
+
+
+def _iter_json_parts(value, encoder):
+    """Yields the json parts of the value. The iterators are encoded as arrays, item by item."""
+
+    if isinstance(value, dict):
+        yield "{"
+        for index, (key, item) in enumerate(value.items()):
+            yield f"{',' if index else ''}{encoder.encode(str(key))}:"
+            yield from _iter_json_parts(item, encoder)
+        yield "}"
+
+    elif isinstance(value, (list, tuple, Iterator)):
+        yield "["
+        for index, item in enumerate(value):
+            if index:
+                yield ","
+            yield from _iter_json_parts(item, encoder)
+        yield "]"
+
+    else:
+        yield encoder.encode(value)
+
+
+def iter_json(data, chunk_size=STREAMING_CHUNK_SIZE):
+    """
+    Encodes the data to json as chunks of bytes, for the `StreamingHttpResponse`.
+    The generators in the data (at any depth) are consumed lazily. The encoding
+    is the same as the `AppJSONRenderer` (compact & unicode).
+    """
+
+    encoder = AppJSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    buffer, size = [], 0
+
+    for part in _iter_json_parts(data, encoder):
+        buffer.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield "".join(buffer).replace("\u2028", "\\u2028").replace("\u2029", "\\u2029").encode()
+            buffer, size = [], 0
+
+    if buffer:
+        yield "".join(buffer).replace("\u2028", "\\u2028").replace("\u2029", "\\u2029").encode()
@@ -0,0 +1,113 @@
+import time
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from apps.common.cache import TwoTierCache
+from apps.common.config import ROW_CACHE_CONFIG
+from apps.common.identity_map import get_identity_map_key, get_instance_keys
+
+# column values of the rows by (db, model, version, lookup, value) | None for the missing rows, briefly
+row_cache = TwoTierCache(namespace="rows")
+
+# version per model | bumped on the queryset `update()`/`delete()`, the old keys are never read
+row_cache_versions = TwoTierCache(namespace="row-versions")
+
+# models with the row cache | see `register_row_cache_model`
+_ROW_CACHE_MODELS = set()
+
+
+def is_row_cache_model(model):
+    return model._meta.label_lower in _ROW_CACHE_MODELS
+
+
+def register_row_cache_model(model):
+    """
+    Connects the per row invalidation for the model, on the `BaseModel.row_cache_timeout`.
+    Connected only for these models, the fast deletes of the others are kept.
+    """
+
+    if is_row_cache_model(model):
+        return
+
+    _ROW_CACHE_MODELS.add(model._meta.label_lower)
+    post_save.connect(invalidate_row_cache_on_change, sender=model)
+    post_delete.connect(invalidate_row_cache_on_change, sender=model)
+
+
+def get_row_cache_version(model):
+    return row_cache_versions.get_or_set(model._meta.label_lower, time.time_ns, timeout=None)
+
+
+def get_row_cache_key(identity_key, version):
+    """The cache key for the identity map key (db, model, lookup, value) of the row."""
+
+    db, label, lookup, value = identity_key
+    return f"{db}:{label}:{version}:{lookup}:{value}"
+
+
+def get_row_values(instance) -> dict:
+    return {_.attname: getattr(instance, _.attname) for _ in instance._meta.concrete_fields}
+
+
+def get_instance_from_row_values(model, values, db):
+    return model.from_db(db, [*values.keys()], [*values.values()])
+
+
+def get_from_row_cache(queryset, args, kwargs, timeout):
+    """
+    Returns the (is cacheable, instance) for the `get` lookup on the queryset. On a miss,
+    the row is loaded by one worker at a time (see `TwoTierCache.get_or_set`). Only the
+    pk & uuid lookups on the plain querysets are cacheable, like the identity map.
+    """
+
+    identity_key = get_identity_map_key(queryset, args, kwargs)
+    if identity_key is None:
+        return False, None
+
+    def _load_row_values():
+        instance = queryset.filter(*args, **kwargs).first()
+        return get_row_values(instance) if instance else None
+
+    # the misses are cached briefly | the `bulk_create` inserts send no signal
+    db, model = identity_key[0], queryset.model
+    values = row_cache.get_or_set(
+        get_row_cache_key(identity_key, get_row_cache_version(model)),
+        _load_row_values,
+        timeout=timeout,
+        none_timeout=min(timeout, ROW_CACHE_CONFIG["miss_timeout"]),
+    )
+
+    return True, get_instance_from_row_values(model, values, db) if values else None
+
+
+def invalidate_row_cache(model, instance=None, using="default"):
+    """
+    Invalidates the cached row of the instance (by pk & uuid), or all the rows of the
+    model if not given. Done again after the commit, a concurrent request can not
+    cache the row from before the change.
+    """
+
+    if not is_row_cache_model(model):
+        return
+
+    # the keys are taken now | the pk is cleared by the `delete()`
+    identity_keys = get_instance_keys(instance, db=instance._state.db or using) if instance else None
+
+    def _invalidate():
+        if identity_keys is None:
+            row_cache_versions.set(model._meta.label_lower, time.time_ns(), timeout=None)
+            return
+
+        version = get_row_cache_version(model)
+        row_cache.delete(*[get_row_cache_key(_, version) for _ in identity_keys])
+
+    _invalidate()
+    if transaction.get_connection(using).in_atomic_block:
+        transaction.on_commit(_invalidate, using=using)
+
+
+def invalidate_row_cache_on_change(sender, instance, **kwargs):
+    """Receiver for the `post_save` & `post_delete` of the row cache models."""
+
+    invalidate_row_cache(sender, instance=instance, using=kwargs.get("using") or "default")
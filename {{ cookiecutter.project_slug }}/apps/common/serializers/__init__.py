@@ -1,8 +1,11 @@
 # flake8: noqa
 from .base import (
+    AppListSerializer,
+    AppReadOnlyListSerializer,
     AppReadOnlyModelSerializer,
     AppWriteOnlyModelSerializer,
     AppModelSerializer,
     simple_serialize_queryset,
+    iter_serialize_queryset,
 )
 from .common import SimpleUserSerializer
@@ -1,41 +1,76 @@
+from contextlib import suppress
+
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models
 from rest_framework import serializers
 from rest_framework.fields import SkipField
+from rest_framework.relations import PrimaryKeyRelatedField
 from rest_framework.serializers import ModelSerializer, Serializer
 
 from apps.common import model_fields
+from apps.common.audit import get_audit_field_values
 from apps.common.config import CUSTOM_ERRORS_MESSAGES
+from apps.common.identity_map import batch_load_foreign_keys
+from apps.common.instrumentation import record_timing
+from apps.common.serializers.projection import get_projection
 
 
 class CustomErrorMessagesMixin:
     """
-    Overrides the constructor of the serializer to add meaningful error
+    Overrides the `get_fields` of the serializer to add meaningful error
     messages to the serializer output. Also used to hide security
     related messages to the user.
+
+    Note:
+        The messages are computed once per serializer class & field, see
+        `get_error_messages_overrides`. Only applied to the built fields.
     """
 
     def get_display(self, field_name):
         return field_name.replace("_", " ")
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # adding custom error messages
-        for field_name, field in getattr(self, "fields", {}).items():
-            if field.__class__.__name__ == "ManyRelatedField":
+    def get_error_messages_overrides(self, field_name, field_class):
+        """
+        Returns the (field, child relation) error messages for the given field. Cached
+        on the serializer class, keyed by the field name and the field class.
+        """
+
+        cache = self.__class__.__dict__.get("_error_messages_overrides")
+        if cache is None:
+            cache = {}
+            setattr(self.__class__, "_error_messages_overrides", cache)
+
+        key = (field_name, field_class)
+        if key not in cache:
+            if field_class.__name__ == "ManyRelatedField":
                 # many-to-many | uses foreign key field for children
-                field.error_messages.update(CUSTOM_ERRORS_MESSAGES["ManyRelatedField"])
-                field.child_relation.error_messages.update(CUSTOM_ERRORS_MESSAGES["PrimaryKeyRelatedField"])
-            elif field.__class__.__name__ == "PrimaryKeyRelatedField":
+                cache[key] = (
+                    CUSTOM_ERRORS_MESSAGES["ManyRelatedField"],
+                    CUSTOM_ERRORS_MESSAGES["PrimaryKeyRelatedField"],
+                )
+            elif field_class.__name__ == "PrimaryKeyRelatedField":
                 # foreign-key
-                field.error_messages.update(CUSTOM_ERRORS_MESSAGES["PrimaryKeyRelatedField"])
+                cache[key] = (CUSTOM_ERRORS_MESSAGES["PrimaryKeyRelatedField"], None)
             else:
                 # other input-fields
-                field.error_messages.update(
-                    {
-                        "blank": f"Please enter your {self.get_display(field_name)}",
-                        "null": f"Please enter your {self.get_display(field_name)}",
-                    }
-                )
+                message = f"Please enter your {self.get_display(field_name)}"
+                cache[key] = ({"blank": message, "null": message}, None)
+
+        return cache[key]
+
+    def get_fields(self):
+        """Overridden to add the custom error messages to the fields."""
+
+        fields = super().get_fields()
+
+        for field_name, field in fields.items():
+            overrides, child_overrides = self.get_error_messages_overrides(field_name, field.__class__)
+
+            field.error_messages.update(overrides)
+            if child_overrides:
+                field.child_relation.error_messages.update(child_overrides)
+
+        return fields
 
 
 class AppSerializer(CustomErrorMessagesMixin, Serializer):
@@ -58,6 +93,13 @@ class AppSerializer(CustomErrorMessagesMixin, Serializer):
 
         return _data
 
+    @property
+    def data(self):
+        """Overridden to time the serialization, for the instrumentation."""
+
+        with record_timing("serialize"):
+            return super().data
+
     def get_user(self):
         """Return the user from the request."""
 
@@ -69,6 +111,15 @@ class AppSerializer(CustomErrorMessagesMixin, Serializer):
         return self.context.get("request", None)
 
 
+class AppListSerializer(serializers.ListSerializer):
+    """Applications version of the `ListSerializer`. Times the serialization, for the instrumentation."""
+
+    @property
+    def data(self):
+        with record_timing("serialize"):
+            return super().data
+
+
 class AppModelSerializer(AppSerializer, ModelSerializer):
     """
     Applications version of the ModelSerializer. There are separate serializers
@@ -79,7 +130,7 @@ class AppModelSerializer(AppSerializer, ModelSerializer):
     """
 
     class Meta:
-        pass
+        list_serializer_class = AppListSerializer
 
 
 class AppWriteOnlyModelSerializer(AppModelSerializer):
@@ -92,18 +143,20 @@ class AppWriteOnlyModelSerializer(AppModelSerializer):
     """
 
     def create(self, validated_data):
-        """Overridden to set the `created_by` field."""
+        """Overridden to set the audit fields (`created_by`...), saved with the same insert."""
+
+        return super().create(validated_data=self.get_audited_data(validated_data, action="create"))
 
-        instance = super().create(validated_data=validated_data)
+    def update(self, instance, validated_data):
+        """Overridden to set the audit fields (`updated_by`), saved with the same update."""
 
-        # setting the anonymous fields
-        if hasattr(instance, "created_by") and not instance.created_by:
-            user = self.get_user()
+        return super().update(instance, validated_data=self.get_audited_data(validated_data, action="update"))
 
-            instance.created_by = user if user and user.is_authenticated else None
-            instance.save()
+    def get_audited_data(self, validated_data, action) -> dict:
+        """Returns the validated data with the audit fields of the action. The given values are kept."""
 
-        return instance
+        user = self.get_user() if self.get_request() else None
+        return {**get_audit_field_values(self.Meta.model, user=user, action=action), **validated_data}
 
     def get_validated_data(self, key=None):
         """Central function to return the validated data."""
@@ -112,13 +165,36 @@ class AppWriteOnlyModelSerializer(AppModelSerializer):
             return self.validated_data
         return self.validated_data[key]
 
-    def __init__(self, *args, **kwargs):
-        # all fields are required
-        for field in self.Meta.fields:
-            self.Meta.extra_kwargs.setdefault(field, {})
-            self.Meta.extra_kwargs[field]["required"] = True
+    def __init_subclass__(cls, **kwargs):
+        """Compiles the `Meta.extra_kwargs` once per class, all fields are required."""
+
+        super().__init_subclass__(**kwargs)
+
+        # no own `Meta` | the parent's is used as is, never mutated
+        if "Meta" not in cls.__dict__:
+            return
+
+        fields = getattr(cls.Meta, "fields", None)
+        if not isinstance(fields, (list, tuple)):
+            return
+
+        # new dict | the parent's `Meta.extra_kwargs` is never mutated
+        extra_kwargs = {k: {**v} for k, v in getattr(cls.Meta, "extra_kwargs", {}).items()}
+        for field in fields:
+            extra_kwargs[field] = {**extra_kwargs.get(field, {}), "required": True}
+
+        cls.Meta.extra_kwargs = extra_kwargs
+
+    def get_extra_kwargs(self):
+        """Overridden to compute the drf's extra kwargs once per class. Copies are returned."""
 
-        super().__init__(*args, **kwargs)
+        extra_kwargs = self.__class__.__dict__.get("_extra_kwargs")
+        if extra_kwargs is None:
+            extra_kwargs = super().get_extra_kwargs()
+            setattr(self.__class__, "_extra_kwargs", extra_kwargs)
+
+        # drf pops keys from these | per field copies
+        return {k: {**v} for k, v in extra_kwargs.items()}
 
     class Meta(AppModelSerializer.Meta):
         model = None
@@ -158,12 +234,18 @@ class AppWriteOnlyModelSerializer(AppModelSerializer):
 
         return [{"id": _, "identity": get_display_name_for_slug(_)} for _ in choices]
 
-    def serialize_for_meta(self, queryset, fields=None):
-        """Central serializer for the `get_meta`. Just a dry function."""
+    def serialize_for_meta(self, queryset, fields=None, stream=False):
+        """
+        Central serializer for the `get_meta`. Just a dry function. With `stream`,
+        a generator is returned, for the streaming responses (not for the cached meta).
+        """
 
         if not fields:
             fields = ["id", "identity"]
 
+        if stream:
+            return iter_serialize_queryset(fields=fields, queryset=queryset)
+
         return simple_serialize_queryset(fields=fields, queryset=queryset)
 
     def get_meta(self) -> dict:
@@ -197,34 +279,68 @@ class AppWriteOnlyModelSerializer(AppModelSerializer):
             "urls": self.get_meta_urls(),  # file & images
         }
 
+    def get_meta_relations(self) -> dict:
+        """
+        Returns the relations (model fields) of the serializer fields. The plan
+        for the `prefetch_meta_relations`, computed once per serializer.
+        """
+
+        if not hasattr(self, "_meta_relations"):
+            model = self.Meta.model
+            self._meta_relations = {}
+
+            for field_name in self.fields.keys():
+                field = model.get_model_field(field_name)
+                if field and field.related_model:
+                    self._meta_relations[field_name] = field
+
+        return self._meta_relations
+
+    def prefetch_meta_relations(self):
+        """
+        Prefetches the relations needed by the `get_meta_initial` & `get_meta_urls`
+        in a single pass, a query per relation. The many-to-many ids and the file
+        relations are fetched, the relations already prefetched/selected by the
+        view are reused (skipped by django).
+        """
+
+        if getattr(self, "_meta_relations_prefetched", False):
+            return
+
+        lookups = [
+            field_name
+            for field_name, field in self.get_meta_relations().items()
+            if field.many_to_many or hasattr(field.related_model, "file")
+        ]
+        if lookups:
+            models.prefetch_related_objects([self.instance], *lookups)
+
+        self._meta_relations_prefetched = True
+
     def get_meta_urls(self) -> dict:
         """
         Returns the file/image urls for the necessary fields for the FE.
         Just used for displaying for the front-end.
         """
 
+        self.prefetch_meta_relations()
         instance = self.instance
         urls = []
 
-        for field_name, field in self.fields.items():
-            field = self.Meta.model.get_model_field(field_name)
+        for field_name, field in self.get_meta_relations().items():
+            # only the file models | see `prefetch_meta_relations`
+            if not hasattr(field.related_model, "file"):
+                continue
 
-            # Check if the field is a ForeignKey or a ManyToManyField
-            if field and field.related_model:
-                related_instance = getattr(instance, field_name, None)
+            related_instance = getattr(instance, field_name, None)
 
-                # Handle ManyToManyField case
-                if isinstance(related_instance, (models.Manager, models.QuerySet)):
-                    url_list = [
-                        {field_name: item.file.url, "id": item.id}
-                        for item in related_instance.all()
-                        if hasattr(item, "file") and item.file
-                    ]
-                    urls.extend(url_list)
+            # Handle ManyToManyField case | prefetched
+            if isinstance(related_instance, (models.Manager, models.QuerySet)):
+                urls.extend({field_name: item.file.url, "id": item.id} for item in related_instance.all() if item.file)
 
-                # Handle ForeignKey case
-                elif related_instance and hasattr(related_instance, "file") and related_instance.file:
-                    urls.append({field_name: related_instance.file.url, "id": related_instance.id})
+            # Handle ForeignKey case
+            elif related_instance and related_instance.file:
+                urls.append({field_name: related_instance.file.url, "id": related_instance.id})
 
         return urls
 
@@ -234,31 +350,81 @@ class AppWriteOnlyModelSerializer(AppModelSerializer):
         used by the front-end for setting initial values.
         """
 
+        self.prefetch_meta_relations()
         instance = self.instance
-        initial = {
-            field_name: getattr(instance, field_name, None) for field_name in ["id", "uuid", *self.fields.keys()]
-        }
+        initial = {}
 
         # simplify for FE
-        for k, v in initial.items():
-            # foreignkey
-            if hasattr(initial[k], "pk"):
-                initial[k] = v.pk
+        for field_name in dict.fromkeys(["id", "uuid", *self.fields.keys()]):
+            field = instance.__class__.get_model_field(field_name, None)
 
-            # not a model field
-            if not instance.__class__.get_model_field(k, None):
-                continue
+            # many-to-many | prefetched
+            if field and field.many_to_many:
+                initial[field_name] = [_.pk for _ in getattr(instance, field_name).all()]
+
+            # foreignkey | the id column, no query
+            elif field and field.concrete and field.is_relation and field.target_field.primary_key:
+                initial[field_name] = getattr(instance, field.attname)
 
-            # many-to-many
-            if instance.__class__.get_model_field(k).many_to_many:
-                initial[k] = getattr(instance, k).values_list("pk", flat=True)
+            elif field and field.__class__ == model_fields.AppPhoneNumberField:
+                value = getattr(instance, field_name)
+                initial[field_name] = value.raw_input if value else None
 
-            if instance.__class__.get_model_field(k).__class__ == model_fields.AppPhoneNumberField:
-                initial[k] = getattr(instance, k).raw_input if getattr(instance, k) else None
+            else:
+                value = getattr(instance, field_name, None)
+                initial[field_name] = value.pk if hasattr(value, "pk") else value
 
         return initial
 
 
+class AppReadOnlyListSerializer(AppListSerializer):
+    """
+    List serializer for the `AppReadOnlyModelSerializer`. When all the fields of the
+    child map to plain columns (or the pk of required relations), the queryset is
+    serialized from a `.values()` projection, no model instances are created.
+    Falls back to the drf's way for anything else, see `get_projection`.
+
+    Set `Meta.values_projection = False` on the child serializer to disable.
+    """
+
+    def to_representation(self, data):
+        """Overridden to serialize from the `.values()` projection, when possible."""
+
+        queryset = data.all() if isinstance(data, models.manager.BaseManager) else data
+
+        if getattr(self.child.Meta, "values_projection", True):
+            projection = get_projection(self.child, queryset)
+            if projection:
+                return list(projection.iter_rows(queryset))
+
+        # related objects of the rows | an `IN` query per fk, not a query per row
+        instances = list(queryset)
+        if instances and isinstance(instances[0], models.Model):
+            batch_load_foreign_keys(instances, self.get_batch_loaded_foreign_keys(instances[0].__class__))
+
+        return super().to_representation(instances)
+
+    def get_batch_loaded_foreign_keys(self, model) -> list:
+        """Returns the forward fks of the model, whose related objects are used by the child."""
+
+        field_names = []
+        for field in self.child._readable_fields:
+            if not field.source_attrs or field.source == "*":
+                continue
+
+            with suppress(FieldDoesNotExist):
+                model_field = model._meta.get_field(field.source_attrs[0])
+
+                # the pk of the relation is enough | drf's pk only optimization
+                if len(field.source_attrs) == 1 and type(field) is PrimaryKeyRelatedField:
+                    continue
+
+                if model_field.concrete and (model_field.many_to_one or model_field.one_to_one):
+                    field_names.append(model_field.name)
+
+        return list(dict.fromkeys(field_names))
+
+
 class AppReadOnlyModelSerializer(AppModelSerializer):
     """
     Read only version of the `AppModelSerializer`. Does not
@@ -266,10 +432,11 @@ class AppReadOnlyModelSerializer(AppModelSerializer):
 
     Note:
         Never mix the `read` and `write` serializers, handle them separate.
+        With `many=True`, the lists are served from `.values()` when possible.
     """
 
     class Meta(AppModelSerializer.Meta):
-        pass
+        list_serializer_class = AppReadOnlyListSerializer
 
     def create(self, validated_data):
         raise NotImplementedError
@@ -310,12 +477,33 @@ def simple_serialize_queryset(fields, queryset):
     """Lightweight queryset serializer. Also implements performance booster."""
 
     if "id" in fields:
-        # performance booster
-        return [{**_, "id": str(_["id"])} for _ in queryset.only(*fields).values(*fields)]
+        # performance booster | converted in place, no new dict per row
+        rows = list(queryset.only(*fields).values(*fields))
+        for row in rows:
+            row["id"] = str(row["id"])
+        return rows
 
     return queryset.only(*fields).values(*fields)
 
 
+def iter_serialize_queryset(fields, queryset, chunk_size=2000):
+    """
+    Generator version of the `simple_serialize_queryset`. The rows are streamed from the
+    database in chunks, the whole result is never held in memory. Can be passed as is
+    to the `send_streaming_response` of the views.
+    """
+
+    rows = queryset.only(*fields).values(*fields).iterator(chunk_size=chunk_size)
+
+    if "id" not in fields:
+        yield from rows
+        return
+
+    for row in rows:
+        row["id"] = str(row["id"])
+        yield row
+
+
 def simple_serialize_instance(instance, keys: list, parent_data: dict = None, display=None) -> dict:
     """
     Given a single object/instance, this will serialize the same.
@@ -0,0 +1,222 @@
+import logging
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField, RelatedField
+
+from apps.common.cache import LRUCache
+from apps.common.config import QUERY_PLAN_CACHE_CONFIG
+from apps.common.serializers.base import AppReadOnlyModelSerializer
+
+logger = logging.getLogger(__name__)
+
+# plans per (serializer class, model) | only for the classes with the same fields always
+QUERY_PLANS = LRUCache(maxsize=QUERY_PLAN_CACHE_CONFIG["size"], timeout=QUERY_PLAN_CACHE_CONFIG["timeout"])
+
+# modules of the base serializers | their `__init__` & `get_fields` do not change the fields per instance
+STATIC_FIELDS_SERIALIZER_MODULES = [
+    "builtins",
+    "rest_framework.fields",
+    "rest_framework.serializers",
+    "apps.common.serializers.base",
+]
+
+
+class QueryPlan:
+    """
+    The `select_related`, `prefetch_related` & `only` calls for a queryset, derived from
+    the fields of a serializer. The `skipped` holds the reasons for the things that
+    could not be planned (methods, properties...), just for the report.
+    """
+
+    def __init__(self, select_related=None, prefetch_related=None, only=None, skipped=None):
+        self.select_related = list(dict.fromkeys(select_related or []))
+        self.prefetch_related = list(dict.fromkeys(prefetch_related or []))
+        self.only = list(dict.fromkeys(only)) if only is not None else None
+        self.skipped = skipped or []
+
+    def apply(self, queryset, extra_only=()):
+        """Returns the queryset with the plan applied. `extra_only`, columns used outside the serializer."""
+
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+
+        # the view's own `only`/`defer` is kept
+        if self.only and queryset.query.deferred_loading == (frozenset(), True):
+            extra_only = [_ for _ in extra_only if _ in self.get_field_names(queryset.model)]
+            queryset = queryset.only(*self.only, *extra_only)
+
+        return queryset
+
+    @staticmethod
+    def get_field_names(model) -> set:
+        return {name for _ in model._meta.concrete_fields for name in [_.name, _.attname]}
+
+    def get_report(self) -> dict:
+        """Returns the plan as a dict, for the debugging."""
+
+        return {
+            "select_related": self.select_related,
+            "prefetch_related": self.prefetch_related,
+            "only": self.only,
+            "skipped": self.skipped,
+        }
+
+
+class QueryPlanner:
+    """
+    Walks the readable fields of the serializer (dotted sources & nested serializers)
+    and builds the `QueryPlan` for the given model.
+
+        forward fk/o2o              - select_related (prefetch, if under a many relation)
+        m2m/reverse fk              - prefetch_related
+        pk related fields           - just the fk column, no join
+        methods/properties/`*`      - skipped, `only` is not used
+        custom `to_representation`  - skipped, `only` is not used (any attribute can be read)
+    """
+
+    def __init__(self, serializer, model):
+        self.serializer = serializer
+        self.model = model
+        self.select_related, self.prefetch_related, self.only, self.skipped = [], [], [], []
+        self.can_restrict_columns = True
+
+    def plan(self) -> QueryPlan:
+        self.walk(self.serializer, self.model, path=[], is_prefetched=False)
+
+        # columns are restricted only for the read only serializers
+        restrict_columns = self.can_restrict_columns and (
+            isinstance(self.serializer, AppReadOnlyModelSerializer)
+            or all(_.read_only for _ in self.serializer.fields.values())
+        )
+
+        return QueryPlan(
+            select_related=self.select_related,
+            prefetch_related=self.prefetch_related,
+            only=[self.model._meta.pk.name, *self.only] if restrict_columns else None,
+            skipped=self.skipped,
+        )
+
+    def skip(self, path, reason):
+        self.skipped.append(f"{'.'.join(path)}: {reason}")
+        self.can_restrict_columns = False
+
+    def add_column(self, path, is_prefetched):
+        """Adds the column to the `only`. Only the base model & the selected relations are restricted."""
+
+        if not is_prefetched:
+            self.only.append("__".join(path))
+
+    def add_relation(self, path, is_prefetched):
+        """Adds the relation to `select_related` or `prefetch_related`, replacing the shorter ones."""
+
+        lookup = "__".join(path)
+        target = self.prefetch_related if is_prefetched else self.select_related
+
+        target[:] = [_ for _ in target if not lookup.startswith(f"{_}__")]
+        if not any(_ == lookup or _.startswith(f"{lookup}__") for _ in target):
+            target.append(lookup)
+
+    def walk(self, serializer, model, path, is_prefetched):
+        """Plans the fields of the given serializer, `path` is the lookup till the `model`."""
+
+        if isinstance(serializer, serializers.ListSerializer):
+            serializer = serializer.child
+
+        # same check as the `get_projection`
+        if type(serializer).to_representation is not serializers.Serializer.to_representation:
+            self.skip(path or [type(serializer).__name__], "custom to_representation")
+
+        for field in serializer.fields.values():
+            if field.write_only:
+                continue
+
+            if field.source == "*":
+                if isinstance(field, serializers.BaseSerializer):
+                    self.walk(field, model, path=path, is_prefetched=is_prefetched)
+                else:
+                    self.skip([*path, field.field_name], "uses the whole object")
+                continue
+
+            self.walk_field(field, model, path=path, is_prefetched=is_prefetched)
+
+    def walk_field(self, field, model, path, is_prefetched):
+        """Plans a single field, by following its `source_attrs` through the relations."""
+
+        hops = field.source_attrs
+
+        for index, attr in enumerate(hops):
+            is_last = index == len(hops) - 1
+
+            try:
+                model_field = model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                self.skip([*path, *hops[: index + 1]], "not a model field (method/property)")
+                return
+
+            # plain column
+            if not model_field.is_relation:
+                if is_last:
+                    self.add_column([*path, attr], is_prefetched)
+                else:
+                    self.skip([*path, *hops[: index + 1]], "attribute of a column")
+                return
+
+            # the pk of the relation is enough | drf's pk only optimization
+            if is_last and type(field) is PrimaryKeyRelatedField and model_field.concrete:
+                self.add_column([*path, attr], is_prefetched)
+                return
+
+            if model_field.concrete and not model_field.many_to_many:
+                self.add_column([*path, attr], is_prefetched)
+
+            path = [*path, attr]
+            is_prefetched = is_prefetched or model_field.many_to_many or model_field.one_to_many
+            self.add_relation(path, is_prefetched)
+            model = model_field.related_model
+
+        if isinstance(field, serializers.BaseSerializer):
+            self.walk(field, model, path=path, is_prefetched=is_prefetched)
+
+        elif not isinstance(field, (RelatedField, ManyRelatedField)):
+            # a relation rendered by a plain field | uses the `__str__`
+            self.skip(path, "relation rendered as a value")
+
+
+def has_static_fields(serializer_class) -> bool:
+    """
+    Returns if the serializer class has the same fields for every instance & context. Not,
+    if the `__init__`/`get_fields` is overridden outside the base serializers or the class
+    is generated on the runtime (`get_app_read_only_serializer`).
+    """
+
+    if "<locals>" in serializer_class.__qualname__:
+        return False
+
+    return all(
+        _.__module__ in STATIC_FIELDS_SERIALIZER_MODULES
+        for _ in serializer_class.__mro__
+        if "__init__" in vars(_) or "get_fields" in vars(_)
+    )
+
+
+def get_query_plan(serializer_class, model, context=None) -> QueryPlan:
+    """
+    Returns the `QueryPlan` of the serializer class for the model. Cached per class for the
+    ones with the static fields, the others are planned with the given `context` per call.
+    """
+
+    if not has_static_fields(serializer_class):
+        return QueryPlanner(serializer_class(context=context or {}), model).plan()
+
+    key = (serializer_class, model)
+    plan = QUERY_PLANS.get(key)
+    if plan is None:
+        plan = QueryPlanner(serializer_class(context=context or {}), model).plan()
+        QUERY_PLANS.set(key, plan)
+        logger.debug("Query plan for %s on %s: %s", serializer_class.__name__, model.__name__, plan.get_report())
+
+    return plan
@@ -0,0 +1,127 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
+from django.db.models.query import ModelIterable
+from django.db.models.query_utils import DeferredAttribute
+from rest_framework import serializers
+from rest_framework.relations import PKOnlyObject, PrimaryKeyRelatedField
+
+# serializer fields with a pure `to_representation` | exact classes, not the subclasses
+PROJECTABLE_FIELD_CLASSES = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.DateField,
+    serializers.DateTimeField,
+    serializers.DecimalField,
+    serializers.EmailField,
+    serializers.FloatField,
+    serializers.IntegerField,
+    serializers.ReadOnlyField,
+    serializers.SlugField,
+    serializers.TimeField,
+    serializers.URLField,
+    serializers.UUIDField,
+)
+
+
+class Projection:
+    """
+    A compiled `.values()` projection of a read only serializer. Holds the lookups
+    for the `.values()` and the (field name, lookup, converter) for every field.
+    """
+
+    def __init__(self, columns: list):
+        self.columns = columns
+        self.lookups = list(dict.fromkeys(lookup for _, lookup, _ in columns))
+
+    def iter_rows(self, queryset):
+        """Yields the serialized rows of the queryset, no model instances are created."""
+
+        columns = self.columns
+        for row in queryset.prefetch_related(None).values(*self.lookups):
+            yield {name: None if row[lookup] is None else convert(row[lookup]) for name, lookup, convert in columns}
+
+
+def _pk_only_converter(field):
+    """Returns the converter for a `PrimaryKeyRelatedField`, same as its `to_representation`."""
+
+    to_representation = field.to_representation
+    return lambda value: to_representation(PKOnlyObject(pk=value))
+
+
+def get_field_lookup(model, field):
+    """
+    Resolves the `source_attrs` of the serializer field to a `.values()` lookup & its converter.
+    Returns None, if the field can not be projected (methods, properties, nullable hops...).
+    """
+
+    if not field.source_attrs or field.source == "*":
+        return None
+
+    *hops, last = field.source_attrs
+
+    lookups = []
+    for hop in hops:
+        try:
+            model_field = model._meta.get_field(hop)
+        except FieldDoesNotExist:
+            return None
+
+        # only the forward & required relations | a null hop is handled differently by drf
+        if not (model_field.many_to_one or model_field.one_to_one) or not model_field.concrete or model_field.null:
+            return None
+
+        lookups.append(hop)
+        model = model_field.related_model
+
+    try:
+        model_field = model._meta.get_field(last)
+    except FieldDoesNotExist:
+        return None
+
+    if not model_field.concrete or model_field.many_to_many:
+        return None
+
+    # custom descriptors (files, phone numbers...) | the attribute differs from the column value
+    descriptor = next(
+        (_.__dict__[model_field.attname] for _ in model.__mro__ if model_field.attname in _.__dict__), None
+    )
+    if not isinstance(descriptor, DeferredAttribute):
+        return None
+
+    if type(field) is PrimaryKeyRelatedField:
+        if not model_field.is_relation:
+            return None
+        return "__".join([*lookups, model_field.attname]), _pk_only_converter(field)
+
+    if type(field) not in PROJECTABLE_FIELD_CLASSES or model_field.is_relation:
+        return None
+
+    return "__".join([*lookups, last]), field.to_representation
+
+
+def get_projection(serializer, queryset):
+    """
+    Compiles the given read only (child) serializer into a `Projection` for the queryset.
+    Returns None, if the serializer or the queryset can not be handled by the `.values()`.
+    """
+
+    if (
+        not isinstance(queryset, QuerySet)
+        or queryset._result_cache is not None
+        or queryset._iterable_class is not ModelIterable
+        or queryset.query.distinct
+        or queryset.query.combinator
+        or queryset.model is not getattr(serializer.Meta, "model", None)
+        or type(serializer).to_representation is not serializers.Serializer.to_representation
+    ):
+        return None
+
+    columns = []
+    for field in serializer._readable_fields:
+        lookup = get_field_lookup(queryset.model, field)
+        if not lookup:
+            return None
+        columns.append((field.field_name, *lookup))
+
+    return Projection(columns=columns)
@@ -0,0 +1,103 @@
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import permissions
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.access.models import User
+from apps.common.managers import BaseObjectManagerQuerySet
+from apps.common.serializers import AppWriteOnlyModelSerializer
+from apps.common.views import AppModelCUDAPIViewSet
+
+
+class _UserSerializer(AppWriteOnlyModelSerializer):
+    class Meta(AppWriteOnlyModelSerializer.Meta):
+        model = User
+        fields = ["email"]
+
+
+class _AuditedUserSerializer(AppWriteOnlyModelSerializer):
+    class Meta(AppWriteOnlyModelSerializer.Meta):
+        model = User
+        fields = ["email", "updated_by"]
+
+
+class _UserCUDAPIViewSet(AppModelCUDAPIViewSet):
+    permission_classes = [permissions.AllowAny]
+    queryset = BaseObjectManagerQuerySet(model=User).filter(is_deleted=False)
+    serializer_class = _UserSerializer
+
+
+class AuditFieldsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email="user@example.com")
+
+    def get_serializer(self, user, serializer_class=_UserSerializer, **kwargs):
+        request = APIRequestFactory().post("/")
+        request.user = user
+        return serializer_class(context={"request": request}, **kwargs)
+
+    def save(self, serializer):
+        self.assertTrue(serializer.is_valid())
+        with CaptureQueriesContext(connection) as context:
+            instance = serializer.save()
+
+        writes = [_["sql"].split()[0] for _ in context.captured_queries if _["sql"].startswith(("INSERT", "UPDATE"))]
+        return User.objects.get(pk=instance.pk), writes
+
+    def test_create(self):
+        instance, writes = self.save(self.get_serializer(self.user, data={"email": "new@example.com"}))
+
+        self.assertEqual(writes, ["INSERT"])
+        self.assertEqual((instance.created_by, instance.updated_by), (self.user, self.user))
+
+    def test_create_anonymous(self):
+        instance, writes = self.save(self.get_serializer(AnonymousUser(), data={"email": "new@example.com"}))
+
+        self.assertEqual(writes, ["INSERT"])
+        self.assertEqual((instance.created_by, instance.updated_by), (None, None))
+
+    def test_update(self):
+        instance = User.objects.create(email="old@example.com")
+        instance, writes = self.save(
+            self.get_serializer(self.user, instance=instance, data={"email": "new@example.com"})
+        )
+
+        self.assertEqual(writes, ["UPDATE"])
+        self.assertEqual((instance.created_by, instance.updated_by), (None, self.user))
+
+    def test_soft_delete(self):
+        instance = User.objects.create(email="old@example.com")
+        queryset = BaseObjectManagerQuerySet(model=User).filter(pk=instance.pk)
+
+        with self.assertNumQueries(1):
+            queryset.delete(user=self.user)
+
+        instance = User.objects.get(pk=instance.pk)
+        self.assertEqual((instance.is_deleted, instance.deleted_by), (True, self.user))
+
+    def test_bulk_create(self):
+        request = APIRequestFactory().post("/", [{"email": "new@example.com"}], format="json")
+        force_authenticate(request, user=self.user)
+        response = _UserCUDAPIViewSet.as_view({"post": "bulk_create_handler"})(request)
+
+        self.assertEqual(response.status_code, 201)
+        instance = User.objects.get(email="new@example.com")
+        self.assertEqual((instance.created_by, instance.updated_by), (self.user, self.user))
+
+    def test_given_values_are_kept(self):
+        other = User.objects.create(email="other@example.com")
+        data = {"email": "new@example.com", "updated_by": other.pk}
+
+        instance, writes = self.save(self.get_serializer(self.user, _AuditedUserSerializer, data=data))
+        self.assertEqual((instance.created_by, instance.updated_by), (self.user, other))
+
+        request = APIRequestFactory().post("/", [{**data, "email": "bulk@example.com"}], format="json")
+        force_authenticate(request, user=self.user)
+        view = _UserCUDAPIViewSet.as_view({"post": "bulk_create_handler"}, serializer_class=_AuditedUserSerializer)
+        self.assertEqual(view(request).status_code, 201)
+
+        instance = User.objects.get(email="bulk@example.com")
+        self.assertEqual((instance.created_by, instance.updated_by), (self.user, other))
@@ -0,0 +1,62 @@
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+
+from apps.access.models import User
+from apps.common.authentication import AppTokenAuthentication, get_token_cache_key, invalidate_token_cache, token_cache
+
+
+class AppTokenAuthenticationTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@example.com")
+        self.token = Token.objects.create(user=self.user)
+        self.key = self.token.key  # cleared on the `delete()`
+        self.addCleanup(invalidate_token_cache, self.key)
+
+    def authenticate(self):
+        return AppTokenAuthentication().authenticate_credentials(self.key)
+
+    def test_cached_after_the_first_call(self):
+        with self.assertNumQueries(1):
+            self.authenticate()
+
+        with self.assertNumQueries(0):
+            user, token = self.authenticate()
+
+        self.assertEqual((user.pk, token.key), (self.user.pk, self.key))
+
+    def test_user_save_invalidates(self):
+        self.authenticate()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_token_delete_invalidates(self):
+        self.authenticate()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.token.delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_load_racing_with_an_invalidation_is_not_cached(self):
+        authenticate_credentials = TokenAuthentication.authenticate_credentials
+
+        def _load_then_invalidate(authentication, key):
+            # loaded before the deactivation is committed | invalidated right after
+            result = authenticate_credentials(authentication, key)
+            invalidate_token_cache(key)
+            return result
+
+        with mock.patch.object(TokenAuthentication, "authenticate_credentials", _load_then_invalidate):
+            self.authenticate()
+
+        self.assertIsNone(token_cache.get(get_token_cache_key(self.key)))
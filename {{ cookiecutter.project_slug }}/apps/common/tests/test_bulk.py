@@ -0,0 +1,118 @@
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import permissions
+from rest_framework.test import APIRequestFactory
+
+from apps.access.models import User
+from apps.common.cache import get_model_cache_versions
+from apps.common.managers import BaseObjectManagerQuerySet
+from apps.common.serializers import AppWriteOnlyModelSerializer
+from apps.common.views import AppModelCUDAPIViewSet
+from apps.common.views.generic import AbstractLookUpFieldMixin
+
+
+class _UserSerializer(AppWriteOnlyModelSerializer):
+    class Meta(AppWriteOnlyModelSerializer.Meta):
+        model = User
+        fields = ["email", "groups"]
+
+
+class _UserCUDAPIViewSet(AbstractLookUpFieldMixin, AppModelCUDAPIViewSet):
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+    queryset = BaseObjectManagerQuerySet(model=User).filter(is_deleted=False)
+    serializer_class = _UserSerializer
+    meta_cache_models = [User]
+
+
+class AppBulkCUDTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.groups = [Group.objects.create(name=f"group-{index}") for index in range(2)]
+        cls.users = [User.objects.create(email=f"user-{index}@example.com") for index in range(2)]
+
+    def bulk(self, method, data):
+        request = getattr(APIRequestFactory(), method)("/", data, format="json")
+        handler = {"post": "bulk_create_handler", "put": "bulk_update_handler", "delete": "bulk_delete_handler"}[
+            method
+        ]
+        response = _UserCUDAPIViewSet.as_view({method: handler})(request)
+        return response.status_code, response.data.get("data")
+
+    def test_create(self):
+        status_code, data = self.bulk(
+            "post",
+            [
+                {"email": "new-0@example.com", "groups": [self.groups[0].pk]},
+                {"email": "new-1@example.com", "groups": [_.pk for _ in self.groups]},
+            ],
+        )
+        self.assertEqual(status_code, 201)
+
+        user = User.objects.get(email="new-1@example.com")
+        self.assertEqual(set(user.groups.all()), set(self.groups))
+
+    def test_create_duplicates_in_batch(self):
+        status_code, data = self.bulk("post", [{"email": "new@example.com", "groups": []}] * 2)
+
+        self.assertEqual(status_code, 400)
+        self.assertEqual([list(_) for _ in data["errors"]], [["email"], ["email"]])
+        self.assertFalse(User.objects.filter(email="new@example.com").exists())
+
+    def test_update(self):
+        self.users[0].groups.set([self.groups[0]])
+
+        payload = [
+            {"uuid": str(self.users[0].uuid).upper(), "groups": [self.groups[1].pk]},
+            {"uuid": self.users[1].uuid.hex, "email": "changed@example.com"},
+        ]
+        with CaptureQueriesContext(connection) as context:
+            status_code, data = self.bulk("put", payload)
+
+        # one delete & insert of the through rows for the batch
+        queries = [_["sql"].split(" (")[0] for _ in context.captured_queries if '"access_user_groups" ' in _["sql"]]
+        self.assertEqual(len([_ for _ in queries if _.startswith("DELETE")]), 1)
+        self.assertEqual(len([_ for _ in queries if _.startswith("INSERT")]), 1)
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(list(self.users[0].groups.all()), [self.groups[1]])
+        self.assertEqual(User.objects.get(pk=self.users[1].pk).email, "changed@example.com")
+
+    def test_update_duplicates_in_batch(self):
+        payload = [{"uuid": str(_.uuid), "email": "same@example.com"} for _ in self.users]
+        status_code, data = self.bulk("put", payload)
+
+        self.assertEqual(status_code, 400)
+        self.assertEqual([list(_) for _ in data["errors"]], [["email"], ["email"]])
+
+    def test_update_duplicate_lookups(self):
+        payload = [{"uuid": str(self.users[0].uuid), "email": f"new-{index}@example.com"} for index in range(2)]
+        status_code, data = self.bulk("put", payload)
+
+        self.assertEqual(status_code, 400)
+        self.assertEqual(data["errors"], [{"uuid": ["Duplicate uuid in the batch."]}] * 2)
+
+    def test_meta_caches_invalidated(self):
+        for method, payload in [
+            ("post", [{"email": "new@example.com", "groups": []}]),
+            ("put", [{"uuid": str(self.users[0].uuid), "email": "changed@example.com"}]),
+            ("delete", [str(self.users[1].uuid)]),
+        ]:
+            with self.subTest(method=method):
+                versions = get_model_cache_versions([User])
+                self.assertIn(self.bulk(method, payload)[0], [200, 201])
+                self.assertNotEqual(get_model_cache_versions([User]), versions)
+
+    def test_update_not_found(self):
+        status_code, data = self.bulk("put", [{"uuid": "invalid"}, {"uuid": str(self.users[0].uuid)}])
+
+        self.assertEqual(status_code, 400)
+        self.assertEqual(data["errors"][0], {"uuid": ["Not found."]})
+
+    def test_delete(self):
+        status_code, data = self.bulk("delete", [str(self.users[0].uuid).upper()])
+
+        self.assertEqual(status_code, 200)
+        self.assertTrue(User.objects.get(pk=self.users[0].pk).is_deleted)
@@ -0,0 +1,121 @@
+import json
+from base64 import urlsafe_b64encode
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import Group
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import permissions
+from rest_framework.test import APIRequestFactory
+
+from apps.access.models import User
+from apps.common.managers import BaseObjectManagerQuerySet
+from apps.common.serializers import AppReadOnlyModelSerializer
+from apps.common.views import AppModelListAPIViewSet
+
+
+class _UserSerializer(AppReadOnlyModelSerializer):
+    class Meta(AppReadOnlyModelSerializer.Meta):
+        model = User
+        fields = ["id", "uuid", "email"]
+
+
+class _UserListAPIViewSet(AppModelListAPIViewSet):
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+    queryset = User.objects.filter(is_deleted=False, email__endswith="@example.com")
+    serializer_class = _UserSerializer
+    changes_commit_lag = 0
+
+
+class _ActiveUserListAPIViewSet(_UserListAPIViewSet):
+    queryset = User.objects.filter(is_active=True, is_deleted=False, email__endswith="@example.com")
+
+
+class _GroupSerializer(AppReadOnlyModelSerializer):
+    class Meta(AppReadOnlyModelSerializer.Meta):
+        model = Group
+        fields = ["id", "name"]
+
+
+class _GroupListAPIViewSet(AppModelListAPIViewSet):
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+    queryset = Group.objects.all()
+    serializer_class = _GroupSerializer
+
+
+def get_watermark(*values):
+    return urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+class AppDeltaSyncTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [User.objects.create(email=f"user-{index}@example.com") for index in range(3)]
+        cls.other = User.objects.create(email="user@other.com")
+
+    def changes(self, viewset=_UserListAPIViewSet, **params):
+        response = viewset.as_view({"get": "get_changes_handler"})(APIRequestFactory().get("/", params))
+        return response.status_code, response.data.get("data")
+
+    @mock.patch.object(_UserListAPIViewSet, "changes_batch_size", 2)
+    def test_changes_in_batches(self):
+        status_code, data = self.changes()
+        self.assertEqual(status_code, 200)
+        self.assertEqual([_["id"] for _ in data["results"]], [_.pk for _ in self.users[:2]])
+        self.assertTrue(data["has_more"])
+
+        status_code, data = self.changes(since=data["watermark"])
+        self.assertEqual([_["id"] for _ in data["results"]], [self.users[2].pk])
+        self.assertFalse(data["has_more"])
+
+    def test_tombstones_are_scoped(self):
+        watermark = self.changes()[1]["watermark"]
+
+        BaseObjectManagerQuerySet(model=User).filter(pk__in=[self.users[0].pk, self.other.pk]).delete()
+
+        status_code, data = self.changes(since=watermark)
+        self.assertEqual(status_code, 200)
+        self.assertEqual(data["results"], [])
+        self.assertEqual([_["id"] for _ in data["tombstones"]], [self.users[0].pk])
+
+    def test_deactivated_rows_are_tombstones(self):
+        watermark = self.changes(_ActiveUserListAPIViewSet)[1]["watermark"]
+
+        self.users[0].is_active = False
+        self.users[0].save()
+
+        status_code, data = self.changes(_ActiveUserListAPIViewSet, since=watermark)
+        self.assertEqual(data["results"], [])
+        self.assertEqual([_["id"] for _ in data["tombstones"]], [self.users[0].pk])
+
+        # still in the list, without the `is_active` filter
+        status_code, data = self.changes(since=watermark)
+        self.assertEqual([_["id"] for _ in data["results"]], [self.users[0].pk])
+        self.assertEqual(data["tombstones"], [])
+
+    @mock.patch.object(_UserListAPIViewSet, "changes_commit_lag", 60)
+    def test_recent_changes_are_held_back(self):
+        status_code, data = self.changes()
+        self.assertEqual((data["results"], data["watermark"]), ([], None))
+
+        User.objects.filter(pk=self.users[0].pk).update(modified=timezone.now() - timedelta(seconds=61))
+        status_code, data = self.changes()
+        self.assertEqual([_["id"] for _ in data["results"]], [self.users[0].pk])
+
+    def test_invalid_watermark(self):
+        for watermark in [
+            "invalid",
+            get_watermark("2024-01-01T00:00:00", None),
+            get_watermark("2024-01-01T00:00:00", "abc"),
+            get_watermark(None, 1),
+            get_watermark("2024-01-01T00:00:00"),
+        ]:
+            with self.subTest(watermark=watermark):
+                self.assertEqual(self.changes(since=watermark)[0], 400)
+
+    def test_model_without_delta_sync_fields(self):
+        Group.objects.create(name="group")
+        self.assertEqual(self.changes(_GroupListAPIViewSet)[0], 400)
@@ -0,0 +1,82 @@
+from django.db import transaction
+from django.test import TestCase
+
+from apps.access.models import User
+from apps.common.identity_map import batch_load_foreign_keys, identity_map_scope
+from apps.common.managers import BaseObjectManagerQuerySet
+
+
+class IdentityMapTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email="user@example.com", first_name="old")
+
+    def test_loaded_once_per_scope(self):
+        with identity_map_scope():
+            user = User.objects.get_or_none(pk=self.user.pk)
+
+            with self.assertNumQueries(0):
+                self.assertIs(User.objects.get_or_none(pk=self.user.pk), user)
+                self.assertIs(User.objects.get_or_none(uuid=str(self.user.uuid)), user)
+
+        with self.assertNumQueries(1):
+            self.assertIsNot(User.objects.get_or_none(pk=self.user.pk), user)
+
+    def test_not_served_for_the_other_queries(self):
+        with identity_map_scope():
+            User.objects.get_or_none(pk=self.user.pk)
+
+            for queryset in [User.objects, BaseObjectManagerQuerySet(model=User)]:
+                with self.subTest(queryset=queryset), transaction.atomic(), self.assertNumQueries(1):
+                    queryset.select_for_update().get_or_none(pk=self.user.pk)
+
+            for queryset in [User.objects.distinct(), User.objects.filter(is_active=True), User.objects.only("id")]:
+                with self.subTest(query=str(queryset.query)), self.assertNumQueries(1):
+                    queryset.get_or_none(pk=self.user.pk)
+
+    def test_discarded_on_the_changes(self):
+        with identity_map_scope():
+            user = User.objects.get_or_none(pk=self.user.pk)
+
+            User.objects.filter(pk=self.user.pk).update(first_name="new")
+            self.assertEqual(User.objects.get_or_none(pk=self.user.pk).first_name, "new")
+
+            user = User.objects.get_or_none(pk=self.user.pk)
+            user.save()
+            self.assertIsNot(User.objects.get_or_none(pk=self.user.pk), user)
+
+            User.objects.get_or_none(pk=self.user.pk).delete()
+            self.assertIsNone(User.objects.get_or_none(pk=self.user.pk))
+
+
+class BatchLoadForeignKeysTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.creators = [User.objects.create(email=f"creator-{index}@example.com") for index in range(2)]
+        cls.users = [
+            User.objects.create(email=f"user-{index}@example.com", created_by=cls.creators[index % 2])
+            for index in range(4)
+        ]
+
+    def get_users(self):
+        return list(User.objects.filter(pk__in=[_.pk for _ in self.users]).order_by("pk"))
+
+    def test_one_query_per_field(self):
+        users = self.get_users()
+
+        with self.assertNumQueries(1):
+            batch_load_foreign_keys(users, ["created_by"])
+
+        with self.assertNumQueries(0):
+            self.assertEqual([_.created_by for _ in users], [_.created_by for _ in self.users])
+
+    def test_identity_map_and_cached_relations(self):
+        with identity_map_scope():
+            User.objects.get_or_none(pk=self.creators[0].pk)
+
+            users = self.get_users()
+            users[1].created_by, users[3].created_by  # cached relations
+
+            with self.assertNumQueries(0):
+                batch_load_foreign_keys(users, ["created_by"])
+                self.assertEqual([_.created_by for _ in users], [_.created_by for _ in self.users])
@@ -0,0 +1,106 @@
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from django.test import TestCase
+from rest_framework import permissions
+from rest_framework.test import APIRequestFactory
+
+from apps.access.models import User
+from apps.common.pagination import (
+    COUNT_MODE_AUTO,
+    COUNT_MODE_ESTIMATE,
+    COUNT_MODE_EXACT,
+    AppKeysetPagination,
+    AppPagination,
+)
+from apps.common.serializers import AppReadOnlyModelSerializer
+from apps.common.views import AppModelListAPIViewSet
+
+
+class _UserSerializer(AppReadOnlyModelSerializer):
+    class Meta(AppReadOnlyModelSerializer.Meta):
+        model = User
+        fields = ["id", "email", "first_name"]
+
+
+class _UserKeysetPagination(AppKeysetPagination):
+    page_size = 2
+
+
+class _UserListAPIViewSet(AppModelListAPIViewSet):
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+    queryset = User.objects.all()
+    serializer_class = _UserSerializer
+    pagination_class = _UserKeysetPagination
+    conditional_get = False
+
+
+class AppKeysetPaginationTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [
+            User.objects.create(email=f"user-{index}@example.com", first_name=f"First {index}") for index in range(5)
+        ]
+
+    def get_page(self, **params):
+        response = _UserListAPIViewSet.as_view({"get": "list"})(APIRequestFactory().get("/", params))
+        self.assertEqual(response.status_code, 200)
+        return response.data["data"]
+
+    def get_all_pages(self, **params):
+        page, emails = self.get_page(**params), []
+        while True:
+            emails += [_["email"] for _ in page["results"]]
+            if not page["next"]:
+                return emails
+
+            cursor = parse_qs(urlparse(page["next"]).query)["cursor"][0]
+            page = self.get_page(**params, cursor=cursor)
+
+    def test_pages_follow_the_ordering(self):
+        emails = self.get_all_pages(ordering="email")
+        self.assertEqual(emails, sorted(_.email for _ in self.users))
+
+        emails = self.get_all_pages(ordering="-email")
+        self.assertEqual(emails, sorted((_.email for _ in self.users), reverse=True))
+
+    def test_previous_page(self):
+        first = self.get_page(ordering="email")
+        second = self.get_page(ordering="email", cursor=parse_qs(urlparse(first["next"]).query)["cursor"][0])
+        previous = self.get_page(ordering="email", cursor=parse_qs(urlparse(second["previous"]).query)["cursor"][0])
+
+        self.assertEqual(previous["results"], first["results"])
+
+    def test_nullable_ordering_falls_back_to_the_default(self):
+        # `deleted` is NULL on all the rows | no keyset position, the default ordering is used
+        emails = self.get_all_pages(ordering="deleted")
+        self.assertEqual(emails, [_.email for _ in reversed(self.users)])
+
+    def test_invalid_cursor(self):
+        response = _UserListAPIViewSet.as_view({"get": "list"})(APIRequestFactory().get("/", {"cursor": "garbage"}))
+        self.assertEqual(response.status_code, 404)
+
+
+class AppPaginationCountTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.create(email="user@example.com")
+
+    def get_count(self, count_mode):
+        pagination = AppPagination()
+        pagination.view = type("View", (), {"pagination_count_mode": count_mode})()
+        return pagination.get_count(User.objects.all())
+
+    @mock.patch("apps.common.pagination.get_cached_estimated_count", return_value=10**6)
+    def test_auto_mode_uses_the_estimate_above_the_threshold(self, get_cached_estimated_count):
+        self.assertEqual(self.get_count(COUNT_MODE_AUTO), (10**6, COUNT_MODE_ESTIMATE))
+
+    @mock.patch("apps.common.pagination.get_cached_estimated_count", return_value=10)
+    def test_auto_mode_counts_below_the_threshold(self, get_cached_estimated_count):
+        self.assertEqual(self.get_count(COUNT_MODE_AUTO), (1, COUNT_MODE_EXACT))
+
+    @mock.patch("apps.common.pagination.get_cached_estimated_count", return_value=10**6)
+    def test_exact_mode_never_estimates(self, get_cached_estimated_count):
+        self.assertEqual(self.get_count(COUNT_MODE_EXACT), (1, COUNT_MODE_EXACT))
+        get_cached_estimated_count.assert_not_called()
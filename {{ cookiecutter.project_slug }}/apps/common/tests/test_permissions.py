@@ -0,0 +1,100 @@
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from apps.access.models import User
+from apps.common.permissions import get_user_permissions
+from apps.common.views.permissions import HasValidPermissionMixin
+
+
+class GetUserPermissionsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.permission = Permission.objects.get(codename="view_group")
+        cls.group = Group.objects.create(name="group")
+        cls.user = User.objects.create(email="user@example.com")
+
+    def setUp(self):
+        cache.clear()
+
+    def get_permissions(self):
+        return get_user_permissions(User.objects.get(pk=self.user.pk))
+
+    def test_cached(self):
+        self.user.user_permissions.add(self.permission)
+        user = User.objects.get(pk=self.user.pk)
+
+        self.assertEqual(get_user_permissions(user), {"auth.view_group"})
+        self.assertEqual(get_user_permissions(user), {"auth.view_group"})
+
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_permissions(user), {"auth.view_group"})
+
+    def test_user_permission_changes(self):
+        self.assertEqual(self.get_permissions(), set())
+
+        self.user.user_permissions.add(self.permission)
+        self.assertEqual(self.get_permissions(), {"auth.view_group"})
+
+        self.user.user_permissions.clear()
+        self.assertEqual(self.get_permissions(), set())
+
+    def test_group_changes(self):
+        self.group.permissions.add(self.permission)
+        self.assertEqual(self.get_permissions(), set())
+
+        self.group.user_set.add(self.user)  # reverse
+        self.assertEqual(self.get_permissions(), {"auth.view_group"})
+
+        self.group.permissions.remove(self.permission)
+        self.assertEqual(self.get_permissions(), set())
+
+        self.group.permissions.add(self.permission)
+        self.assertEqual(self.get_permissions(), {"auth.view_group"})
+
+        self.group.delete()
+        self.assertEqual(self.get_permissions(), set())
+
+    def test_user_save(self):
+        self.user.user_permissions.add(self.permission)
+        self.assertEqual(self.get_permissions(), {"auth.view_group"})
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.get_permissions(), set())
+
+
+class _PermissionAPIView(HasValidPermissionMixin, APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        return Response()
+
+
+class HasValidPermissionMixinTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email="user@example.com")
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, **initkwargs):
+        request = APIRequestFactory().get("/")
+        force_authenticate(request, user=User.objects.get(pk=self.user.pk))
+        return _PermissionAPIView.as_view(**initkwargs)(request).status_code
+
+    def test_required_permission(self):
+        for required_permission in ["auth.view_group", ["auth.add_group", "auth.view_group"]]:
+            with self.subTest(required_permission=required_permission):
+                self.assertEqual(self.get(required_permission=required_permission), 403)
+
+        self.user.user_permissions.add(Permission.objects.get(codename="view_group"))
+        self.assertEqual(self.get(required_permission=["auth.add_group", "auth.view_group"]), 200)
+        self.assertEqual(self.get(required_permission="auth.add_group"), 403)
+        self.assertEqual(self.get(), 200)
@@ -0,0 +1,50 @@
+from django.test import TestCase
+
+from apps.access.models import User
+from apps.common.serializers import AppReadOnlyModelSerializer
+from apps.common.serializers.base import get_app_read_only_serializer
+from apps.common.serializers.planner import QUERY_PLANS, get_query_plan, has_static_fields
+
+
+class _UserSerializer(AppReadOnlyModelSerializer):
+    class Meta(AppReadOnlyModelSerializer.Meta):
+        model = User
+        fields = ["id", "email"]
+
+
+class _UserRepresentationSerializer(_UserSerializer):
+    def to_representation(self, instance):
+        return {**super().to_representation(instance), "name": instance.first_name}
+
+
+class QueryPlannerTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.bulk_create(
+            [User(email=f"user-{index}@example.com", first_name=f"First {index}") for index in range(10)]
+        )
+
+    def test_columns_are_restricted(self):
+        plan = get_query_plan(_UserSerializer, User)
+        self.assertEqual(plan.only, ["id", "email"])
+
+    def test_custom_to_representation_loads_all_the_columns(self):
+        plan = get_query_plan(_UserRepresentationSerializer, User)
+        self.assertIsNone(plan.only)
+
+        queryset = plan.apply(User.objects.order_by("id"))
+        with self.assertNumQueries(1):
+            data = _UserRepresentationSerializer(queryset, many=True).data
+
+        self.assertEqual(data[0]["name"], "First 0")
+
+    def test_generated_serializers_are_not_cached(self):
+        serializer_class = get_app_read_only_serializer(User, meta_fields=["id", "email"])
+        self.assertFalse(has_static_fields(serializer_class))
+        self.assertTrue(has_static_fields(_UserSerializer))
+
+        size = len(QUERY_PLANS)
+        for _ in range(5):
+            get_query_plan(get_app_read_only_serializer(User, meta_fields=["id", "email"]), User)
+
+        self.assertEqual(len(QUERY_PLANS), size)
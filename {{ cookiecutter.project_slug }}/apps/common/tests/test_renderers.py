@@ -0,0 +1,64 @@
+import io
+
+from django.test import SimpleTestCase
+from rest_framework import serializers
+
+from apps.common.benchmarks.renderers import EDGE_CASE_VALUES, _get_payload
+from apps.common.parsers import AppJSONParser
+from apps.common.renderers import AppJSONRenderer
+
+
+class AppJSONRendererTestCase(SimpleTestCase):
+    def render(self, data, use_orjson):
+        renderer = AppJSONRenderer()
+        renderer.use_orjson = use_orjson
+        return renderer.render(data)
+
+    def test_byte_compatible_with_the_stdlib(self):
+        payload = _get_payload(rows=50)
+        self.assertEqual(self.render(payload, use_orjson=True), self.render(payload, use_orjson=False))
+
+    def test_exponent_form_floats(self):
+        for value in [1e16, -1.5e300, 1e-7, 1e-5, 5e-324, [1e22], {"nested": [0.00009]}]:
+            with self.subTest(value=value):
+                self.assertEqual(self.render(value, use_orjson=True), self.render(value, use_orjson=False))
+
+    def test_non_finite_floats_raise_like_the_stdlib(self):
+        for value in [float("nan"), float("inf"), {"nested": [None, float("-inf")]}]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    self.render(value, use_orjson=False)
+                with self.assertRaises(ValueError):
+                    self.render(value, use_orjson=True)
+
+    def test_serializer_output(self):
+        class _Serializer(serializers.Serializer):
+            value = serializers.FloatField()
+
+        for value in [1e16, 1e-5, 0.5]:
+            with self.subTest(value=value):
+                data = {"data": _Serializer([{"value": value}], many=True).data}
+                self.assertEqual(self.render(data, use_orjson=True), self.render(data, use_orjson=False))
+
+        data = {"data": _Serializer({"value": float("nan")}).data}
+        with self.assertRaises(ValueError):
+            self.render(data, use_orjson=True)
+
+
+class AppJSONParserTestCase(SimpleTestCase):
+    def parse(self, body, use_orjson):
+        parser = AppJSONParser()
+        parser.use_orjson = use_orjson
+        return parser.parse(io.BytesIO(body))
+
+    def test_integers_beyond_64_bit_are_kept(self):
+        body = b'{"value": 123456789012345678901234567890, "negative": -98765432109876543210}'
+
+        parsed = self.parse(body, use_orjson=True)
+        self.assertEqual(parsed, {"value": 123456789012345678901234567890, "negative": -98765432109876543210})
+        self.assertEqual(parsed, self.parse(body, use_orjson=False))
+
+    def test_edge_cases_round_trip(self):
+        values = [_ for _ in EDGE_CASE_VALUES if _ == _ and abs(_) != float("inf")]
+        body = AppJSONRenderer().render({"values": values})
+        self.assertEqual(self.parse(body, use_orjson=True), {"values": values})
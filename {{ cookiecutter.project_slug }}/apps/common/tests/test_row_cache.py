@@ -0,0 +1,70 @@
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.access.models import User
+from apps.common.managers import BaseObjectManagerQuerySet
+from apps.common.row_cache import register_row_cache_model, row_cache, row_cache_versions
+
+
+class RowCacheTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        register_row_cache_model(User)
+        cls.user = User.objects.create(email="user@example.com", first_name="old")
+
+    def setUp(self):
+        cache.clear()
+        row_cache.near.clear()
+        row_cache_versions.near.clear()
+
+    def get(self, **kwargs):
+        return BaseObjectManagerQuerySet(model=User).cached(60).get_or_none(**kwargs)
+
+    def get_first_name(self):
+        return self.get(pk=self.user.pk).first_name
+
+    def test_hit(self):
+        for lookup in [{"pk": self.user.pk}, {"uuid": str(self.user.uuid)}]:
+            with self.subTest(lookup=lookup):
+                with self.assertNumQueries(1):
+                    self.assertEqual(self.get(**lookup).email, "user@example.com")
+
+                with self.assertNumQueries(0):
+                    self.assertEqual(self.get(**lookup), self.user)
+
+    def test_save_invalidates(self):
+        self.assertEqual(self.get_first_name(), "old")
+
+        user = User.objects.get(pk=self.user.pk)
+        user.first_name = "new"
+        user.save()
+        self.assertEqual(self.get_first_name(), "new")
+
+    def test_update_invalidates(self):
+        self.assertEqual(self.get_first_name(), "old")
+
+        BaseObjectManagerQuerySet(model=User).filter(pk=self.user.pk).update(first_name="new")
+        self.assertEqual(self.get_first_name(), "new")
+
+    def test_hard_delete_invalidates(self):
+        self.assertEqual(self.get_first_name(), "old")
+
+        BaseObjectManagerQuerySet(model=User).filter(pk=self.user.pk).hard_delete()
+        self.assertIsNone(self.get(pk=self.user.pk))
+
+    @mock.patch.dict("apps.common.config.ROW_CACHE_CONFIG", {"miss_timeout": 1})
+    def test_missing_rows_are_cached_briefly(self):
+        pk = self.user.pk + 100
+
+        with self.assertNumQueries(1):
+            self.assertIsNone(self.get(pk=pk))
+        with self.assertNumQueries(0):
+            self.assertIsNone(self.get(pk=pk))
+
+        # no signals | seen after the `miss_timeout`
+        User.objects.bulk_create([User(pk=pk, email="new@example.com")])
+        time.sleep(1.1)
+        self.assertEqual(self.get(pk=pk).email, "new@example.com")
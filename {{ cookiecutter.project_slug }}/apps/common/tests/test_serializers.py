@@ -0,0 +1,46 @@
+from django.test import SimpleTestCase
+
+from apps.access.models import User
+from apps.common.serializers import AppWriteOnlyModelSerializer
+
+
+class _UserWriteSerializer(AppWriteOnlyModelSerializer):
+    class Meta(AppWriteOnlyModelSerializer.Meta):
+        model = User
+        fields = ["email", "first_name"]
+        extra_kwargs = {"first_name": {"allow_null": True}}
+
+
+class _UserWriteNarrowSerializer(_UserWriteSerializer):
+    class Meta(_UserWriteSerializer.Meta):
+        fields = ["email"]
+
+
+class AppWriteOnlyModelSerializerTestCase(SimpleTestCase):
+    def test_all_the_fields_are_required(self):
+        fields = _UserWriteSerializer().fields
+
+        self.assertTrue(fields["email"].required)
+        self.assertTrue(fields["first_name"].required)
+        self.assertTrue(fields["first_name"].allow_null)
+
+    def test_the_parent_meta_is_not_mutated(self):
+        extra_kwargs = {"email": {"required": True}, "first_name": {"allow_null": True, "required": True}}
+
+        self.assertEqual(_UserWriteSerializer.Meta.extra_kwargs, extra_kwargs)
+
+        # no own `Meta` | the parent's is shared, left as is
+        parent_extra_kwargs = _UserWriteSerializer.Meta.extra_kwargs
+        child = type("_UserWriteChildSerializer", (_UserWriteSerializer,), {})
+        self.assertIs(child.Meta, _UserWriteSerializer.Meta)
+        self.assertIs(_UserWriteSerializer.Meta.extra_kwargs, parent_extra_kwargs)
+
+        self.assertEqual(_UserWriteNarrowSerializer.Meta.extra_kwargs, extra_kwargs)
+        self.assertIsNot(_UserWriteNarrowSerializer.Meta.extra_kwargs, _UserWriteSerializer.Meta.extra_kwargs)
+        self.assertEqual(AppWriteOnlyModelSerializer.Meta.extra_kwargs, {})
+
+    def test_the_extra_kwargs_are_copies(self):
+        serializer = _UserWriteSerializer()
+        serializer.get_extra_kwargs()["email"].pop("required")
+
+        self.assertTrue(_UserWriteSerializer().get_extra_kwargs()["email"]["required"])
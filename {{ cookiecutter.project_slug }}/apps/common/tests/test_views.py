@@ -0,0 +1,116 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import permissions
+from rest_framework.mixins import RetrieveModelMixin
+from rest_framework.test import APIRequestFactory
+
+from apps.access.models import User
+from apps.common.cache import get_model_cache_versions, register_cache_model
+from apps.common.managers import BaseObjectManagerQuerySet
+from apps.common.serializers import AppReadOnlyModelSerializer
+from apps.common.views import AppModelListAPIViewSet
+from apps.common.views.generic import AbstractLookUpFieldMixin
+
+
+class _UserSerializer(AppReadOnlyModelSerializer):
+    class Meta(AppReadOnlyModelSerializer.Meta):
+        model = User
+        fields = ["id", "uuid", "email"]
+
+
+class _UserListAPIViewSet(AbstractLookUpFieldMixin, AppModelListAPIViewSet, RetrieveModelMixin):
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+    queryset = User.objects.filter(is_deleted=False)
+    serializer_class = _UserSerializer
+    conditional_get_list = True
+
+
+class AppConditionalGetTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [User.objects.create(email=f"user-{index}@example.com") for index in range(3)]
+
+    def list(self, **headers):
+        return _UserListAPIViewSet.as_view({"get": "list"})(APIRequestFactory().get("/", headers=headers))
+
+    def retrieve(self, user, **headers):
+        view = _UserListAPIViewSet.as_view({"get": "retrieve"})
+        return view(APIRequestFactory().get("/", headers=headers), uuid=str(user.uuid))
+
+    def test_unchanged_list(self):
+        response = self.list()
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Last-Modified", response.headers)
+
+        with self.assertNumQueries(1):
+            not_modified = self.list(if_none_match=response.headers["ETag"])
+
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.headers["ETag"], response.headers["ETag"])
+
+    @mock.patch.object(_UserListAPIViewSet, "conditional_get_list", False)
+    def test_list_is_opt_in(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.list()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response.headers)
+        self.assertFalse([_ for _ in context.captured_queries if "MAX(" in _["sql"]])
+
+    def test_changed_list(self):
+        etag = self.list().headers["ETag"]
+
+        User.objects.create(email="new@example.com")
+        self.assertEqual(self.list(if_none_match=etag).status_code, 200)
+
+    def test_soft_deleted_row_changes_the_list(self):
+        etag = self.list().headers["ETag"]
+
+        BaseObjectManagerQuerySet(model=User).filter(pk=self.users[0].pk).delete()
+        self.assertEqual(self.list(if_none_match=etag).status_code, 200)
+
+        # no `Last-Modified` on the lists | the removed rows are not seen by the max
+        self.assertEqual(self.list(if_modified_since="Fri, 01 Jan 2100 00:00:00 GMT").status_code, 200)
+
+    def test_unchanged_object(self):
+        response = self.retrieve(self.users[0])
+        self.assertEqual(response.status_code, 200)
+
+        etag, last_modified = response.headers["ETag"], response.headers["Last-Modified"]
+        self.assertEqual(self.retrieve(self.users[0], if_none_match=etag).status_code, 304)
+        self.assertEqual(self.retrieve(self.users[0], if_modified_since=last_modified).status_code, 304)
+        self.assertEqual(self.retrieve(self.users[1], if_none_match=etag).status_code, 200)
+
+
+class BaseObjectManagerQuerySetUpdateTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@example.com")
+        self.queryset = BaseObjectManagerQuerySet(model=User).filter(pk=self.user.pk)
+
+    def get_modified(self):
+        return User.objects.values_list("modified", flat=True).get(pk=self.user.pk)
+
+    def test_update_keeps_the_modified(self):
+        self.queryset.update(first_name="First")
+        self.assertEqual(self.get_modified(), self.user.modified)
+
+    def test_update_touch_sets_the_modified(self):
+        self.queryset.update(first_name="First", touch=True)
+        self.assertGreater(self.get_modified(), self.user.modified)
+
+    def test_delete_sets_the_modified(self):
+        self.queryset.delete()
+        self.assertGreater(self.get_modified(), self.user.modified)
+
+    def test_update_invalidates_the_model_cache(self):
+        register_cache_model(User)
+
+        for queryset in [self.queryset, User.objects.filter(pk=self.user.pk)]:
+            with self.subTest(queryset=queryset):
+                versions = get_model_cache_versions([User])
+                queryset.update(first_name="First")
+                self.assertNotEqual(get_model_cache_versions([User]), versions)
@@ -1,5 +1,6 @@
 from contextlib import suppress
 
+from django.http import StreamingHttpResponse
 from rest_framework import permissions, status
 from rest_framework.exceptions import MethodNotAllowed, NotFound
 from rest_framework.generics import CreateAPIView
@@ -8,6 +9,7 @@ from rest_framework.status import is_success
 from rest_framework.views import APIView
 
 from apps.common.config import API_RESPONSE_ACTION_CODES
+from apps.common.renderers import iter_json
 
 
 class NonAuthenticatedAPIMixin:
@@ -46,25 +48,70 @@ class AppViewMixin:
 
         return self.send_response(data=data, status_code=status.HTTP_400_BAD_REQUEST)
 
+    @staticmethod
+    def get_response_envelope(
+        data=None, status_code=status.HTTP_200_OK, action_code="DO_NOTHING", **other_response_data
+    ) -> dict:
+        """Returns the centralized response schema for the given data."""
+
+        return {
+            "data": data,
+            "status": "success" if is_success(status_code) else "error",
+            "status_code": status_code,
+            "action_code": action_code,  # make the FE do things based on this
+            **other_response_data,
+        }
+
     @staticmethod
     def send_response(data=None, status_code=status.HTTP_200_OK, action_code="DO_NOTHING", **other_response_data):
         """Custom function to send the centralized response."""
 
         return Response(
-            data={
-                "data": data,
-                "status": "success" if is_success(status_code) else "error",
-                "status_code": status_code,
-                "action_code": action_code,  # make the FE do things based on this
-                **other_response_data,
-            },
+            data=AppViewMixin.get_response_envelope(
+                data=data, status_code=status_code, action_code=action_code, **other_response_data
+            ),
+            status=status_code,
+        )
+
+    @staticmethod
+    def send_streaming_response(
+        data=None, status_code=status.HTTP_200_OK, action_code="DO_NOTHING", **other_response_data
+    ):
+        """
+        Streaming version of the `send_response`. The generators in the data (like from the
+        `iter_serialize_queryset`) are encoded chunk by chunk, never held in memory.
+        """
+
+        return StreamingHttpResponse(
+            iter_json(
+                AppViewMixin.get_response_envelope(
+                    data=data, status_code=status_code, action_code=action_code, **other_response_data
+                )
+            ),
             status=status_code,
+            content_type="application/json",
         )
 
     def get_app_response_schema(self, response: Response, **kwargs):
-        """Given a drf response object. This converts it to the application schema."""
+        """
+        Given a drf response object. This marks it to be converted to the application
+        schema, which is applied once in the `finalize_response` (no new response).
+        """
+
+        response.app_response_schema_kwargs = kwargs
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Overridden to apply the application schema on the marked responses."""
+
+        schema_kwargs = getattr(response, "app_response_schema_kwargs", None)
+        if schema_kwargs is not None:
+            response.data = self.get_response_envelope(
+                data=response.data, status_code=response.status_code, **schema_kwargs
+            )
+            response.app_response_schema_kwargs = None  # applied | just once
 
-        return self.send_response(data=response.data, status_code=response.status_code, **kwargs)
+        return super().finalize_response(request, response, *args, **kwargs)
 
     def handle_exception(self, exc):
         """Overridden to maintain applications response schema."""
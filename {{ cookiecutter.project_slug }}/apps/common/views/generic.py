@@ -1,15 +1,59 @@
+import hashlib
+import json
+import operator
+import threading
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from calendar import timegm
+from collections import Counter
+from contextlib import suppress
+from datetime import datetime, timedelta
+from functools import reduce
+
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connection, transaction
+from django.db.models import Count, Max, Q
+from django.db.models.lookups import Exact
+from django.db.models.sql.where import AND, WhereNode
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import filters, parsers
+from rest_framework import filters, parsers, status
 from rest_framework.decorators import action
-from rest_framework.mixins import CreateModelMixin, DestroyModelMixin, ListModelMixin, UpdateModelMixin
+from rest_framework.exceptions import ValidationError
+from rest_framework.mixins import (
+    CreateModelMixin,
+    DestroyModelMixin,
+    ListModelMixin,
+    RetrieveModelMixin,
+    UpdateModelMixin,
+)
+from rest_framework.response import Response
+from rest_framework.serializers import ModelSerializer
+from rest_framework.settings import api_settings
 from rest_framework.viewsets import GenericViewSet
 
+from apps.common.audit import get_audit_field_values
+from apps.common.cache import get_model_cache_versions, invalidate_model_cache, register_cache_model
 from apps.common.helpers import get_display_name_for_slug
 from apps.common.pagination import AppPagination
-from apps.common.serializers import AppModelSerializer, simple_serialize_queryset
+from apps.common.row_cache import invalidate_row_cache
+from apps.common.serializers import AppModelSerializer, iter_serialize_queryset, simple_serialize_queryset
+from apps.common.serializers.planner import QueryPlan, get_query_plan
 from apps.common.views import AppCreateAPIView, AppViewMixin
 
 
+def has_model_field(model, field_name):
+    """Returns if the model has the concrete field."""
+
+    with suppress(FieldDoesNotExist):
+        return model._meta.get_field(field_name).concrete
+
+    return False
+
+
 class AppGenericViewSet(GenericViewSet):
     """
     Applications version of the `GenericViewSet`. Overridden to implement
@@ -35,12 +79,430 @@ class AppGenericViewSet(GenericViewSet):
         > If implemented using APIView, there has to be at least 2 view classes.
         > If implemented using APIViewSet, it is only one view.
         > Hence reduces the development time.
+
+    Queryset Plan:
+        > The `select_related`, `prefetch_related` & `only` are applied on the
+          `get_queryset`, derived from the fields of the serializer (see QueryPlanner).
+        > Set `queryset_plan` to a dict to override, or to None to disable.
+            queryset_plan = {"select_related": ["created_by"], "prefetch_related": [], "only": None}
+        > The chosen plan is logged on debug, also see `get_queryset_plan_report`.
+    """
+
+    queryset_plan = "auto"
+
+    def get_queryset(self):
+        """Overridden to apply the queryset plan, avoids the N+1 queries."""
+
+        queryset = super().get_queryset()
+
+        plan = self.get_queryset_plan(queryset)
+        if plan:
+            queryset = plan.apply(queryset, extra_only=self.get_queryset_extra_only())
+
+        return queryset
+
+    def get_queryset_extra_only(self) -> list:
+        """Returns the columns used by the view itself, kept with the planned `only`."""
+
+        return [self.lookup_field]
+
+    def get_queryset_plan(self, queryset):
+        """Returns the `QueryPlan` for the queryset. None, if disabled or no serializer."""
+
+        if not self.queryset_plan:
+            return None
+
+        if isinstance(self.queryset_plan, dict):
+            return QueryPlan(**self.queryset_plan)
+
+        serializer_class = None
+        with suppress(AssertionError):
+            serializer_class = self.get_serializer_class()
+
+        if not serializer_class or not issubclass(serializer_class, ModelSerializer):
+            return None
+
+        return get_query_plan(serializer_class, queryset.model, context=self.get_serializer_context())
+
+    def get_queryset_plan_report(self) -> dict:
+        """Returns the plan chosen for the view, for the debugging."""
+
+        plan = self.get_queryset_plan(super().get_queryset())
+        return plan.get_report() if plan else {}
+
+
+class AppMetaCacheMixin:
+    """
+    Caches the meta payloads of the viewset (table meta, create meta). These are
+    called on every form open by the front-end and are mostly dropdown options.
+
+    The cache is versioned by the `meta_cache_models`. Any save or delete on them
+    makes the cached payload stale. The entries are scoped per user by default,
+    see `get_meta_cache_scope`.
+
+    Usage on the view class
+        meta_cache_timeout = 60 * 60
+        meta_cache_models = [Country, State]
+
+    Note:
+        With `meta_cache_stale_while_revalidate`, a stale payload is sent and
+        refreshed on a background thread. So the next call gets the fresh data.
+    """
+
+    meta_cache_timeout = None  # seconds | None, the caching is disabled
+    meta_cache_models = []  # source models for the meta
+    meta_cache_stale_while_revalidate = False
+
+    def __init_subclass__(cls, **kwargs):
+        """Overridden to register the source models for the invalidation."""
+
+        super().__init_subclass__(**kwargs)
+        for model in cls.meta_cache_models:
+            register_cache_model(model)
+
+    def get_meta_cache_scope(self) -> str:
+        """
+        Returns the scope of the cached meta. Per user by default. Override on
+        the child classes for a wider (permission/role based) scope.
+        """
+
+        user = self.get_authenticated_user()
+        return f"user:{user.pk}" if user else "anonymous"
+
+    def get_meta_cache_key(self, name):
+        return f"meta:{self.__class__.__module__}.{self.__class__.__qualname__}:{name}:{self.get_meta_cache_scope()}"
+
+    def get_cached_meta(self, name, builder):
+        """
+        Returns the meta identified by the `name` from the cache. If not present or
+        stale, the `builder` is called and the result is cached.
+        """
+
+        if not self.meta_cache_timeout:
+            return builder()
+
+        key = self.get_meta_cache_key(name)
+        versions = get_model_cache_versions(self.meta_cache_models)
+        entry = cache.get(key)
+
+        if entry and entry["versions"] == versions:
+            return entry["data"]
+
+        if entry and self.meta_cache_stale_while_revalidate:
+            self.refresh_cached_meta_in_background(key=key, builder=builder, versions=versions)
+            return entry["data"]
+
+        data = builder()
+        cache.set(key, {"versions": versions, "data": data}, self.meta_cache_timeout)
+        return data
+
+    def refresh_cached_meta_in_background(self, key, builder, versions):
+        """Rebuilds the cached meta on a thread. Only one refresh runs for a key at a time."""
+
+        lock_key = f"{key}:refreshing"
+        if not cache.add(lock_key, True, timeout=60):
+            return
+
+        def _refresh():
+            try:
+                cache.set(key, {"versions": versions, "data": builder()}, self.meta_cache_timeout)
+            finally:
+                cache.delete(lock_key)
+                connection.close()  # the thread's own connection
+
+        threading.Thread(target=_refresh, daemon=True).start()
+
+
+class AppConditionalGetMixin:
+    """
+    Conditional GET for the `list` & `retrieve`. A cheap validator is computed first and
+    a matching `If-None-Match`/`If-Modified-Since` gets a 304, nothing is serialized.
+
+        list        - MAX(modified) & COUNT over the filtered queryset, one query | ETag only
+        retrieve    - the `modified` of the row | ETag & Last-Modified
+
+    The ETag is scoped per user & url. The validators are sent on the 200 & the 304
+    responses. Set `conditional_get = False` to disable on a view.
+
+    The lists are opt-in, set `conditional_get_list = True` on the polled lists. The
+    validator is one more exact aggregate over the filtered queryset on every request
+    (the 200s too, they send the ETag), on top of the paginator's count. Worth it only
+    when most of the calls get the 304.
+
+    Note:
+        The rows leaving a list (soft & hard deletes, filter changes) do not raise its
+        MAX(modified), they are seen only by the count. So the lists send no
+        `Last-Modified` & an `If-Modified-Since` alone never gets a 304.
+        The queryset `update()` sets the `modified` only with `touch=True`, the
+        `delete()` always.
+    """
+
+    conditional_get = True
+    conditional_get_list = False
+    conditional_get_field = "modified"
+
+    def get_conditional_etag(self, *values) -> str:
+        user = self.get_authenticated_user()
+        digest = hashlib.sha1(
+            repr((self.get_request().get_full_path(), user.pk if user else None, *values)).encode()
+        ).hexdigest()
+        return f'W/"{digest}"'
+
+    def get_conditional_model_field(self, model):
+        """Returns the `modified` field of the model. None, if not a `BaseModel`."""
+
+        if not self.conditional_get:
+            return None
+
+        with suppress(FieldDoesNotExist):
+            return model._meta.get_field(self.conditional_get_field)
+
+        return None
+
+    def get_queryset_extra_only(self) -> list:
+        """Overridden to keep the `modified`, for the `get_object_validators`."""
+
+        extra_only = super().get_queryset_extra_only()
+        if self.conditional_get:
+            extra_only.append(self.conditional_get_field)
+
+        return extra_only
+
+    def get_list_validators(self):
+        """Returns the (etag, None) of the list. None, if not supported. No last modified, see the class."""
+
+        if not self.conditional_get_list:
+            return None
+
+        queryset = self.filter_queryset(self.get_queryset())
+        field = self.get_conditional_model_field(queryset.model)
+        if field is None:
+            return None
+
+        result = queryset.order_by().aggregate(last_modified=Max(field.name), count=Count("pk"))
+        return self.get_conditional_etag(result["last_modified"], result["count"]), None
+
+    def get_object_validators(self, instance):
+        """Returns the (etag, last modified) of the instance. None, if not supported."""
+
+        field = self.get_conditional_model_field(instance.__class__)
+        if field is None:
+            return None
+
+        last_modified = getattr(instance, field.attname)
+        return self.get_conditional_etag(instance.pk, last_modified), last_modified
+
+    def get_conditional_response(self, validators, handler):
+        """Returns the 304 for the matching validators, else the response from the `handler`."""
+
+        if not validators:
+            return handler()
+
+        etag, last_modified = validators
+        last_modified = timegm(last_modified.utctimetuple()) if last_modified else None
+
+        response = get_conditional_response(self.get_request(), etag=etag, last_modified=last_modified)
+        if response is None:
+            response = handler()
+
+        if response.status_code in [status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED]:
+            response.headers.setdefault("ETag", etag)
+            if last_modified:
+                response.headers.setdefault("Last-Modified", http_date(last_modified))
+
+        return response
+
+    def list(self, request, *args, **kwargs):
+        """Overridden to send the 304 for the unchanged lists."""
+
+        if not isinstance(self, ListModelMixin):
+            return super().list(request, *args, **kwargs)
+
+        return self.get_conditional_response(
+            self.get_list_validators(), lambda: super(AppConditionalGetMixin, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        """Overridden to send the 304 for the unchanged objects. The object is fetched once."""
+
+        if not isinstance(self, RetrieveModelMixin):
+            return super().retrieve(request, *args, **kwargs)
+
+        instance = self.get_object()
+
+        # same as the `RetrieveModelMixin.retrieve` | without a second `get_object`
+        return self.get_conditional_response(
+            self.get_object_validators(instance),
+            lambda: self.get_app_response_schema(Response(self.get_serializer(instance).data)),
+        )
+
+
+class AppDeltaSyncMixin:
     """
+    Delta sync for the lists. The `changes/` action returns the rows changed after the
+    `since` watermark, ordered by (modified, pk), with the rows that left the list as tombstones.
+
+        GET {endpoint}/changes/?since=<watermark>
+        {
+            "results": [...],           # changed rows, by the list serializer
+            "tombstones": [...],        # soft deleted or deactivated rows | id, uuid & deleted
+            "watermark": "...",         # send as the `since` for the next call
+            "has_more": true,           # call again right away, if true
+        }
+
+    Without the `since`, all the rows are sent in batches. The (modified, pk) range is
+    served by the `modified` index of the `BaseModel`, the cost is per changed row.
+
+    The `modified` is set by the app clock before the commit. A row committed after a
+    client synced past its `modified` would be skipped for good, so the rows modified
+    in the last `changes_commit_lag` seconds are held back till the next call. The lag
+    has to be longer than the longest write transaction, the price is the rows reach
+    the clients that much later.
+
+    Note:
+        1. The queryset `update()` is synced only with `touch=True`, it sets the `modified`.
+        2. The tombstones are scoped by the view's queryset, see `get_changes_tombstone_queryset`.
+        3. The rows leaving the list by the other filters (not the flags) get no tombstones.
+    """
+
+    changes_batch_size = 500
+    changes_commit_lag = 5  # seconds
+
+    @staticmethod
+    def get_changes_watermark(modified, pk) -> str:
+        return urlsafe_b64encode(json.dumps([modified.isoformat(), pk], default=str).encode()).decode()
+
+    @staticmethod
+    def parse_changes_watermark(watermark, model):
+        """Returns the (modified, pk) from the watermark. Raises `ValidationError`, if invalid."""
+
+        try:
+            modified, pk = json.loads(urlsafe_b64decode(watermark.encode()))
+            modified, pk = datetime.fromisoformat(modified), model._meta.pk.to_python(pk)
+            if pk is None:
+                raise ValueError
+            return modified, pk
+        except (ValueError, TypeError, DjangoValidationError):
+            raise ValidationError({"since": "Invalid watermark."})
+
+    def get_changes_tombstone_queryset(self, queryset):
+        """
+        Returns the rows for the tombstones. The view's (filtered) queryset without its top
+        level `is_deleted`/`is_active` filters, limited to the rows failing them. So the soft
+        deleted & the deactivated rows of the same scope as the results. No tombstones for
+        the models without the `is_deleted`.
+        """
+
+        if not has_model_field(queryset.model, "is_deleted"):
+            return queryset.none()
+
+        flags = {}
+
+        def _without_flag_filters(node):
+            if node.negated or (node.connector != AND and len(node.children) > 1):
+                return node  # dropping a filter here would widen the scope
+
+            children = []
+            for child in node.children:
+                lhs = getattr(child, "lhs", None)
+                if isinstance(child, WhereNode):
+                    children.append(_without_flag_filters(child))
+                elif (
+                    isinstance(child, Exact)
+                    and getattr(lhs, "alias", None) == queryset.query.base_table
+                    and getattr(getattr(lhs, "target", None), "name", None) in ["is_deleted", "is_active"]
+                ):
+                    flags[lhs.target.name] = child.rhs
+                else:
+                    children.append(child)
+
+            return WhereNode(children, connector=node.connector, negated=node.negated)
+
+        queryset = queryset.all()
+        queryset.query.where = _without_flag_filters(queryset.query.where)
+
+        # the results are always without the soft deleted rows
+        flags["is_deleted"] = False
+        return queryset.filter(reduce(operator.or_, [~Q(**{name: value}) for name, value in flags.items()]))
+
+    def get_changes_until(self):
+        """Returns the latest `modified` sent now, see the `changes_commit_lag` on the class."""
+
+        return timezone.now() - timedelta(seconds=self.changes_commit_lag)
+
+    @staticmethod
+    def filter_changes(queryset, since, until):
+        """Filters the rows after the `since` (modified, pk) till the `until` & orders them by the same."""
+
+        queryset = queryset.filter(modified__lte=until)
+        if since:
+            modified, pk = since
+            # `modified >= x` is the index range, the rest is on the index rows
+            queryset = queryset.filter(Q(modified__gt=modified) | Q(pk__gt=pk), modified__gte=modified)
+
+        return queryset.order_by("modified", "pk")
+
+    def get_changes(self) -> dict:
+        """Returns the changed rows & the tombstones after the `since`, see the class."""
+
+        queryset = self.filter_queryset(self.get_queryset())
+        if not has_model_field(queryset.model, "modified"):
+            raise ValidationError({"detail": "Delta sync is not supported for the list."})
+
+        since = self.get_request().query_params.get("since")
+        since = self.parse_changes_watermark(since, queryset.model) if since else None
+        size, until = self.changes_batch_size, self.get_changes_until()
+
+        changed = queryset.filter(is_deleted=False) if has_model_field(queryset.model, "is_deleted") else queryset
+        changed = self.filter_changes(changed, since, until).values_list("modified", "pk")
+        tombstones = self.filter_changes(self.get_changes_tombstone_queryset(queryset), since, until)
+        tombstones = {_["pk"]: _ for _ in tombstones.values("modified", "pk", "uuid", "deleted")[: size + 1]}
+
+        # merged by (modified, pk) | the first `size` of both
+        changes = sorted(
+            [
+                *[(modified, pk, False) for modified, pk in changed[: size + 1]],
+                *[(_["modified"], _["pk"], True) for _ in tombstones.values()],
+            ]
+        )
+        has_more, changes = len(changes) > size, changes[:size]
+
+        results = []
+        changed_pks = [pk for _, pk, is_deleted in changes if not is_deleted]
+        if changed_pks:
+            results = self.get_serializer(queryset.filter(pk__in=changed_pks).order_by("modified", "pk"), many=True)
+            results = results.data
+
+        if changes:
+            watermark = self.get_changes_watermark(*changes[-1][:2])
+        else:
+            watermark = self.get_request().query_params.get("since")
+
+        return {
+            "results": results,
+            "tombstones": [
+                {"id": _["pk"], "uuid": str(_["uuid"]), "deleted": _["deleted"]}
+                for _ in [tombstones[pk] for _, pk, is_deleted in changes if is_deleted]
+            ],
+            "watermark": watermark,
+            "has_more": has_more,
+        }
+
+    @action(
+        methods=["GET"],
+        url_path="changes",
+        detail=False,
+    )
+    def get_changes_handler(self, *args, **kwargs):
+        """Sends out the rows changed after the `since` watermark, see `AppDeltaSyncMixin`."""
 
-    pass
+        return self.send_response(data=self.get_changes())
 
 
 class AppModelListAPIViewSet(
+    AppConditionalGetMixin,
+    AppDeltaSyncMixin,
+    AppMetaCacheMixin,
     AppViewMixin,
     ListModelMixin,
     AppGenericViewSet,
@@ -52,6 +514,18 @@ class AppModelListAPIViewSet(
     Also handles listing operations like sort, search, filter and
     table preferences of the user.
 
+    Conditional GET:
+        > The unchanged lists (& objects, with the `RetrieveModelMixin`) get a 304,
+          see `AppConditionalGetMixin`.
+
+    Delta Sync:
+        > GET: {endpoint}/changes/?since=<watermark>
+            >> Returns the rows changed after the watermark, see `AppDeltaSyncMixin`.
+
+    Pagination:
+        > `AppPagination` is used by default (page number with count).
+        > For large tables, use `AppKeysetPagination` (cursor on the ordering & id).
+
     References:
         1. https://github.com/miki725/django-url-filter
         2. https://www.django-rest-framework.org/api-guide/filtering/
@@ -81,7 +555,7 @@ class AppModelListAPIViewSet(
         config can vary based on user permission and preference.
         """
 
-        return self.send_response(data=self.get_meta_for_table())
+        return self.send_response(data=self.get_cached_meta("table", self.get_meta_for_table))
 
     def get_meta_for_table(self) -> dict:
         """
@@ -99,12 +573,18 @@ class AppModelListAPIViewSet(
 
         return self.all_table_columns
 
-    def serialize_for_filter(self, queryset, fields=None):
-        """Simple central function to serialize data for the filter component."""
+    def serialize_for_filter(self, queryset, fields=None, stream=False):
+        """
+        Simple central function to serialize data for the filter component. With `stream`,
+        a generator is returned, to be sent with the `send_streaming_response`.
+        """
 
         if not fields:
             fields = ["id", "identity"]
 
+        if stream:
+            return iter_serialize_queryset(queryset=queryset, fields=fields)
+
         return simple_serialize_queryset(queryset=queryset, fields=fields)
 
     def serialize_choices(self, choices: list):
@@ -122,7 +602,279 @@ class AppModelListAPIViewSet(
         return [{"id": _, "identity": get_display_name_for_slug(_)} for _ in choices]
 
 
+class AppBulkCUDMixin:
+    """
+    Bulk create, update & delete for the CUD viewsets. The whole batch is validated first
+    and written in one transaction, the errors are reported per item (same order). The
+    unique values repeated within the batch are reported per item as well.
+
+        POST   {endpoint}/bulk/     [{...}, ...]                            - `bulk_create`
+        PUT    {endpoint}/bulk/     [{"<lookup_field>": ..., ...}, ...]     - `bulk_update`
+        DELETE {endpoint}/bulk/     ["<lookup value>", ...]                 - single soft delete `UPDATE`
+
+    Note:
+        The rows are written by the `bulk_create`/`bulk_update`, the serializer's `create`,
+        `update` & the model `save()`/signals (`m2m_changed` too) are not called. The caches
+        of the model are invalidated by the `invalidate_bulk_caches`. Override `perform_bulk_create`
+        & `perform_bulk_update` on the views that need them.
+    """
+
+    bulk_max_items = 5000
+    bulk_batch_size = 500
+
+    def get_bulk_lookup_field(self) -> str:
+        model = self.get_queryset().model
+        return model._meta.pk.name if self.lookup_field == "pk" else self.lookup_field
+
+    def get_bulk_payload(self) -> list:
+        """Returns the list payload of the request. Raises `ValidationError`, if invalid."""
+
+        data = self.get_request().data
+        if not isinstance(data, list) or not data:
+            raise ValidationError({"detail": "Expected a non empty list of items."})
+
+        if len(data) > self.bulk_max_items:
+            raise ValidationError({"detail": f"Expected at most {self.bulk_max_items} items."})
+
+        return data
+
+    def get_bulk_lookups(self, values) -> list:
+        """Returns the values by the lookup field's `to_python`, None for the invalid ones."""
+
+        field = self.get_queryset().model._meta.get_field(self.get_bulk_lookup_field())
+
+        lookups = []
+        for value in values:
+            lookup = None
+            with suppress(DjangoValidationError, TypeError, ValueError, AttributeError):
+                lookup = field.to_python(value)
+            lookups.append(lookup)
+
+        return lookups
+
+    def get_bulk_instances(self, lookups) -> dict:
+        """Returns the instances by the given `get_bulk_lookups` values, in one query."""
+
+        queryset, lookup_field = self.get_queryset(), self.get_bulk_lookup_field()
+        lookups = [_ for _ in lookups if _ is not None]
+        return {getattr(_, lookup_field): _ for _ in queryset.filter(**{f"{lookup_field}__in": lookups})}
+
+    @staticmethod
+    def get_bulk_unique_field_sets(model) -> list:
+        """Returns the unique field sets of the model, without the pk."""
+
+        return [
+            *[(_.name,) for _ in model._meta.concrete_fields if _.unique and not _.primary_key],
+            *[tuple(_) for _ in model._meta.unique_together],
+            *[tuple(_.fields) for _ in model._meta.total_unique_constraints],
+        ]
+
+    def get_bulk_unique_errors(self, validated_data: list, instances: list = None) -> list:
+        """
+        Returns the per item errors for the unique values repeated in the batch. The serializer
+        validates them only against the db | the batch would fail on the insert/update.
+        """
+
+        model = self.get_queryset().model
+        errors = [{} for _ in validated_data]
+
+        for field_set in self.get_bulk_unique_field_sets(model):
+            indexes_by_value = {}
+            for index, data in enumerate(validated_data):
+                if not any(_ in data for _ in field_set):
+                    continue
+
+                instance = instances[index] if instances else None
+                value = tuple(data[_] if _ in data else getattr(instance, _, None) for _ in field_set)
+                if None not in value:
+                    indexes_by_value.setdefault(value, []).append(index)
+
+            key = field_set[0] if len(field_set) == 1 else api_settings.NON_FIELD_ERRORS_KEY
+            for indexes in indexes_by_value.values():
+                for index in indexes if len(indexes) > 1 else []:
+                    errors[index].setdefault(key, []).append(f"Duplicate {', '.join(field_set)} in the batch.")
+
+        return errors
+
+    def get_bulk_audit_values(self, action) -> dict:
+        """
+        Returns the audit fields (`created_by`, `updated_by`...) of the action, for the whole
+        batch. The values given in the payload are kept, like the `get_audited_data`.
+        """
+
+        return get_audit_field_values(self.get_queryset().model, user=self.get_user(), action=action)
+
+    @staticmethod
+    def split_many_to_many(model, validated_data) -> tuple:
+        """Splits the validated data to the column values & the m2m values."""
+
+        m2m_names = {_.name for _ in model._meta.many_to_many}
+        values = {k: v for k, v in validated_data.items() if k not in m2m_names}
+        return values, {k: v for k, v in validated_data.items() if k in m2m_names}
+
+    def invalidate_bulk_caches(self):
+        """
+        Invalidates the caches of the model after the bulk writes. The `bulk_create` sends
+        no `post_save` | the meta caches & the cached missing rows would be stale.
+        """
+
+        model = self.get_queryset().model
+        invalidate_model_cache(model)
+        invalidate_row_cache(model, using=self.get_queryset().db)
+
+    def send_bulk_error_response(self, errors):
+        """Sends the per item errors, the valid items have an empty dict."""
+
+        return self.send_error_response(data={"errors": errors})
+
+    def perform_bulk_create(self, validated_data: list) -> list:
+        """Creates the rows with the `bulk_create` & their m2m with one insert per relation."""
+
+        model = self.get_queryset().model
+        audit_values = self.get_bulk_audit_values("create")
+
+        instances, m2m_values = [], []
+        for data in validated_data:
+            values, m2m = self.split_many_to_many(model, data)
+            instances.append(model(**{**audit_values, **values}))
+            m2m_values.append(m2m)
+
+        model._default_manager.bulk_create(instances, batch_size=self.bulk_batch_size)
+
+        # through rows of all the instances | one insert per m2m field
+        for field in model._meta.many_to_many:
+            through = field.remote_field.through
+            source, target = field.m2m_field_name(), field.m2m_reverse_field_name()
+            rows = [
+                through(**{f"{source}_id": instance.pk, f"{target}_id": getattr(_, "pk", _)})
+                for instance, m2m in zip(instances, m2m_values)
+                for _ in m2m.get(field.name, [])
+            ]
+            through._default_manager.bulk_create(rows, batch_size=self.bulk_batch_size, ignore_conflicts=True)
+
+        return instances
+
+    def perform_bulk_update(self, instances: list, validated_data: list) -> list:
+        """Updates the rows with the `bulk_update`, only the fields in the payload."""
+
+        model = self.get_queryset().model
+        audit_values = self.get_bulk_audit_values("update")
+        if has_model_field(model, "modified"):
+            audit_values["modified"] = timezone.now()  # no `auto_now` on the `bulk_update`
+
+        fields, m2m_values = set(audit_values.keys()), []
+        for instance, data in zip(instances, validated_data):
+            values, m2m = self.split_many_to_many(model, data)
+            for key, value in {**audit_values, **values}.items():
+                setattr(instance, key, value)
+            fields.update(values.keys())
+            m2m_values.append(m2m)
+
+        model._default_manager.bulk_update(instances, fields=list(fields), batch_size=self.bulk_batch_size)
+
+        # through rows of the instances with the m2m in the payload | one delete & insert per m2m field
+        for field in model._meta.many_to_many:
+            through = field.remote_field.through
+            source, target = field.m2m_field_name(), field.m2m_reverse_field_name()
+            m2m_instances = [(i, m2m[field.name]) for i, m2m in zip(instances, m2m_values) if field.name in m2m]
+            if not m2m_instances:
+                continue
+
+            through._default_manager.filter(**{f"{source}_id__in": [i.pk for i, _ in m2m_instances]}).delete()
+            rows = [
+                through(**{f"{source}_id": instance.pk, f"{target}_id": getattr(_, "pk", _)})
+                for instance, values in m2m_instances
+                for _ in values
+            ]
+            through._default_manager.bulk_create(rows, batch_size=self.bulk_batch_size, ignore_conflicts=True)
+
+        return instances
+
+    @action(
+        methods=["POST"],
+        url_path="bulk",
+        detail=False,
+    )
+    def bulk_create_handler(self, *args, **kwargs):
+        """Creates the list of objects in one transaction. See `AppBulkCUDMixin`."""
+
+        serializer = self.get_serializer(data=self.get_bulk_payload(), many=True)
+        if not serializer.is_valid():
+            return self.send_bulk_error_response(serializer.errors)
+
+        errors = self.get_bulk_unique_errors(serializer.validated_data)
+        if any(errors):
+            return self.send_bulk_error_response(errors)
+
+        with transaction.atomic():
+            instances = self.perform_bulk_create(serializer.validated_data)
+            self.invalidate_bulk_caches()
+
+        return self.send_response(
+            data=[{"id": _.pk, "uuid": getattr(_, "uuid", None)} for _ in instances],
+            status_code=status.HTTP_201_CREATED,
+        )
+
+    @bulk_create_handler.mapping.put
+    def bulk_update_handler(self, *args, **kwargs):
+        """Updates the list of objects (by the `lookup_field`) in one transaction. See `AppBulkCUDMixin`."""
+
+        payload, lookup_field = self.get_bulk_payload(), self.get_bulk_lookup_field()
+        lookups = self.get_bulk_lookups([_.get(lookup_field) if isinstance(_, dict) else None for _ in payload])
+        instances = self.get_bulk_instances(lookups)
+
+        counts = Counter(_ for _ in lookups if _ is not None)
+
+        errors, serializers = [], []
+        for item, lookup in zip(payload, lookups):
+            if lookup not in instances:
+                errors.append({lookup_field: ["Not found."]})
+                continue
+
+            # the same row twice in the `bulk_update`
+            if counts[lookup] > 1:
+                errors.append({lookup_field: [f"Duplicate {lookup_field} in the batch."]})
+                continue
+
+            serializer = self.get_serializer(instance=instances[lookup], data=item, partial=True)
+            errors.append({} if serializer.is_valid() else serializer.errors)
+            serializers.append(serializer)
+
+        if not any(errors):
+            errors = self.get_bulk_unique_errors(
+                [_.validated_data for _ in serializers], [_.instance for _ in serializers]
+            )
+
+        if any(errors):
+            return self.send_bulk_error_response(errors)
+
+        with transaction.atomic():
+            self.perform_bulk_update([_.instance for _ in serializers], [_.validated_data for _ in serializers])
+            self.invalidate_bulk_caches()
+
+        return self.send_response(data={"updated": len(serializers)})
+
+    @bulk_create_handler.mapping.delete
+    def bulk_delete_handler(self, *args, **kwargs):
+        """Soft deletes the list of objects (by the `lookup_field`) in one `UPDATE`. See `AppBulkCUDMixin`."""
+
+        payload, lookup_field = self.get_bulk_payload(), self.get_bulk_lookup_field()
+        lookups = self.get_bulk_lookups(payload)
+        instances = self.get_bulk_instances(lookups)
+
+        errors = [{} if _ in instances else {lookup_field: ["Not found."]} for _ in lookups]
+        if any(errors):
+            return self.send_bulk_error_response(errors)
+
+        with transaction.atomic():
+            count = self.get_queryset().filter(pk__in=[_.pk for _ in instances.values()]).delete(user=self.get_user())
+
+        return self.send_response(data={"deleted": count})
+
+
 class AppModelCUDAPIViewSet(
+    AppBulkCUDMixin,
+    AppMetaCacheMixin,
     AppViewMixin,
     CreateModelMixin,
     UpdateModelMixin,
@@ -156,6 +908,9 @@ class AppModelCUDAPIViewSet(
 
         > DELETE: {endpoint}/<pk>/
             >> Deletes the object identified by the passed `pk`.
+
+        > POST/PUT/DELETE: {endpoint}/bulk/
+            >> Creates, updates & deletes a list of objects, see `AppBulkCUDMixin`.
     """
 
     @action(
@@ -166,7 +921,9 @@ class AppModelCUDAPIViewSet(
     def get_meta_for_create(self, *args, **kwargs):
         """Returns the meta details for create from serializer."""
 
-        return self.send_response(data=self.get_serializer().get_meta_for_create())
+        return self.send_response(
+            data=self.get_cached_meta("create", lambda: self.get_serializer().get_meta_for_create())
+        )
 
     @action(
         methods=["GET"],
@@ -179,6 +936,7 @@ class AppModelCUDAPIViewSet(
 
 
 class AppModelCreateAPIViewSet(
+    AppMetaCacheMixin,
     AppViewMixin,
     CreateModelMixin,
     AppGenericViewSet,
@@ -199,7 +957,9 @@ class AppModelCreateAPIViewSet(
     def get_meta_for_create(self, *args, **kwargs):
         """Returns the meta details for create from serializer."""
 
-        return self.send_response(data=self.get_serializer().get_meta_for_create())
+        return self.send_response(
+            data=self.get_cached_meta("create", lambda: self.get_serializer().get_meta_for_create())
+        )
 
 
 class AbstractLookUpFieldMixin:
@@ -1,32 +1,53 @@
+from functools import lru_cache
+
 from django.core import exceptions
 
-from apps.common.helpers import is_any_or_list1_in_list2
+from apps.common.permissions import get_user_permissions
+
+
+@lru_cache(maxsize=1024)
+def compile_required_permissions(required_permission: tuple) -> frozenset:
+    return frozenset(required_permission)
 
 
 class HasValidPermissionMixin:
     """
     Checks if the user has the below told permission to access the view.
     if not, raises the permission error to the user.
+
+    The user needs any one of the `required_permission`. The permissions of
+    the user are cached, see `get_user_permissions`.
     """
 
     required_permission: str | list[str] = None
 
+    @property
+    def required_permissions(self) -> frozenset:
+        """
+        The `required_permission` as a set. Read from the instance, so the ones given by
+        the `as_view(required_permission=...)` are checked too. Compiled once per value.
+        """
+
+        required_permission = self.required_permission
+        if isinstance(required_permission, str):
+            required_permission = [required_permission]
+
+        return compile_required_permissions(tuple(required_permission or []))
+
+    def get_user_permissions(self, user) -> frozenset:
+        """Returns the effective permissions of the user. Override for a different source."""
+
+        return get_user_permissions(user)
+
     def check_permissions(self, request):
         """Perform the check."""
 
-        # pre-process
-        if type(self.required_permission) == str:
-            self.required_permission = [self.required_permission]
-
         super().check_permissions(request=request)
 
         if (
-            request.user
+            self.required_permissions
+            and request.user
             and request.user.is_authenticated
-            and self.required_permission
-            and not is_any_or_list1_in_list2(
-                list1=self.required_permission,
-                list2=self.get_organisation_user().permissions,
-            )
+            and self.required_permissions.isdisjoint(self.get_user_permissions(request.user))
         ):
             raise exceptions.PermissionDenied()
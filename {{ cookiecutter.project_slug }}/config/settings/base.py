@@ -60,6 +60,7 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + CUSTOM_APPS
 # Middlewares
 # ------------------------------------------------------------------------------
 MIDDLEWARE = [
+    "apps.common.instrumentation.InstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -68,6 +69,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "apps.common.middleware.IdentityMapMiddleware",
 ]
 
 # Urls
@@ -116,8 +118,9 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 DATABASES = {
     # default database user and credentials | others are added on runtime
+    # the engine can be set to `django.db.backends.sqlite3` (`DATABASE_DB` is the file path)
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": env.str("DATABASE_ENGINE", default="django.db.backends.postgresql"),
         "NAME": env.str("DATABASE_DB", default=""),
         "USER": env.str("DATABASE_USER", default=""),
         "PASSWORD": env.str("DATABASE_PASSWORD", default=""),
@@ -152,12 +155,12 @@ AUTH_PASSWORD_VALIDATORS = [
 # ------------------------------------------------------------------------------
 REST_FRAMEWORK = {
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "apps.common.parsers.AppJSONParser",
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "apps.common.renderers.AppJSONRenderer",
         "rest_framework.renderers.BrowsableAPIRenderer",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
@@ -165,7 +168,7 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework.authentication.SessionAuthentication",
-        "rest_framework.authentication.TokenAuthentication",
+        "apps.common.authentication.AppTokenAuthentication",
     ),
 }
 
@@ -186,11 +189,42 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 
+# Cache
+# ------------------------------------------------------------------------------
+# shared redis cache across the workers | locmem (per process), if not configured
+REDIS_CACHE_URL = env.str("REDIS_CACHE_URL", default="")
+if REDIS_CACHE_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": REDIS_CACHE_URL,
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+                "IGNORE_EXCEPTIONS": True,  # a cache outage is a miss, not an error
+            },
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+DJANGO_REDIS_LOG_IGNORED_EXCEPTIONS = True
+
 # App Configurations
 # ------------------------------------------------------------------------------
 APP_DATE_FORMAT = "%Y-%m-%d"
 APP_TIME_FORMAT = "%H:%M:%S"
 APP_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+# generator for `BaseModel.uuid` | "apps.common.helpers.uuid7" for the time ordered ones
+APP_UUID_GENERATOR = "uuid.uuid4"
+# request metrics & Server-Timing | see `apps.common.config.INSTRUMENTATION_CONFIG`
+# sampled & the slow requests are logged, the `Server-Timing` header is sent only on `DEBUG`
+APP_INSTRUMENTATION = {
+    "sample_rate": env.float("APP_INSTRUMENTATION_SAMPLE_RATE", default=0.01),
+    "server_timing": env.bool("APP_INSTRUMENTATION_SERVER_TIMING", default=DEBUG),
+}
 
 # AWS S3 Storage Bucket
 # -------------------------------------------------------------------------------